@@ -0,0 +1,85 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Microbenchmark for defining many TaskData and Entity subclasses.
+
+Defines ``MODELS`` task and entity classes with deferred schema building
+(the default) and with eager building, then builds a few of them, as a
+worker that uses a handful of its models would. Run with:
+
+    uv run python benchmarks/bench_cold_start.py
+"""
+
+import time
+from datetime import datetime
+
+from pydantic import ConfigDict
+
+from moleql_patterns import Entity, TaskData, warmup
+
+MODELS = 300
+USED = 5
+
+
+def define_models(*, defer: bool) -> list[type]:
+    config = ConfigDict(defer_build=defer)
+    models: list[type] = []
+    for index in range(MODELS):
+        task = type(
+            f"Task{index}",
+            (TaskData,),
+            {
+                "__annotations__": {"name": str, "count": int, "tags": list[str]},
+                "model_config": config,
+            },
+        )
+        entity = type(
+            f"Record{index}",
+            (Entity[int],),
+            {
+                "__annotations__": {"title": str, "due": datetime | None, "flags": dict[str, bool]},
+                "model_config": config,
+            },
+        )
+        models += [task, entity]
+    return models
+
+
+def measure(label: str, *, defer: bool) -> None:
+    start = time.perf_counter()
+    models = define_models(defer=defer)
+    defined = time.perf_counter()
+    warmup(*models[:USED])
+    used = time.perf_counter()
+    print(
+        f"{label:<12} define {(defined - start) * 1e3:8.1f} ms"
+        f"   first use of {USED} {(used - defined) * 1e3:6.1f} ms"
+    )
+
+
+def main() -> None:
+    measure("eager", defer=False)
+    measure("deferred", defer=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Memory benchmark for TaskData and Entity hydration.
+
+Builds 100k objects per scenario and prints the tracemalloc peak and the
+peak RSS growth per 100k objects. Each measurement runs in a fresh process,
+because peak RSS only grows and tracemalloc inflates it. With ``--check``,
+exits non-zero when a scenario exceeds its budget. Run with:
+
+    uv run python benchmarks/bench_hydration_memory.py [--check]
+"""
+
+import subprocess
+import sys
+from datetime import UTC, datetime
+from typing import Any
+
+from moleql_patterns import Entity, InMemoryEntityRepository, TaskData
+from moleql_patterns.diagnostics import measure_hydration
+
+COUNT = 100_000
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+# Peak RSS growth budget per 100k objects, in MiB.
+BUDGETS_MIB = {"task_data": 120, "entity": 160, "repository_list": 200}
+
+
+# =========================================================
+# CLASS ORDER DATA
+# =========================================================
+class OrderData(TaskData):
+    order_id: int
+    sku: str
+    quantity: int
+    notes: list[str]
+
+
+# =========================================================
+# CLASS ORDER
+# =========================================================
+class Order(Entity[int]):
+    sku: str
+    quantity: int
+    notes: list[str]
+
+
+def order_payload(index: int) -> dict[str, Any]:
+    return {
+        "correlation_id": f"c-{index}",
+        "order_id": index,
+        "sku": "SKU-1",
+        "quantity": 1,
+        "notes": ["a"],
+    }
+
+
+def order_row(index: int) -> dict[str, Any]:
+    return {
+        "id": index,
+        "sku": "SKU-1",
+        "quantity": 1,
+        "notes": ["a"],
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+def run_scenario(name: str, *, trace: bool) -> None:
+    if name == "task_data":
+        stats = measure_hydration(
+            lambda index: OrderData.from_payload(order_payload(index)), count=COUNT, trace=trace
+        )
+    elif name == "entity":
+        stats = measure_hydration(
+            lambda index: Order.model_validate(order_row(index)), count=COUNT, trace=trace
+        )
+    else:
+        repo = InMemoryEntityRepository[int, Order]()
+        repo.add_many(Order.model_validate(order_row(index)) for index in range(1000))
+        stats = measure_hydration(
+            lambda _: repo.list(), count=COUNT // 1000, objects_per_call=1000, trace=trace
+        )
+    per_100k = stats.traced_peak_per_100k if trace else stats.rss_growth_per_100k
+    print(f"{per_100k / 2**20:.1f}")
+
+
+def measure(name: str, mode: str) -> float:
+    command = [sys.executable, __file__, "--scenario", name, mode]
+    return float(subprocess.run(command, capture_output=True, text=True, check=True).stdout)
+
+
+def main() -> None:
+    if len(sys.argv) == 4 and sys.argv[1] == "--scenario":
+        run_scenario(sys.argv[2], trace=sys.argv[3] == "traced")
+        return
+    check = "--check" in sys.argv
+    failed = False
+    print(f"{'scenario':<18} {'traced MiB/100k':>16} {'RSS MiB/100k':>14} {'budget':>8}")
+    for name, budget in BUDGETS_MIB.items():
+        traced, rss = measure(name, "traced"), measure(name, "rss")
+        failed |= rss > budget
+        print(f"{name:<18} {traced:>16.1f} {rss:>14.1f} {budget:>8}")
+    if check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Microbenchmark for API operation middleware chains.
+
+Compares a plain operation with the same operation wrapped in several
+pass-through middlewares, to check that each middleware costs about one
+function call. Run with:
+
+    uv run python benchmarks/bench_middleware.py
+"""
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+from moleql_patterns import APIOperation
+
+ROUNDS = 5
+NUMBER = 200_000
+MIDDLEWARES = 5
+
+
+def passthrough(call_next: Callable[[Any], Any], operation: Any) -> Any:
+    return call_next(operation)
+
+
+# =========================================================
+# CLASS PING RESULT
+# =========================================================
+class PingResult(BaseModel):
+    ok: bool
+
+
+RESULT = PingResult(ok=True)
+
+
+# =========================================================
+# CLASS PING
+# =========================================================
+class Ping(APIOperation[PingResult]):
+    def verify_access(self) -> None:
+        pass
+
+    def _execute(self) -> PingResult:
+        return RESULT
+
+
+# =========================================================
+# CLASS WRAPPED PING
+# =========================================================
+class WrappedPing(Ping):
+    middlewares = (passthrough,) * MIDDLEWARES
+
+
+def measure(label: str, statement: str) -> float:
+    timings = timeit.repeat(statement, globals=globals(), repeat=ROUNDS, number=NUMBER)
+    per_call_ns = min(timings) / NUMBER * 1e9
+    print(f"{label:<32} {per_call_ns:8.0f} ns/op")
+    return per_call_ns
+
+
+def main() -> None:
+    plain = measure("Ping().execute()", "Ping().execute()")
+    wrapped = measure(f"{MIDDLEWARES} middlewares", "WrappedPing().execute()")
+    print(f"{'Cost per middleware':<32} {(wrapped - plain) / MIDDLEWARES:8.0f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
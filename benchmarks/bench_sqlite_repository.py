@@ -0,0 +1,93 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Microbenchmark for the SQLite entity repository.
+
+Compares one-at-a-time writes with the bulk ``executemany`` paths, and full
+row updates with partial updates of changed fields. Run with:
+
+    uv run python benchmarks/bench_sqlite_repository.py
+"""
+
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from moleql_patterns import Entity, SQLiteEntityRepository
+
+ENTITIES = 5_000
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+# =========================================================
+# CLASS PROFILE
+# =========================================================
+class Profile(Entity[int]):
+    name: str
+    bio: str
+    tags: list[str]
+    visits: int = 0
+
+
+def make_profiles(offset: int) -> list[Profile]:
+    return [
+        Profile(
+            id=offset + i,
+            name=f"user-{i}",
+            bio="x" * 500,
+            tags=["a", "b", "c"],
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for i in range(ENTITIES)
+    ]
+
+
+def measure(label: str, func: object) -> None:
+    start = time.perf_counter()
+    func()  # type: ignore[operator]
+    per_entity_us = (time.perf_counter() - start) / ENTITIES * 1e6
+    print(f"{label:<32} {per_entity_us:8.1f} us/entity")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        repo = SQLiteEntityRepository[int, Profile](Profile, Path(directory) / "bench.db")
+        single = make_profiles(0)
+        bulk = make_profiles(ENTITIES)
+        measure("add() in a loop", lambda: [repo.add(profile) for profile in single])
+        measure("add_many()", lambda: repo.add_many(bulk))
+        measure("get() in a loop", lambda: [repo.get(profile.id) for profile in bulk])
+        measure("get_many()", lambda: repo.get_many(profile.id for profile in bulk))
+
+        for profile in bulk:
+            profile.name = profile.name.upper()
+        measure("update_many(), one field", lambda: repo.update_many(bulk))
+        for profile in bulk:
+            profile.name, profile.bio, profile.tags = "x", "y" * 500, ["d"]
+        measure("update_many(), three fields", lambda: repo.update_many(bulk))
+        repo.close()
+
+
+if __name__ == "__main__":
+    main()
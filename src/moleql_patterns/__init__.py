@@ -20,19 +20,67 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from .commands import (
-    AccessDeniedError,
-    APIOperation,
-    AsyncAPIOperation,
-    AsyncTask,
-    Task,
-    TaskBase,
-    TaskData,
-    TaskDataDeserializationError,
-    TaskDeserializationError,
-    TaskSerializationError,
-)
-from .structural import Entity, EntityRepository
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ._warmup import warmup
+    from .commands import (
+        AccessDeniedError,
+        AccessPolicyMixin,
+        AllOf,
+        AnyOf,
+        APIOperation,
+        AsyncAPIOperation,
+        AsyncTask,
+        Blob,
+        CircuitBreaker,
+        CircuitOpenError,
+        ClaimCheckTaskData,
+        ExecutionPolicy,
+        FrozenTaskData,
+        Not,
+        PayloadCompression,
+        Permission,
+        Policy,
+        Predicate,
+        Projection,
+        RateLimit,
+        RateLimiter,
+        RateLimitExceededError,
+        RetryPolicy,
+        SlidingWindowLimiter,
+        Task,
+        TaskBase,
+        TaskData,
+        TaskDataDeserializationError,
+        TaskDeserializationError,
+        TaskSerializationError,
+        TaskTimeoutError,
+        TokenBucketLimiter,
+        VersionedTaskData,
+        permission_scope,
+        register_async_middleware,
+        register_middleware,
+    )
+    from .structural import (
+        ConcurrencyConflictError,
+        ConsistentHashPartitioner,
+        Entity,
+        EntityRepository,
+        InMemoryEntityRepository,
+        Partitioner,
+        RangePartitioner,
+        Replica,
+        ReplicatedEntityRepository,
+        ShardedEntityRepository,
+        SQLiteEntityRepository,
+        SQLiteQuery,
+        VersionedEntity,
+        read_your_writes,
+        retry_on_conflict,
+    )
 
 __all__ = [
     "APIOperation",
@@ -43,10 +91,112 @@ __all__ = [
     "AsyncTask",
     "TaskDataDeserializationError",
     "TaskData",
+    "FrozenTaskData",
     "TaskSerializationError",
     "TaskDeserializationError",
+    "ExecutionPolicy",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "TaskTimeoutError",
+    "RateLimit",
+    "RateLimiter",
+    "RateLimitExceededError",
+    "TokenBucketLimiter",
+    "SlidingWindowLimiter",
+    "VersionedTaskData",
+    "ClaimCheckTaskData",
+    "Blob",
+    "PayloadCompression",
+    "AccessPolicyMixin",
+    "Policy",
+    "Permission",
+    "Predicate",
+    "AllOf",
+    "AnyOf",
+    "Not",
+    "permission_scope",
+    "register_middleware",
+    "register_async_middleware",
+    "Projection",
     "Entity",
     "EntityRepository",
+    "VersionedEntity",
+    "ConcurrencyConflictError",
+    "InMemoryEntityRepository",
+    "SQLiteEntityRepository",
+    "SQLiteQuery",
+    "ShardedEntityRepository",
+    "Partitioner",
+    "ConsistentHashPartitioner",
+    "RangePartitioner",
+    "ReplicatedEntityRepository",
+    "Replica",
+    "read_your_writes",
+    "retry_on_conflict",
+    "warmup",
     "__version__",
 ]
 __version__ = "1.0.0"
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".commands": (
+            "AccessDeniedError",
+            "AccessPolicyMixin",
+            "AllOf",
+            "AnyOf",
+            "APIOperation",
+            "AsyncAPIOperation",
+            "AsyncTask",
+            "Blob",
+            "CircuitBreaker",
+            "CircuitOpenError",
+            "ClaimCheckTaskData",
+            "ExecutionPolicy",
+            "FrozenTaskData",
+            "Not",
+            "PayloadCompression",
+            "Permission",
+            "Policy",
+            "Predicate",
+            "Projection",
+            "RateLimit",
+            "RateLimiter",
+            "RateLimitExceededError",
+            "RetryPolicy",
+            "SlidingWindowLimiter",
+            "Task",
+            "TaskBase",
+            "TaskData",
+            "TaskDataDeserializationError",
+            "TaskDeserializationError",
+            "TaskSerializationError",
+            "TaskTimeoutError",
+            "TokenBucketLimiter",
+            "VersionedTaskData",
+            "permission_scope",
+            "register_async_middleware",
+            "register_middleware",
+        ),
+        ".structural": (
+            "ConcurrencyConflictError",
+            "ConsistentHashPartitioner",
+            "Entity",
+            "EntityRepository",
+            "InMemoryEntityRepository",
+            "Partitioner",
+            "RangePartitioner",
+            "Replica",
+            "ReplicatedEntityRepository",
+            "ShardedEntityRepository",
+            "SQLiteEntityRepository",
+            "SQLiteQuery",
+            "VersionedEntity",
+            "read_your_writes",
+            "retry_on_conflict",
+        ),
+        "._warmup": ("warmup",),
+    },
+)
@@ -0,0 +1,72 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Lazy attribute exports for package namespaces.
+
+Package ``__init__`` modules list which submodule defines each public name,
+and the submodule is imported on first attribute access. Importing the
+package itself stays cheap: pydantic and every model schema load only when
+a name that needs them is used.
+
+Design notes:
+- Resolved names are stored in the package globals, so ``__getattr__`` runs
+  once per name.
+- ``from package import Name`` goes through ``__getattr__`` too.
+- Packages keep their real imports under ``TYPE_CHECKING`` for type checkers
+  and IDEs.
+
+Usage:
+    __getattr__, __dir__ = lazy_exports(__name__, {".task": ("Task", "AsyncTask")})
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+__all__ = ["lazy_exports"]
+
+
+def lazy_exports(
+    module_name: str, exports: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return ``__getattr__`` and ``__dir__`` for the module ``module_name``.
+
+    ``exports`` maps a submodule name relative to the module's package (e.g.
+    ``".task"``) to the names it provides.
+    """
+    anchor = sys.modules[module_name].__package__
+    origins = {name: source for source, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        try:
+            source = origins[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(source, anchor), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[module_name]), *origins})
+
+    return __getattr__, __dir__
@@ -0,0 +1,75 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Build deferred pydantic schemas ahead of time.
+
+``TaskData`` and ``Entity`` subclasses set ``defer_build``, so pydantic
+builds each model's validator and serializer the first time it is used
+rather than when the class is defined. A worker that imports hundreds of
+models pays only for the ones it touches. ``warmup`` builds selected
+models up front, e.g., at service startup, so the first request does not
+pay for it.
+
+Design notes:
+- Models that are already built are skipped, so calling ``warmup`` twice is
+  cheap.
+- ``subclasses=True`` also builds every subclass currently defined, which
+  makes ``warmup(TaskData, subclasses=True)`` a one-line "build everything".
+- Unparametrized generic models (e.g., ``Entity`` itself) are skipped.
+
+Usage:
+    from moleql_patterns import TaskData, warmup
+
+    warmup(SendEmailData, ResizeImageData)
+    warmup(TaskData, subclasses=True)
+"""
+
+from collections.abc import Iterator
+
+from pydantic import BaseModel
+
+__all__ = ["warmup"]
+
+
+def _with_subclasses(model: type[BaseModel]) -> Iterator[type[BaseModel]]:
+    yield model
+    for subclass in model.__subclasses__():
+        yield from _with_subclasses(subclass)
+
+
+def warmup(*models: type[BaseModel], subclasses: bool = False) -> int:
+    """Build the schemas of ``models`` that are still deferred.
+
+    Returns the number of models built.
+    """
+    seen: set[type[BaseModel]] = set()
+    built = 0
+    for model in models:
+        for candidate in _with_subclasses(model) if subclasses else (model,):
+            if candidate in seen or candidate.__pydantic_complete__:
+                continue
+            seen.add(candidate)
+            if candidate.__pydantic_generic_metadata__["parameters"]:
+                continue
+            candidate.model_rebuild()
+            built += 1
+    return built
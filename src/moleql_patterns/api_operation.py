@@ -22,6 +22,22 @@
 
 """Backward-compatible re-exports for API operation commands."""
 
-from .commands.api_operation import AccessDeniedError, APIOperation, AsyncAPIOperation
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .commands.api_operation import AccessDeniedError, APIOperation, AsyncAPIOperation
 
 __all__ = ["APIOperation", "AsyncAPIOperation", "AccessDeniedError"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".commands.api_operation": (
+            "AccessDeniedError",
+            "APIOperation",
+            "AsyncAPIOperation",
+        ),
+    },
+)
@@ -20,9 +20,67 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from .api_operation import AccessDeniedError, APIOperation, AsyncAPIOperation
-from .task import AsyncTask, Task, TaskBase, TaskDataDeserializationError
-from .task_data import TaskData, TaskDeserializationError, TaskSerializationError
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .access_policy import (
+        AccessPolicyMixin,
+        AllOf,
+        AnyOf,
+        Not,
+        Permission,
+        Policy,
+        Predicate,
+        permission_scope,
+    )
+    from .api_operation import AccessDeniedError, APIOperation, AsyncAPIOperation
+    from .async_bridge import shutdown_bridges
+    from .claim_check import (
+        Blob,
+        BlobNotFoundError,
+        BlobStore,
+        ClaimCheckTaskData,
+        FileSystemBlobStore,
+        InMemoryBlobStore,
+    )
+    from .compression import PayloadCompression, available_codecs
+    from .execution_policy import (
+        CircuitBreaker,
+        CircuitOpenError,
+        ExecutionPolicy,
+        RetryPolicy,
+        TaskTimeoutError,
+    )
+    from .middleware import (
+        AsyncMiddleware,
+        Middleware,
+        clear_middlewares,
+        compose_middlewares,
+        register_async_middleware,
+        register_middleware,
+        unregister_middleware,
+    )
+    from .rate_limit import (
+        RateLimit,
+        RateLimiter,
+        RateLimitExceededError,
+        SlidingWindowLimiter,
+        TokenBucketLimiter,
+    )
+    from .serialization import Projection
+    from .task import AsyncTask, Task, TaskBase, TaskDataDeserializationError
+    from .task_data import (
+        FrozenTaskData,
+        TaskData,
+        TaskDeserializationError,
+        TaskSerializationError,
+        decode_payload,
+        encode_payload,
+        payload_digest,
+    )
+    from .versioned_task_data import SCHEMA_VERSION_KEY, Migration, VersionedTaskData
 
 __all__ = [
     "APIOperation",
@@ -33,6 +91,126 @@ __all__ = [
     "AsyncTask",
     "TaskDataDeserializationError",
     "TaskData",
+    "FrozenTaskData",
     "TaskSerializationError",
     "TaskDeserializationError",
+    "ExecutionPolicy",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "TaskTimeoutError",
+    "RateLimit",
+    "RateLimiter",
+    "RateLimitExceededError",
+    "TokenBucketLimiter",
+    "SlidingWindowLimiter",
+    "payload_digest",
+    "encode_payload",
+    "decode_payload",
+    "VersionedTaskData",
+    "Migration",
+    "SCHEMA_VERSION_KEY",
+    "Blob",
+    "BlobNotFoundError",
+    "BlobStore",
+    "ClaimCheckTaskData",
+    "FileSystemBlobStore",
+    "InMemoryBlobStore",
+    "PayloadCompression",
+    "available_codecs",
+    "AccessPolicyMixin",
+    "Policy",
+    "Permission",
+    "Predicate",
+    "AllOf",
+    "AnyOf",
+    "Not",
+    "permission_scope",
+    "Middleware",
+    "AsyncMiddleware",
+    "register_middleware",
+    "register_async_middleware",
+    "unregister_middleware",
+    "clear_middlewares",
+    "compose_middlewares",
+    "Projection",
+    "shutdown_bridges",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".access_policy": (
+            "AccessPolicyMixin",
+            "AllOf",
+            "AnyOf",
+            "Not",
+            "Permission",
+            "Policy",
+            "Predicate",
+            "permission_scope",
+        ),
+        ".api_operation": (
+            "AccessDeniedError",
+            "APIOperation",
+            "AsyncAPIOperation",
+        ),
+        ".async_bridge": ("shutdown_bridges",),
+        ".claim_check": (
+            "Blob",
+            "BlobNotFoundError",
+            "BlobStore",
+            "ClaimCheckTaskData",
+            "FileSystemBlobStore",
+            "InMemoryBlobStore",
+        ),
+        ".compression": (
+            "PayloadCompression",
+            "available_codecs",
+        ),
+        ".execution_policy": (
+            "CircuitBreaker",
+            "CircuitOpenError",
+            "ExecutionPolicy",
+            "RetryPolicy",
+            "TaskTimeoutError",
+        ),
+        ".middleware": (
+            "AsyncMiddleware",
+            "Middleware",
+            "clear_middlewares",
+            "compose_middlewares",
+            "register_async_middleware",
+            "register_middleware",
+            "unregister_middleware",
+        ),
+        ".rate_limit": (
+            "RateLimit",
+            "RateLimiter",
+            "RateLimitExceededError",
+            "SlidingWindowLimiter",
+            "TokenBucketLimiter",
+        ),
+        ".serialization": ("Projection",),
+        ".task": (
+            "AsyncTask",
+            "Task",
+            "TaskBase",
+            "TaskDataDeserializationError",
+        ),
+        ".task_data": (
+            "FrozenTaskData",
+            "TaskData",
+            "TaskDeserializationError",
+            "TaskSerializationError",
+            "decode_payload",
+            "encode_payload",
+            "payload_digest",
+        ),
+        ".versioned_task_data": (
+            "SCHEMA_VERSION_KEY",
+            "Migration",
+            "VersionedTaskData",
+        ),
+    },
+)
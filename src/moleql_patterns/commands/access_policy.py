@@ -0,0 +1,312 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Declarative access policies for API operations.
+
+Operations that use ``AccessPolicyMixin`` declare an ``access_policy`` built
+from ``Permission`` and ``Predicate`` nodes combined with ``&``, ``|``, and
+``~``. The policy is compiled once per class, and ``verify_access`` evaluates
+it against the principal's permission set.
+
+Design notes:
+- Compilation flattens nested ``AllOf``/``AnyOf`` nodes and turns plain
+  permission checks into one ``frozenset`` subset or intersection test.
+- ``load_permissions`` is the (often expensive) lookup. Inside a
+  ``permission_scope()`` its result is cached per principal, so several
+  operations in one request share a single lookup. Outside a scope it runs
+  on every check.
+- Policies that only use predicates never load permissions.
+- Classes without an ``access_policy`` deny every call.
+
+Usage:
+    class ApproveInvoice(AccessPolicyMixin, APIOperation[Invoice]):
+        access_policy = Permission("invoices:approve") & ~Predicate(
+            lambda operation: operation.invoice.owner_id == operation.user.id
+        )
+
+        def principal_id(self) -> str:
+            return self.user.id
+
+        def load_permissions(self) -> Iterable[str]:
+            return self._roles.permissions_for(self.user.id)
+
+    with permission_scope():
+        ApproveInvoice(invoice, user, roles).execute()
+"""
+
+import contextlib
+import contextvars
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Any, ClassVar
+
+from .api_operation import AccessDeniedError
+
+__all__ = [
+    "AccessPolicyMixin",
+    "AllOf",
+    "AnyOf",
+    "Not",
+    "Permission",
+    "Policy",
+    "Predicate",
+    "permission_scope",
+]
+
+type Evaluator = Callable[[Any, frozenset[str]], bool]
+
+_permission_cache: contextvars.ContextVar[dict[Hashable, frozenset[str]] | None] = (
+    contextvars.ContextVar("moleql_permission_cache", default=None)
+)
+
+
+@contextlib.contextmanager
+def permission_scope() -> Iterator[None]:
+    """Cache resolved permission sets per principal until the block exits.
+
+    Open one scope per request, e.g., in web framework middleware.
+    """
+    token = _permission_cache.set({})
+    try:
+        yield
+    finally:
+        _permission_cache.reset(token)
+
+
+# =========================================================
+# CLASS POLICY
+# =========================================================
+class Policy(ABC):
+    """Base class for access policy expressions."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def compile(self) -> Evaluator:
+        """Return a function of ``(operation, permissions)`` that evaluates the policy."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def permission_names(self) -> frozenset[str]:
+        """Return every permission this policy refers to."""
+        raise NotImplementedError
+
+    def __and__(self, other: "Policy") -> "AllOf":
+        return AllOf(self, other)
+
+    def __or__(self, other: "Policy") -> "AnyOf":
+        return AnyOf(self, other)
+
+    def __invert__(self) -> "Not":
+        return Not(self)
+
+
+# =========================================================
+# CLASS PERMISSION
+# =========================================================
+class Permission(Policy):
+    """Requires the principal to hold ``name``."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def compile(self) -> Evaluator:
+        name = self.name
+        return lambda operation, permissions: name in permissions
+
+    def permission_names(self) -> frozenset[str]:
+        return frozenset((self.name,))
+
+    def __repr__(self) -> str:
+        return f"Permission({self.name!r})"
+
+
+# =========================================================
+# CLASS PREDICATE
+# =========================================================
+class Predicate(Policy):
+    """Calls ``func(operation)``; grants access when it returns a truthy value."""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[Any], bool]) -> None:
+        self.func = func
+
+    def compile(self) -> Evaluator:
+        func = self.func
+        return lambda operation, permissions: bool(func(operation))
+
+    def permission_names(self) -> frozenset[str]:
+        return frozenset()
+
+    def __repr__(self) -> str:
+        return f"Predicate({getattr(self.func, '__qualname__', self.func)!r})"
+
+
+# =========================================================
+# CLASS NOT
+# =========================================================
+class Not(Policy):
+    """Grants access when ``policy`` denies it."""
+
+    __slots__ = ("policy",)
+
+    def __init__(self, policy: Policy) -> None:
+        self.policy = policy
+
+    def compile(self) -> Evaluator:
+        inner = self.policy.compile()
+        return lambda operation, permissions: not inner(operation, permissions)
+
+    def permission_names(self) -> frozenset[str]:
+        return self.policy.permission_names()
+
+    def __repr__(self) -> str:
+        return f"Not({self.policy!r})"
+
+
+# =========================================================
+# CLASS COMPOSITE POLICY
+# =========================================================
+class _CompositePolicy(Policy):
+    __slots__ = ("policies",)
+
+    def __init__(self, *policies: Policy) -> None:
+        if not policies:
+            raise ValueError(f"{type(self).__name__} needs at least one policy.")
+        flattened: list[Policy] = []
+        for policy in policies:
+            if type(policy) is type(self):
+                flattened.extend(policy.policies)  # type: ignore[attr-defined]
+            else:
+                flattened.append(policy)
+        self.policies = tuple(flattened)
+
+    def _split(self) -> tuple[frozenset[str], list[Evaluator]]:
+        names = frozenset(policy.name for policy in self.policies if isinstance(policy, Permission))
+        others = [
+            policy.compile() for policy in self.policies if not isinstance(policy, Permission)
+        ]
+        return names, others
+
+    def permission_names(self) -> frozenset[str]:
+        return frozenset().union(*(policy.permission_names() for policy in self.policies))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self.policies))})"
+
+
+# =========================================================
+# CLASS ALL OF
+# =========================================================
+class AllOf(_CompositePolicy):
+    """Grants access when every policy does."""
+
+    __slots__ = ()
+
+    def compile(self) -> Evaluator:
+        required, others = self._split()
+        if not others:
+            return lambda operation, permissions: required <= permissions
+
+        def evaluate(operation: Any, permissions: frozenset[str]) -> bool:
+            if not required <= permissions:
+                return False
+            return all(check(operation, permissions) for check in others)
+
+        return evaluate
+
+
+# =========================================================
+# CLASS ANY OF
+# =========================================================
+class AnyOf(_CompositePolicy):
+    """Grants access when at least one policy does."""
+
+    __slots__ = ()
+
+    def compile(self) -> Evaluator:
+        accepted, others = self._split()
+        if not others:
+            return lambda operation, permissions: not accepted.isdisjoint(permissions)
+
+        def evaluate(operation: Any, permissions: frozenset[str]) -> bool:
+            if not accepted.isdisjoint(permissions):
+                return True
+            return any(check(operation, permissions) for check in others)
+
+        return evaluate
+
+
+# =========================================================
+# CLASS ACCESS POLICY MIXIN
+# =========================================================
+class AccessPolicyMixin(ABC):
+    """Implements ``verify_access`` for operations from a declared ``access_policy``.
+
+    List it before ``APIOperation``/``AsyncAPIOperation`` in the bases.
+    Subclasses implement ``principal_id`` and ``load_permissions``.
+    """
+
+    access_policy: ClassVar[Policy | None] = None
+
+    _access_evaluator: ClassVar[Evaluator | None] = None
+    _loads_permissions: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        policy = cls.access_policy
+        cls._access_evaluator = None if policy is None else staticmethod(policy.compile())  # type: ignore[assignment]
+        cls._loads_permissions = policy is not None and bool(policy.permission_names())
+
+    @abstractmethod
+    def principal_id(self) -> Hashable:
+        """Return a key that identifies the current principal."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_permissions(self) -> Iterable[str]:
+        """Return the permissions held by the current principal."""
+        raise NotImplementedError
+
+    def resolve_permissions(self) -> frozenset[str]:
+        """Return the principal's permissions, cached within a ``permission_scope``."""
+        cache = _permission_cache.get()
+        if cache is None:
+            return frozenset(self.load_permissions())
+        key = self.principal_id()
+        try:
+            return cache[key]
+        except KeyError:
+            permissions = cache[key] = frozenset(self.load_permissions())
+            return permissions
+
+    def verify_access(self) -> None:
+        """Raise ``AccessDeniedError`` unless the class policy grants access."""
+        evaluator = self._access_evaluator
+        if evaluator is None:
+            raise AccessDeniedError(f"{type(self).__qualname__} declares no access policy.")
+        permissions = self.resolve_permissions() if self._loads_permissions else frozenset()
+        if not evaluator(self, permissions):
+            raise AccessDeniedError(f"Access to {type(self).__qualname__} denied.")
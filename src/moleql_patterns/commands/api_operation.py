@@ -26,6 +26,11 @@ Design goals:
 - Dependencies are injected via the concrete class constructor.
 - Logic is unit-testable without running an HTTP server.
 - Access checks are explicit and mandatory for every operation.
+- Rate limits are declared per class and applied after access checks.
+- Middlewares wrap execution after access checks (see ``middleware.py``).
+- ``execute_json`` returns the result as JSON bytes for HTTP responses.
+- ``execute_in_executor`` and ``execute_sync`` cross between sync and async
+  code (see ``async_bridge.py``).
 
 Usage:
     class CreateUser(APIOperation[User]):
@@ -53,10 +58,18 @@ Usage:
             return await self._repo.create_user(...)
 """
 
+import concurrent.futures
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
+from . import async_bridge
+from .middleware import AsyncMiddleware, Middleware, middleware_chain
+from .rate_limit import RateLimit
+from .serialization import Projection, dump_json
+
 __all__ = ["APIOperation", "AsyncAPIOperation", "AccessDeniedError"]
 
 
@@ -78,8 +91,16 @@ class APIOperation[ResultT: BaseModel](ABC):
     - Implement ``verify_access`` to enforce authorization.
     - Implement ``_execute`` with the operation logic.
     - Return a Pydantic ``BaseModel`` from ``execute``.
+    - Optionally declare a ``rate_limit`` and override ``rate_limit_key``.
+    - Optionally declare ``middlewares`` to wrap execution.
+    - Optionally cap ``executor_concurrency`` for ``execute_in_executor``.
     """
 
+    rate_limit: ClassVar[RateLimit | None] = None
+    middlewares: ClassVar[Sequence[Middleware]] = ()
+    json_projection: ClassVar[Projection | None] = None
+    executor_concurrency: ClassVar[int | None] = None
+
     @abstractmethod
     def verify_access(self) -> None:
         """Validate permissions for this operation.
@@ -89,6 +110,11 @@ class APIOperation[ResultT: BaseModel](ABC):
         """
         raise NotImplementedError
 
+    def rate_limit_key(self) -> str:
+        """Return the key the class ``rate_limit`` applies to (defaults to the class)."""
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}"
+
     @abstractmethod
     def _execute(self) -> ResultT:
         """Execute the operation logic synchronously."""
@@ -97,7 +123,23 @@ class APIOperation[ResultT: BaseModel](ABC):
     def execute(self) -> ResultT:
         """Execute synchronously with access checks."""
         self.verify_access()
-        return self._execute()
+        return middleware_chain(type(self), _run_operation, is_async=False)(self)
+
+    def execute_json(self, projection: Projection | None = None) -> bytes:
+        """Execute and return the result as JSON bytes.
+
+        ``projection`` defaults to the class ``json_projection``.
+        """
+        return dump_json(self.execute(), projection or self.json_projection)
+
+    async def execute_in_executor(
+        self, *, executor: concurrent.futures.Executor | None = None
+    ) -> ResultT:
+        """Execute in a thread pool so async callers do not block their loop.
+
+        At most ``executor_concurrency`` instances of the class run at once.
+        """
+        return await async_bridge.execute_in_executor(self, executor=executor)
 
 
 # =========================================================
@@ -111,8 +153,14 @@ class AsyncAPIOperation[ResultT: BaseModel](ABC):
     - Implement ``verify_access`` to enforce authorization.
     - Implement ``_execute_async`` with the operation logic.
     - Return a Pydantic ``BaseModel`` from ``execute_async``.
+    - Optionally declare a ``rate_limit`` and override ``rate_limit_key``.
+    - Optionally declare async ``middlewares`` to wrap execution.
     """
 
+    rate_limit: ClassVar[RateLimit | None] = None
+    middlewares: ClassVar[Sequence[AsyncMiddleware]] = ()
+    json_projection: ClassVar[Projection | None] = None
+
     @abstractmethod
     def verify_access(self) -> None:
         """Validate permissions for this operation.
@@ -122,6 +170,11 @@ class AsyncAPIOperation[ResultT: BaseModel](ABC):
         """
         raise NotImplementedError
 
+    def rate_limit_key(self) -> str:
+        """Return the key the class ``rate_limit`` applies to (defaults to the class)."""
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}"
+
     @abstractmethod
     async def _execute_async(self) -> ResultT:
         """Execute the operation logic asynchronously."""
@@ -130,4 +183,27 @@ class AsyncAPIOperation[ResultT: BaseModel](ABC):
     async def execute_async(self) -> ResultT:
         """Execute asynchronously with access checks."""
         self.verify_access()
-        return await self._execute_async()
+        return await middleware_chain(type(self), _run_operation_async, is_async=True)(self)
+
+    async def execute_async_json(self, projection: Projection | None = None) -> bytes:
+        """Execute asynchronously and return the result as JSON bytes.
+
+        ``projection`` defaults to the class ``json_projection``.
+        """
+        return dump_json(await self.execute_async(), projection or self.json_projection)
+
+    def execute_sync(self, *, timeout: float | None = None) -> ResultT:
+        """Execute from synchronous code on a shared background event loop."""
+        return async_bridge.execute_sync(self, timeout=timeout)
+
+
+def _run_operation(operation: APIOperation[Any]) -> Any:
+    if operation.rate_limit is not None:
+        operation.rate_limit.acquire(operation.rate_limit_key())
+    return operation._execute()
+
+
+async def _run_operation_async(operation: AsyncAPIOperation[Any]) -> Any:
+    if operation.rate_limit is not None:
+        await operation.rate_limit.acquire_async(operation.rate_limit_key())
+    return await operation._execute_async()
@@ -0,0 +1,176 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Bridges between synchronous and asynchronous API operations.
+
+``execute_in_executor`` runs a synchronous ``APIOperation`` from async code in
+a bounded thread pool so it does not block the event loop. ``execute_sync``
+runs an ``AsyncAPIOperation`` from synchronous code on one shared background
+event loop instead of starting a new loop per call.
+
+Design notes:
+- Both bridges copy the caller's ``contextvars`` into the call, so request
+  scoped values (e.g., ``permission_scope`` caches, trace ids) carry over.
+- ``executor_concurrency`` on an operation class caps how many instances run in
+  the pool at once. Callers over the cap wait on the event loop, not in a
+  worker thread.
+- Cancelling the awaiting task cancels the call if it has not started. A
+  call that already runs in a thread finishes, and its concurrency slot is
+  released when it does.
+- ``execute_sync`` must not be called from the background loop itself; that
+  would deadlock, so it raises ``RuntimeError``.
+
+Usage:
+    user = await GetUser(repo, user_id).execute_in_executor()
+    report = BuildReport(client).execute_sync(timeout=30.0)
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import contextvars
+import os
+import threading
+import weakref
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api_operation import APIOperation, AsyncAPIOperation
+
+__all__ = ["execute_in_executor", "execute_sync", "shutdown_bridges"]
+
+_lock = threading.Lock()
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[type, asyncio.Semaphore]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _default_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="moleql-operation",
+            )
+        return _executor
+
+
+def _class_semaphore(loop: asyncio.AbstractEventLoop, cls: type) -> asyncio.Semaphore | None:
+    limit = cls.executor_concurrency  # type: ignore[attr-defined]
+    if limit is None:
+        return None
+    per_loop = _semaphores.setdefault(loop, {})
+    semaphore = per_loop.get(cls)
+    if semaphore is None:
+        semaphore = per_loop[cls] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+def _release_from_thread(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+    # A closed loop raises RuntimeError; nobody is waiting on the semaphore then.
+    with contextlib.suppress(RuntimeError):
+        loop.call_soon_threadsafe(semaphore.release)
+
+
+async def execute_in_executor[ResultT](
+    operation: "APIOperation[Any]",
+    *,
+    executor: concurrent.futures.Executor | None = None,
+) -> ResultT:
+    """Run ``operation.execute()`` in a thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    semaphore = _class_semaphore(loop, type(operation))
+    if semaphore is not None:
+        await semaphore.acquire()
+    context = contextvars.copy_context()
+    try:
+        future = (executor or _default_executor()).submit(context.run, operation.execute)
+    except BaseException:
+        if semaphore is not None:
+            semaphore.release()
+        raise
+    if semaphore is not None:
+        future.add_done_callback(lambda _: _release_from_thread(loop, semaphore))
+    return await asyncio.wrap_future(future, loop=loop)
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _loop_thread
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="moleql-background-loop", daemon=True
+            )
+            thread.start()
+            _loop, _loop_thread = loop, thread
+        return _loop
+
+
+async def _with_context[T](context: contextvars.Context, coroutine: Coroutine[Any, Any, T]) -> T:
+    for variable, value in context.items():
+        variable.set(value)
+    return await coroutine
+
+
+def execute_sync[ResultT](
+    operation: "AsyncAPIOperation[Any]", *, timeout: float | None = None
+) -> ResultT:
+    """Run ``operation.execute_async()`` on the shared background loop and wait.
+
+    Raises ``TimeoutError`` after ``timeout`` seconds and cancels the call.
+    """
+    if threading.current_thread() is _loop_thread:
+        raise RuntimeError("execute_sync cannot be called from the background loop.")
+    coroutine = _with_context(contextvars.copy_context(), operation.execute_async())
+    future = asyncio.run_coroutine_threadsafe(coroutine, _background_loop())
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def shutdown_bridges() -> None:
+    """Stop the background loop and the default thread pool.
+
+    They are created again on the next call. Registered with ``atexit``.
+    """
+    global _executor, _loop, _loop_thread
+    with _lock:
+        executor, loop, thread = _executor, _loop, _loop_thread
+        _executor = _loop = _loop_thread = None
+    if executor is not None:
+        executor.shutdown(wait=True)
+    if loop is not None and thread is not None:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+atexit.register(shutdown_bridges)
@@ -0,0 +1,355 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Claim-check offloading for large task payload fields.
+
+Fields typed as ``Blob`` on a ``ClaimCheckTaskData`` subclass are written to a
+``BlobStore`` by ``to_payload`` when they reach ``offload_threshold`` bytes.
+The payload then carries a small reference instead of the data. After
+``from_payload`` the field holds a lazy ``Blob`` that reads the store on first
+access.
+
+Design notes:
+- Blobs are content addressed by their SHA-256 digest, so the same data is
+  stored once and a reference that is sent again is not rewritten.
+- ``FileSystemBlobStore`` writes atomically (temporary file plus rename) and
+  memory-maps files on read, so large blobs are not copied into memory.
+- Classes without ``Blob`` fields, and values below the threshold, use the
+  regular ``TaskData`` serialization path.
+- Stores do not expire blobs. Delete them once the task is done, or clean the
+  store up out of band.
+
+Usage:
+    class RenderReportData(ClaimCheckTaskData):
+        blob_store = FileSystemBlobStore("/var/lib/app/blobs")
+        template: str
+        dataset: Blob
+
+    payload = RenderReportData(correlation_id=cid, template="q3", dataset=raw).to_payload()
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+import types
+from abc import ABC, abstractmethod
+from os import PathLike
+from pathlib import Path
+from typing import Any, ClassVar, Self, Union, get_args, get_origin
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from .task_data import TaskData, TaskDeserializationError, TaskSerializationError
+
+__all__ = [
+    "Blob",
+    "BlobNotFoundError",
+    "BlobStore",
+    "ClaimCheckTaskData",
+    "FileSystemBlobStore",
+    "InMemoryBlobStore",
+]
+
+BLOB_REFERENCE_KEY = "$blob"
+
+
+def blob_key(data: bytes | memoryview) -> str:
+    """Return the content address (SHA-256 hex digest) of ``data``."""
+    return hashlib.sha256(data).hexdigest()
+
+
+# =========================================================
+# CLASS BLOB NOT FOUND ERROR
+# =========================================================
+class BlobNotFoundError(LookupError):
+    """Raised when a blob reference points to data that is not in the store."""
+
+
+# =========================================================
+# CLASS BLOB STORE
+# =========================================================
+class BlobStore(ABC):
+    """Backend contract for content-addressed blob storage."""
+
+    @abstractmethod
+    def put(self, data: bytes | memoryview) -> str:
+        """Store ``data`` and return its key."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, key: str) -> memoryview:
+        """Return a read-only view of the blob stored under ``key``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the blob stored under ``key``, if any."""
+        raise NotImplementedError
+
+
+# =========================================================
+# CLASS IN MEMORY BLOB STORE
+# =========================================================
+class InMemoryBlobStore(BlobStore):
+    """Process-local ``BlobStore`` for tests and single-process workers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._blobs: dict[str, bytes] = {}
+
+    def put(self, data: bytes | memoryview) -> str:
+        """Store ``data`` and return its key."""
+        key = blob_key(data)
+        with self._lock:
+            if key not in self._blobs:
+                self._blobs[key] = bytes(data)
+        return key
+
+    def get(self, key: str) -> memoryview:
+        """Return a read-only view of the stored blob."""
+        try:
+            return memoryview(self._blobs[key])
+        except KeyError:
+            raise BlobNotFoundError(f"Blob {key!r} not found.") from None
+
+    def delete(self, key: str) -> None:
+        """Delete the stored blob."""
+        with self._lock:
+            self._blobs.pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._blobs
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+
+# =========================================================
+# CLASS FILE SYSTEM BLOB STORE
+# =========================================================
+class FileSystemBlobStore(BlobStore):
+    """``BlobStore`` that keeps one file per blob under a root directory."""
+
+    def __init__(self, root: str | PathLike[str]) -> None:
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        if len(key) != 64 or not all(char in "0123456789abcdef" for char in key):
+            raise BlobNotFoundError(f"Invalid blob key {key!r}.")
+        return self._root / key[:2] / key
+
+    def put(self, data: bytes | memoryview) -> str:
+        """Write ``data`` atomically, unless it is already stored."""
+        key = blob_key(data)
+        path = self._path(key)
+        if path.exists():
+            return key
+        path.parent.mkdir(exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return key
+
+    def get(self, key: str) -> memoryview:
+        """Return a memory-mapped, read-only view of the blob."""
+        path = self._path(key)
+        try:
+            with path.open("rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return memoryview(b"")
+                return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except FileNotFoundError:
+            raise BlobNotFoundError(f"Blob {key!r} not found.") from None
+
+    def delete(self, key: str) -> None:
+        """Delete the blob file."""
+        self._path(key).unlink(missing_ok=True)
+
+
+# =========================================================
+# CLASS BLOB
+# =========================================================
+class Blob:
+    """Binary field value that may live in a ``BlobStore``.
+
+    A blob built from bytes holds them directly. A blob built from a payload
+    reference reads the store on first access and keeps the view.
+    """
+
+    __slots__ = ("_data", "_key", "_size", "_store")
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        if isinstance(data, bytearray):
+            data = bytes(data)
+        self._data: memoryview | None = memoryview(data).cast("B").toreadonly()
+        self._key: str | None = None
+        self._size = self._data.nbytes
+        self._store: BlobStore | None = None
+
+    @classmethod
+    def reference(cls, store: BlobStore, key: str, size: int) -> Self:
+        """Return a lazy blob for data stored under ``key``."""
+        blob = cls.__new__(cls)
+        blob._data = None
+        blob._key = key
+        blob._size = size
+        blob._store = store
+        return blob
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the data has been read from the store."""
+        return self._data is not None
+
+    def view(self) -> memoryview:
+        """Return a read-only view of the data, reading the store if needed."""
+        if self._data is None:
+            self._data = self._store.get(self._key)  # type: ignore[union-attr]
+        return self._data
+
+    def offload(self, store: BlobStore) -> str:
+        """Write the data to ``store`` unless it is already there and return its key."""
+        if self._store is not store:
+            self._key = store.put(self.view())
+            self._store = store
+        return self._key  # type: ignore[return-value]
+
+    def __bytes__(self) -> bytes:
+        return self.view().tobytes()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Blob):
+            return NotImplemented
+        if self._key is not None and self._key == other._key:
+            return True
+        return self._size == other._size and self.view() == other.view()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Blob(size={self._size}, key={self._key!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type[Any], handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        from_bytes = core_schema.no_info_after_validator_function(
+            cls,
+            core_schema.union_schema(
+                [
+                    core_schema.bytes_schema(),
+                    core_schema.is_instance_schema(bytearray),
+                    core_schema.is_instance_schema(memoryview),
+                ]
+            ),
+        )
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), from_bytes],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                bytes, return_schema=core_schema.bytes_schema()
+            ),
+        )
+
+
+def _is_blob_annotation(annotation: Any) -> bool:
+    if annotation is Blob:
+        return True
+    if get_origin(annotation) in (Union, types.UnionType):
+        return Blob in get_args(annotation)
+    return False
+
+
+# =========================================================
+# CLASS CLAIM CHECK TASK DATA
+# =========================================================
+class ClaimCheckTaskData(TaskData):
+    """Task payload that offloads large ``Blob`` fields to a ``BlobStore``."""
+
+    blob_store: ClassVar[BlobStore | None] = None
+    offload_threshold: ClassVar[int] = 256 * 1024
+
+    _blob_fields: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._blob_fields = frozenset(
+            name
+            for name, field in cls.model_fields.items()
+            if _is_blob_annotation(field.annotation)
+        )
+
+    def to_payload(self) -> dict[str, Any]:
+        """Serialize, replacing large blobs with store references."""
+        store = self.blob_store
+        if store is None or not self._blob_fields:
+            return super().to_payload()
+        try:
+            payload = self.model_dump(exclude=self._blob_fields)
+        except Exception as exc:
+            raise TaskSerializationError("Failed to serialize task data.") from exc
+        for name in self._blob_fields:
+            blob = getattr(self, name)
+            if blob is None or len(blob) < self.offload_threshold:
+                payload[name] = None if blob is None else bytes(blob)
+            else:
+                payload[name] = {BLOB_REFERENCE_KEY: blob.offload(store), "size": len(blob)}
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> Self:
+        """Create an instance whose referenced blobs load lazily."""
+        references = [
+            name
+            for name in cls._blob_fields
+            if isinstance(payload.get(name), dict) and BLOB_REFERENCE_KEY in payload[name]
+        ]
+        if references:
+            store = cls.blob_store
+            if store is None:
+                raise TaskDeserializationError(
+                    f"{cls.__qualname__} payload references blobs but no blob_store is set."
+                )
+            payload = dict(payload)
+            for name in references:
+                reference = payload[name]
+                try:
+                    payload[name] = Blob.reference(
+                        store, reference[BLOB_REFERENCE_KEY], reference["size"]
+                    )
+                except (KeyError, TypeError) as exc:
+                    raise TaskDeserializationError(
+                        f"Invalid blob reference in field {name!r}."
+                    ) from exc
+        return super().from_payload(payload)
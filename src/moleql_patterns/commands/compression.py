@@ -0,0 +1,271 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Compression of serialized task payloads.
+
+``PayloadCompression`` compresses the JSON produced by ``TaskData.to_bytes``
+when it reaches a size threshold. Every compressed message starts with a header
+byte that names the codec, so ``TaskData.from_bytes`` decodes any supported
+codec regardless of how the reader is configured.
+
+Design notes:
+- ``zlib`` and ``lzma`` come from the standard library. ``zstd`` and ``lz4``
+  need the optional ``zstandard`` and ``lz4`` packages.
+- Small JSON payloads compress poorly on their own. A dictionary trained on
+  sample payloads (``train_dictionary``) fixes most of that for ``zlib`` and
+  ``zstd``. The header carries the CRC32 of the dictionary so a reader with
+  a different dictionary fails loudly instead of returning garbage.
+- Messages that start with ``{`` are plain JSON without a header, as written
+  by producers that do not compress.
+
+Wire format:
+    byte 0      codec id (0 none, 1 zlib, 2 lzma, 3 zstd, 4 lz4);
+                bit 0x80 set when a dictionary was used
+    bytes 1-4   CRC32 of the dictionary, big endian (only with bit 0x80)
+    rest        payload, compressed unless the codec is "none"
+
+Usage:
+    class ReportTaskData(TaskData):
+        compression = PayloadCompression(codec="zstd", threshold=512)
+"""
+
+import functools
+import lzma
+import zlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Literal, Self
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - depends on the environment
+    lz4_frame = None
+
+__all__ = ["Codec", "PayloadCompression", "available_codecs", "decompress_payload"]
+
+type Codec = Literal["none", "zlib", "lzma", "zstd", "lz4"]
+
+_DICTIONARY_FLAG = 0x80
+_JSON_OBJECT_START = ord("{")
+
+
+def _zlib_compress(data: bytes, level: int | None, dictionary: bytes | None) -> bytes:
+    level = -1 if level is None else level
+    if dictionary is None:
+        return zlib.compress(data, level)
+    compressor = zlib.compressobj(level, zdict=dictionary)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _zlib_decompress(data: bytes, dictionary: bytes | None) -> bytes:
+    if dictionary is None:
+        return zlib.decompress(data)
+    decompressor = zlib.decompressobj(zdict=dictionary)
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+def _lzma_compress(data: bytes, level: int | None, dictionary: bytes | None) -> bytes:
+    return lzma.compress(data, preset=level)
+
+
+def _lzma_decompress(data: bytes, dictionary: bytes | None) -> bytes:
+    return lzma.decompress(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _zstd_dictionary(dictionary: bytes) -> Any:
+    return zstandard.ZstdCompressionDict(dictionary)
+
+
+def _zstd_compress(data: bytes, level: int | None, dictionary: bytes | None) -> bytes:
+    compressor = zstandard.ZstdCompressor(
+        level=3 if level is None else level,
+        dict_data=None if dictionary is None else _zstd_dictionary(dictionary),
+    )
+    return compressor.compress(data)
+
+
+def _zstd_decompress(data: bytes, dictionary: bytes | None) -> bytes:
+    decompressor = zstandard.ZstdDecompressor(
+        dict_data=None if dictionary is None else _zstd_dictionary(dictionary)
+    )
+    return decompressor.decompress(data)
+
+
+def _lz4_compress(data: bytes, level: int | None, dictionary: bytes | None) -> bytes:
+    return lz4_frame.compress(data, compression_level=0 if level is None else level)
+
+
+def _lz4_decompress(data: bytes, dictionary: bytes | None) -> bytes:
+    return lz4_frame.decompress(data)
+
+
+def _identity_compress(data: bytes, level: int | None, dictionary: bytes | None) -> bytes:
+    return data
+
+
+def _identity_decompress(data: bytes, dictionary: bytes | None) -> bytes:
+    return data
+
+
+# =========================================================
+# CLASS CODEC SPEC
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class _CodecSpec:
+    name: Codec
+    codec_id: int
+    compress: Callable[[bytes, int | None, bytes | None], bytes]
+    decompress: Callable[[bytes, bytes | None], bytes]
+    supports_dictionary: bool = False
+    module: str | None = None
+
+    @property
+    def available(self) -> bool:
+        if self.module == "zstandard":
+            return zstandard is not None
+        if self.module == "lz4":
+            return lz4_frame is not None
+        return True
+
+
+_CODECS: dict[str, _CodecSpec] = {
+    spec.name: spec
+    for spec in (
+        _CodecSpec("none", 0, _identity_compress, _identity_decompress),
+        _CodecSpec("zlib", 1, _zlib_compress, _zlib_decompress, supports_dictionary=True),
+        _CodecSpec("lzma", 2, _lzma_compress, _lzma_decompress),
+        _CodecSpec(
+            "zstd",
+            3,
+            _zstd_compress,
+            _zstd_decompress,
+            supports_dictionary=True,
+            module="zstandard",
+        ),
+        _CodecSpec("lz4", 4, _lz4_compress, _lz4_decompress, module="lz4"),
+    )
+}
+_CODECS_BY_ID = {spec.codec_id: spec for spec in _CODECS.values()}
+
+
+def available_codecs() -> list[str]:
+    """Return the names of codecs usable in this environment."""
+    return [name for name, spec in _CODECS.items() if spec.available]
+
+
+def _dictionary_id(dictionary: bytes) -> int:
+    return zlib.crc32(dictionary)
+
+
+def decompress_payload(data: bytes, dictionary: bytes | None = None) -> bytes:
+    """Decode a message produced by ``PayloadCompression.compress``.
+
+    Plain JSON objects without a header are returned unchanged. Raises
+    ``ValueError`` for unknown codecs, unavailable codecs, or a dictionary
+    mismatch.
+    """
+    if not data:
+        raise ValueError("Empty payload.")
+    header = data[0]
+    if header == _JSON_OBJECT_START:
+        return data
+    spec = _CODECS_BY_ID.get(header & ~_DICTIONARY_FLAG)
+    if spec is None:
+        raise ValueError(f"Unknown compression header 0x{header:02x}.")
+    if not spec.available:
+        raise ValueError(f"Codec {spec.name!r} requires the {spec.module!r} package.")
+    body = memoryview(data)[1:]
+    used_dictionary = None
+    if header & _DICTIONARY_FLAG:
+        expected = int.from_bytes(body[:4], "big")
+        if dictionary is None or _dictionary_id(dictionary) != expected:
+            raise ValueError(f"Payload needs compression dictionary 0x{expected:08x}.")
+        body = body[4:]
+        used_dictionary = dictionary
+    return spec.decompress(bytes(body), used_dictionary)
+
+
+# =========================================================
+# CLASS PAYLOAD COMPRESSION
+# =========================================================
+class PayloadCompression(BaseModel):
+    """Compression settings for a ``TaskData`` subclass."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    codec: Codec = "zlib"
+    level: int | None = None
+    threshold: int = Field(default=1024, ge=0)
+    dictionary: bytes | None = None
+
+    @model_validator(mode="after")
+    def _check_codec(self) -> Self:
+        spec = _CODECS[self.codec]
+        if not spec.available:
+            raise ValueError(f"Codec {self.codec!r} requires the {spec.module!r} package.")
+        if self.dictionary is not None and not spec.supports_dictionary:
+            raise ValueError(f"Codec {self.codec!r} does not support dictionaries.")
+        return self
+
+    def compress(self, data: bytes) -> bytes:
+        """Return ``data`` with a header, compressed if it reaches ``threshold``."""
+        if len(data) < self.threshold:
+            return bytes((_CODECS["none"].codec_id,)) + data
+        spec = _CODECS[self.codec]
+        body = spec.compress(data, self.level, self.dictionary)
+        if self.dictionary is None:
+            return bytes((spec.codec_id,)) + body
+        header = bytes((spec.codec_id | _DICTIONARY_FLAG,))
+        return header + _dictionary_id(self.dictionary).to_bytes(4, "big") + body
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decode ``data`` using this configuration's dictionary."""
+        return decompress_payload(data, self.dictionary)
+
+    @staticmethod
+    def train_dictionary(
+        samples: Iterable[bytes], *, size: int = 16 * 1024, codec: Codec = "zlib"
+    ) -> bytes:
+        """Build a compression dictionary from sample payloads.
+
+        ``zstd`` uses the zstandard trainer. For ``zlib`` the dictionary is the
+        most recent sample data up to ``size`` bytes (zlib favours strings near
+        the end of its dictionary and uses at most 32 KiB of it).
+        """
+        samples = list(samples)
+        if not samples:
+            raise ValueError("At least one sample is required.")
+        if codec == "zstd":
+            if zstandard is None:
+                raise ValueError("Codec 'zstd' requires the 'zstandard' package.")
+            return zstandard.train_dictionary(size, samples).as_bytes()
+        if codec != "zlib":
+            raise ValueError(f"Codec {codec!r} does not support dictionaries.")
+        return b"".join(samples)[-min(size, 32 * 1024) :]
@@ -0,0 +1,340 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Execution policies for task commands.
+
+Policies are declared once per task class and applied by ``Task.run`` and
+``AsyncTask.run``. They keep slow or failing downstreams from tying up worker
+slots indefinitely.
+
+Design notes:
+- ``timeout`` bounds a single attempt. Async tasks use ``asyncio.timeout``.
+  Sync tasks run the attempt in a helper thread; the thread cannot be killed,
+  so a timed-out sync task keeps running in the background until it returns.
+- ``RetryPolicy`` retries failed attempts with exponential backoff and full
+  jitter.
+- ``CircuitBreaker`` instances are shared per dependency. Declare one breaker
+  at module level and reference it from every task that calls that dependency.
+  An open breaker fails fast with ``CircuitOpenError`` and is never retried.
+
+Usage:
+    smtp_breaker = CircuitBreaker("smtp", failure_threshold=5, recovery_timeout=30.0)
+
+    class SendEmailTask(Task[SendEmailData]):
+        task_data_cls = SendEmailData
+        execution_policy = ExecutionPolicy(
+            timeout=5.0,
+            retry=RetryPolicy(max_attempts=3, base_delay=0.2),
+            circuit_breaker=smtp_breaker,
+        )
+
+    SendEmailTask(payload, mailer).run()
+"""
+
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ExecutionPolicy",
+    "RetryPolicy",
+    "TaskTimeoutError",
+    "run_with_policy",
+    "run_with_policy_async",
+]
+
+
+# =========================================================
+# CLASS TASK TIMEOUT ERROR
+# =========================================================
+class TaskTimeoutError(TimeoutError):
+    """Raised when a task attempt exceeds its execution timeout."""
+
+
+# =========================================================
+# CLASS CIRCUIT OPEN ERROR
+# =========================================================
+class CircuitOpenError(RuntimeError):
+    """Raised when a circuit breaker rejects a call to an unhealthy dependency."""
+
+
+# =========================================================
+# CLASS RETRY POLICY
+# =========================================================
+class RetryPolicy(BaseModel):
+    """Exponential backoff with optional full jitter."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    max_attempts: int = Field(default=3, ge=1, description="Total attempts, including the first.")
+    base_delay: float = Field(default=0.1, ge=0, description="Delay before the first retry.")
+    max_delay: float = Field(default=10.0, ge=0, description="Upper bound for a single delay.")
+    multiplier: float = Field(default=2.0, ge=1, description="Backoff growth factor.")
+    jitter: bool = Field(default=True, description="Draw each delay uniformly from [0, delay].")
+    retry_on: tuple[type[Exception], ...] = Field(
+        default=(Exception,), description="Exception types that trigger a retry."
+    )
+
+    def compute_delay(self, attempt: int) -> float:
+        """Return the delay to wait after the given failed attempt (1-based)."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        """Return True when another attempt should follow ``exc``."""
+        return (
+            attempt < self.max_attempts
+            and isinstance(exc, self.retry_on)
+            and not isinstance(exc, CircuitOpenError)
+        )
+
+
+# =========================================================
+# CLASS CIRCUIT BREAKER
+# =========================================================
+class CircuitBreaker:
+    """Thread-safe circuit breaker shared by every caller of one dependency.
+
+    The breaker opens after ``failure_threshold`` consecutive failures. While
+    open, calls fail fast. After ``recovery_timeout`` seconds a single probe
+    call is allowed through; its outcome closes or reopens the breaker. A
+    probe that is cancelled or interrupted has no outcome, so the next call
+    may probe instead.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1.")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> Literal["closed", "open", "half_open"]:
+        """Return the current breaker state."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at >= self.recovery_timeout:
+                return "half_open"
+            return "open"
+
+    def before_call(self) -> bool:
+        """Admit a call or raise ``CircuitOpenError``. Return True for a probe call."""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            recovered = self._clock() - self._opened_at >= self.recovery_timeout
+            if recovered and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+        raise CircuitOpenError(f"Circuit '{self.name}' is open.")
+
+    def release_probe(self) -> None:
+        """Let another call probe after a probe ended without an outcome (e.g., cancellation)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure count."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure and open the breaker once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._probe_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+
+# =========================================================
+# CLASS EXECUTION POLICY
+# =========================================================
+class ExecutionPolicy(BaseModel):
+    """Declarative timeout, retry, and circuit breaker settings for a task class."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", arbitrary_types_allowed=True)
+
+    timeout: float | None = Field(default=None, gt=0, description="Seconds allowed per attempt.")
+    retry: RetryPolicy | None = None
+    circuit_breaker: CircuitBreaker | None = None
+
+
+def run_with_policy[T](
+    func: Callable[[], T],
+    policy: ExecutionPolicy | None,
+    *,
+    acquire: Callable[[], None] | None = None,
+) -> T:
+    """Call ``func`` under ``policy``; call it directly when no policy is set.
+
+    ``acquire`` runs before every attempt, after the circuit breaker admits it
+    (e.g., to take a rate limit token). Its errors are not breaker failures.
+    """
+    if policy is None:
+        if acquire is not None:
+            acquire()
+        return func()
+    attempt = 1
+    while True:
+        try:
+            return _attempt(func, policy, acquire)
+        except Exception as exc:
+            if policy.retry is None or not policy.retry.should_retry(exc, attempt):
+                raise
+            time.sleep(policy.retry.compute_delay(attempt))
+            attempt += 1
+
+
+async def run_with_policy_async[T](
+    func: Callable[[], Awaitable[T]],
+    policy: ExecutionPolicy | None,
+    *,
+    acquire: Callable[[], Awaitable[None]] | None = None,
+) -> T:
+    """Await ``func()`` under ``policy``; await it directly when no policy is set.
+
+    ``acquire`` is awaited before every attempt, as in ``run_with_policy``.
+    """
+    if policy is None:
+        if acquire is not None:
+            await acquire()
+        return await func()
+    attempt = 1
+    while True:
+        try:
+            return await _attempt_async(func, policy, acquire)
+        except Exception as exc:
+            if policy.retry is None or not policy.retry.should_retry(exc, attempt):
+                raise
+            await asyncio.sleep(policy.retry.compute_delay(attempt))
+            attempt += 1
+
+
+def _attempt[T](
+    func: Callable[[], T], policy: ExecutionPolicy, acquire: Callable[[], None] | None
+) -> T:
+    breaker = policy.circuit_breaker
+    probe = breaker is not None and breaker.before_call()
+    if acquire is not None:
+        try:
+            acquire()
+        except BaseException:
+            if probe:
+                breaker.release_probe()  # type: ignore[union-attr]
+            raise
+    try:
+        result = func() if policy.timeout is None else _call_with_timeout(func, policy.timeout)
+    except Exception:
+        if breaker is not None:
+            breaker.record_failure()
+        raise
+    except BaseException:
+        if probe:
+            breaker.release_probe()  # type: ignore[union-attr]
+        raise
+    if breaker is not None:
+        breaker.record_success()
+    return result
+
+
+async def _attempt_async[T](
+    func: Callable[[], Awaitable[T]],
+    policy: ExecutionPolicy,
+    acquire: Callable[[], Awaitable[None]] | None,
+) -> T:
+    breaker = policy.circuit_breaker
+    probe = breaker is not None and breaker.before_call()
+    if acquire is not None:
+        try:
+            await acquire()
+        except BaseException:
+            if probe:
+                breaker.release_probe()  # type: ignore[union-attr]
+            raise
+    try:
+        if policy.timeout is None:
+            result = await func()
+        else:
+            deadline = asyncio.timeout(policy.timeout)
+            try:
+                async with deadline:
+                    result = await func()
+            except TimeoutError as exc:
+                if deadline.expired():
+                    raise TaskTimeoutError(f"Task exceeded its {policy.timeout}s timeout.") from exc
+                raise
+    except Exception:
+        if breaker is not None:
+            breaker.record_failure()
+        raise
+    except BaseException:
+        if probe:
+            breaker.release_probe()  # type: ignore[union-attr]
+        raise
+    if breaker is not None:
+        breaker.record_success()
+    return result
+
+
+def _call_with_timeout[T](func: Callable[[], T], timeout: float) -> T:
+    future: Future[T] = Future()
+    context = contextvars.copy_context()
+
+    def target() -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(context.run(func))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    thread = threading.Thread(target=target, name="moleql-task-attempt", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if not future.done():
+        raise TaskTimeoutError(f"Task exceeded its {timeout}s timeout.")
+    return future.result()
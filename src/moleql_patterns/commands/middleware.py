@@ -0,0 +1,130 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Middleware chains for API operations.
+
+A middleware wraps operation execution, e.g., for logging, transactions,
+metrics, or caching. It receives ``call_next`` and the operation and returns
+the result:
+
+    def log_calls(call_next, operation):
+        logger.info("running %s", type(operation).__name__)
+        return call_next(operation)
+
+Async operations use ``async def`` middlewares that ``await call_next(operation)``.
+
+Design notes:
+- Middlewares are registered globally (``register_middleware`` /
+  ``register_async_middleware``) or per class through the ``middlewares``
+  class attribute. Global middlewares run outside class middlewares.
+- Chains are composed with ``functools.partial`` once per class and cached on
+  the class. Each call then costs one lookup plus one call per middleware.
+  Changing the global registry invalidates every cached chain.
+- ``call_next`` comes first so it can be bound positionally with
+  ``functools.partial``; binding it by keyword is several times slower.
+- Middlewares run after ``verify_access``, so a caching middleware can never
+  answer for a caller who is not authorized.
+"""
+
+import functools
+import threading
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+__all__ = [
+    "AsyncMiddleware",
+    "Middleware",
+    "clear_middlewares",
+    "compose_middlewares",
+    "register_async_middleware",
+    "register_middleware",
+    "unregister_middleware",
+]
+
+type Middleware = Callable[..., Any]
+type AsyncMiddleware = Callable[..., Awaitable[Any]]
+
+_CACHE_ATTRIBUTE = "_middleware_chain_cache"
+
+_lock = threading.Lock()
+_version = 0
+_sync_middlewares: tuple[Middleware, ...] = ()
+_async_middlewares: tuple[AsyncMiddleware, ...] = ()
+
+
+def register_middleware(middleware: Middleware) -> Middleware:
+    """Run ``middleware`` around every synchronous operation. Usable as a decorator."""
+    global _sync_middlewares, _version
+    with _lock:
+        _sync_middlewares = (*_sync_middlewares, middleware)
+        _version += 1
+    return middleware
+
+
+def register_async_middleware(middleware: AsyncMiddleware) -> AsyncMiddleware:
+    """Run ``middleware`` around every asynchronous operation. Usable as a decorator."""
+    global _async_middlewares, _version
+    with _lock:
+        _async_middlewares = (*_async_middlewares, middleware)
+        _version += 1
+    return middleware
+
+
+def unregister_middleware(middleware: Middleware | AsyncMiddleware) -> None:
+    """Remove a globally registered middleware."""
+    global _sync_middlewares, _async_middlewares, _version
+    with _lock:
+        _sync_middlewares = tuple(item for item in _sync_middlewares if item is not middleware)
+        _async_middlewares = tuple(item for item in _async_middlewares if item is not middleware)
+        _version += 1
+
+
+def clear_middlewares() -> None:
+    """Remove every globally registered middleware."""
+    global _sync_middlewares, _async_middlewares, _version
+    with _lock:
+        _sync_middlewares = ()
+        _async_middlewares = ()
+        _version += 1
+
+
+def compose_middlewares[T: Callable[..., Any]](
+    middlewares: Sequence[Callable[..., Any]], terminal: T
+) -> T:
+    """Return one callable that runs ``middlewares`` (outermost first) around ``terminal``."""
+    handler: Callable[..., Any] = terminal
+    for middleware in reversed(middlewares):
+        handler = functools.partial(middleware, handler)
+    return handler  # type: ignore[return-value]
+
+
+def middleware_chain[T: Callable[..., Any]](cls: type, terminal: T, *, is_async: bool) -> T:
+    """Return the cached chain for ``cls``, composing it if needed."""
+    cached = cls.__dict__.get(_CACHE_ATTRIBUTE)
+    if cached is not None and cached[0] == _version:
+        return cached[1]
+    with _lock:
+        version = _version
+        global_middlewares = _async_middlewares if is_async else _sync_middlewares
+    chain = compose_middlewares((*global_middlewares, *cls.middlewares), terminal)
+    setattr(cls, _CACHE_ATTRIBUTE, (version, chain))
+    return chain
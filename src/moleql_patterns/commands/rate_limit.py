@@ -0,0 +1,233 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Rate limiting primitives for API operations and tasks.
+
+A ``RateLimit`` attaches a ``RateLimiter`` to an operation or task class. The
+operation or task supplies the key to limit on (for example, a principal id)
+through ``rate_limit_key``.
+
+Design notes:
+- ``RateLimiter`` is the backend contract. ``TokenBucketLimiter`` and
+  ``SlidingWindowLimiter`` keep their state in process memory. Shared backends
+  (e.g., Redis) implement ``try_acquire`` and, optionally, an async variant.
+- The in-memory limiters hold a lock only for a few arithmetic operations per
+  call; there is no blocking I/O inside the critical section.
+- ``mode="reject"`` raises ``RateLimitExceededError`` immediately.
+  ``mode="wait"`` sleeps until a token is available, up to ``max_wait``.
+
+Usage:
+    class SearchProducts(APIOperation[SearchResult]):
+        rate_limit = RateLimit(TokenBucketLimiter(rate=5.0, capacity=10))
+
+        def rate_limit_key(self) -> str:
+            return self._current_user.id
+"""
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = [
+    "RateLimit",
+    "RateLimiter",
+    "RateLimitExceededError",
+    "SlidingWindowLimiter",
+    "TokenBucketLimiter",
+]
+
+
+# =========================================================
+# CLASS RATE LIMIT EXCEEDED ERROR
+# =========================================================
+class RateLimitExceededError(RuntimeError):
+    """Raised when a call exceeds its rate limit."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# =========================================================
+# CLASS RATE LIMITER
+# =========================================================
+class RateLimiter(ABC):
+    """Backend contract for rate limiter state."""
+
+    @abstractmethod
+    def try_acquire(self, key: str, tokens: int = 1) -> float:
+        """Take ``tokens`` for ``key``.
+
+        Return ``0.0`` when the tokens were granted, otherwise the number of
+        seconds until the request could be granted.
+        """
+        raise NotImplementedError
+
+    async def try_acquire_async(self, key: str, tokens: int = 1) -> float:
+        """Async variant of ``try_acquire`` for backends that perform I/O."""
+        return self.try_acquire(key, tokens)
+
+
+# =========================================================
+# CLASS TOKEN BUCKET LIMITER
+# =========================================================
+class TokenBucketLimiter(RateLimiter):
+    """In-memory token bucket per key.
+
+    Each bucket holds up to ``capacity`` tokens and refills at ``rate`` tokens
+    per second, which allows short bursts above the steady rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        *,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1.")
+        self.rate = rate
+        self.capacity = capacity
+        self._max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, list[float]] = {}
+
+    def try_acquire(self, key: str, tokens: int = 1) -> float:
+        """Take ``tokens`` from the bucket for ``key``."""
+        if tokens > self.capacity:
+            raise ValueError("tokens cannot exceed the bucket capacity.")
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self._max_keys:
+                    self._prune(now)
+                bucket = self._buckets[key] = [float(self.capacity), now]
+            available = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if available >= tokens:
+                bucket[0] = available - tokens
+                return 0.0
+            bucket[0] = available
+            return (tokens - available) / self.rate
+
+    def _prune(self, now: float) -> None:
+        refill_time = self.capacity / self.rate
+        for key in [key for key, (_, last) in self._buckets.items() if now - last >= refill_time]:
+            del self._buckets[key]
+
+
+# =========================================================
+# CLASS SLIDING WINDOW LIMITER
+# =========================================================
+class SlidingWindowLimiter(RateLimiter):
+    """In-memory sliding window log per key.
+
+    Allows at most ``limit`` tokens in any ``window`` seconds. Unlike a token
+    bucket, it never allows a burst above ``limit``.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: float,
+        *,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if limit < 1 or window <= 0:
+            raise ValueError("limit must be at least 1 and window positive.")
+        self.limit = limit
+        self.window = window
+        self._max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._logs: dict[str, deque[float]] = {}
+
+    def try_acquire(self, key: str, tokens: int = 1) -> float:
+        """Record ``tokens`` events for ``key`` if the window has room."""
+        if tokens > self.limit:
+            raise ValueError("tokens cannot exceed the window limit.")
+        with self._lock:
+            now = self._clock()
+            log = self._logs.get(key)
+            if log is None:
+                if len(self._logs) >= self._max_keys:
+                    self._prune(now)
+                log = self._logs[key] = deque()
+            horizon = now - self.window
+            while log and log[0] <= horizon:
+                log.popleft()
+            if len(log) + tokens <= self.limit:
+                log.extend([now] * tokens)
+                return 0.0
+            return log[len(log) + tokens - self.limit - 1] - horizon
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.window
+        for key in [key for key, log in self._logs.items() if not log or log[-1] <= horizon]:
+            del self._logs[key]
+
+
+# =========================================================
+# CLASS RATE LIMIT
+# =========================================================
+class RateLimit(BaseModel):
+    """Declarative rate limit for an operation or task class."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", arbitrary_types_allowed=True)
+
+    limiter: RateLimiter
+    mode: Literal["reject", "wait"] = "reject"
+    max_wait: float | None = Field(
+        default=None, ge=0, description="Longest time to wait in 'wait' mode; None waits forever."
+    )
+    cost: int = Field(default=1, ge=1, description="Tokens taken per call.")
+
+    def acquire(self, key: str) -> None:
+        """Take a token for ``key``, waiting or rejecting according to ``mode``."""
+        waited = 0.0
+        while (delay := self.limiter.try_acquire(key, self.cost)) > 0:
+            self._check_wait(key, delay, waited)
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self, key: str) -> None:
+        """Async variant of ``acquire`` that never blocks the event loop."""
+        waited = 0.0
+        while (delay := await self.limiter.try_acquire_async(key, self.cost)) > 0:
+            self._check_wait(key, delay, waited)
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def _check_wait(self, key: str, delay: float, waited: float) -> None:
+        if self.mode == "reject" or (self.max_wait is not None and waited + delay > self.max_wait):
+            raise RateLimitExceededError(f"Rate limit exceeded for '{key}'.", retry_after=delay)
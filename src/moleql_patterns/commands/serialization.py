@@ -0,0 +1,97 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""JSON serialization fast path for operation results.
+
+``APIOperation.execute_json`` returns the result model as JSON bytes straight
+from the model's compiled pydantic serializer, without building an
+intermediate dictionary.
+
+Design notes:
+- Every pydantic model class already owns a compiled serializer
+  (``__pydantic_serializer__``). ``dump_json`` calls it directly, skipping
+  ``model_dump_json``'s argument handling.
+- A ``Projection`` normalizes include/exclude rules once, when it is created.
+  Define projections as module or class constants and reuse them.
+
+Usage:
+    PUBLIC_USER = Projection(exclude={"password_hash", "profile": {"email"}})
+
+    class GetUser(APIOperation[User]):
+        json_projection = PUBLIC_USER
+"""
+
+from collections.abc import Mapping, Set
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+__all__ = ["Projection", "dump_json"]
+
+type FieldRules = Set[str | int] | Mapping[str | int, Any]
+
+
+def _normalize(rules: FieldRules | None) -> dict[str | int, Any] | None:
+    if rules is None:
+        return None
+    if isinstance(rules, Set):
+        return dict.fromkeys(rules, True)
+    return {
+        key: value if value is True or value is Ellipsis else _normalize(value)
+        for key, value in rules.items()
+    }
+
+
+# =========================================================
+# CLASS PROJECTION
+# =========================================================
+@dataclass(frozen=True, slots=True, eq=False)
+class Projection:
+    """Field selection and output options for ``execute_json``.
+
+    ``include`` and ``exclude`` take the same sets and nested mappings as
+    ``BaseModel.model_dump``.
+    """
+
+    include: FieldRules | None = None
+    exclude: FieldRules | None = None
+    by_alias: bool = False
+    exclude_none: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "include", _normalize(self.include))
+        object.__setattr__(self, "exclude", _normalize(self.exclude))
+
+
+def dump_json(model: BaseModel, projection: Projection | None = None) -> bytes:
+    """Serialize ``model`` to JSON bytes with its compiled serializer."""
+    serializer = model.__pydantic_serializer__
+    if projection is None:
+        return serializer.to_json(model)
+    return serializer.to_json(
+        model,
+        include=projection.include,
+        exclude=projection.exclude,
+        by_alias=projection.by_alias,
+        exclude_none=projection.exclude_none,
+    )
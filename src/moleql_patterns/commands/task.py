@@ -41,11 +41,18 @@ Example:
         def exec(self) -> str:
             self._mailer.send(self.task_data.recipient, self.task_data.subject)
             return "sent"
+
+Workers call ``run`` to execute a task under its class-level ``execution_policy``
+(timeout, retries, circuit breaker) and ``rate_limit``. ``exec`` remains the unit
+of task logic. A rate limit takes one token per attempt, so retries are limited too.
 """
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar, NoReturn
 
+from .execution_policy import ExecutionPolicy, run_with_policy, run_with_policy_async
+from .rate_limit import RateLimit
 from .task_data import TaskData
 
 __all__ = ["TaskBase", "Task", "AsyncTask", "TaskDataDeserializationError"]
@@ -58,24 +65,57 @@ class TaskDataDeserializationError(Exception):
     """Raised when a task is missing its required task_data_cls contract."""
 
 
+# =========================================================
+# CLASS ABSTRACT TASK DATA
+# =========================================================
+class _AbstractTaskData:
+    """Placeholder ``task_data_cls`` for ``TaskBase`` itself."""
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> NoReturn:
+        raise TypeError("TaskBase is abstract. Subclass it and define task_data_cls.")
+
+
+# =========================================================
+# CLASS UNDEFINED TASK DATA
+# =========================================================
+class _UndefinedTaskData:
+    """Placeholder ``task_data_cls`` for tasks that do not declare one."""
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> NoReturn:
+        raise TaskDataDeserializationError("task_data_cls must be defined on the Task class")
+
+
 # =========================================================
 # CLASS TASK BASE
 # =========================================================
 class TaskBase[TaskDataT: TaskData](ABC):
     """Base class for task execution with validated payloads."""
 
-    task_data_cls: type[TaskDataT]
+    task_data_cls: type[TaskDataT] = _AbstractTaskData  # type: ignore[assignment]
     task_data: TaskDataT
+    execution_policy: ClassVar[ExecutionPolicy | None] = None
+    rate_limit: ClassVar[RateLimit | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve the ``task_data_cls`` contract once, at class creation.
+
+        Classes that do not declare ``task_data_cls`` (including abstract
+        intermediate bases) get a placeholder that raises on construction, so
+        ``__init__`` needs no per-instance checks.
+        """
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, "task_data_cls", None) in (None, _AbstractTaskData):
+            cls.task_data_cls = _UndefinedTaskData  # type: ignore[assignment]
 
     def __init__(self, task_data: dict[str, Any]) -> None:
-        if self.__class__ is TaskBase:
-            raise TypeError("TaskBase is abstract. Subclass it and define task_data_cls.")
-        self._verify_task_data_class_is_set()
         self.task_data = self.task_data_cls.from_payload(task_data)
 
-    def _verify_task_data_class_is_set(self) -> None:
-        if not hasattr(self, "task_data_cls") or self.task_data_cls is None:
-            raise TaskDataDeserializationError("task_data_cls must be defined on the Task class")
+    def rate_limit_key(self) -> str:
+        """Return the key the class ``rate_limit`` applies to (defaults to the class)."""
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}"
 
 
 # =========================================================
@@ -95,6 +135,13 @@ class Task[TaskDataT: TaskData](TaskBase[TaskDataT], ABC):
         """Execute the task synchronously."""
         raise NotImplementedError
 
+    def run(self) -> Any:
+        """Execute the task under its class-level ``execution_policy``."""
+        acquire = None
+        if self.rate_limit is not None:
+            acquire = functools.partial(self.rate_limit.acquire, self.rate_limit_key())
+        return run_with_policy(self.exec, self.execution_policy, acquire=acquire)
+
 
 # =========================================================
 # CLASS ASYNC TASK
@@ -112,3 +159,10 @@ class AsyncTask[TaskDataT: TaskData](TaskBase[TaskDataT], ABC):
     async def exec(self) -> Any:
         """Execute the task asynchronously."""
         raise NotImplementedError
+
+    async def run(self) -> Any:
+        """Execute the task under its class-level ``execution_policy``."""
+        acquire = None
+        if self.rate_limit is not None:
+            acquire = functools.partial(self.rate_limit.acquire_async, self.rate_limit_key())
+        return await run_with_policy_async(self.exec, self.execution_policy, acquire=acquire)
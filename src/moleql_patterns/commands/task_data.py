@@ -31,13 +31,82 @@ Design notes:
 - Keep task input explicit and immutable where possible.
 - Prefer "tell, don't ask" by providing methods that act on the data.
 - Validate eagerly to keep failures close to the task producer.
+- Use ``FrozenTaskData`` when payloads must be hashable, e.g., as cache keys or
+  to drop duplicate tasks before enqueueing.
+- Subclasses build their pydantic schema on first use (``defer_build``),
+  so unused task types cost nothing at import. Call ``warmup`` to build
+  them ahead of time.
+- ``to_bytes``/``from_bytes`` produce broker-ready messages. Set ``compression``
+  on a subclass to compress them (see ``compression.py``).
+- ``encode_payload`` writes ``bytes`` values as ``{"$bytes": "<base64>"}`` and
+  ``decode_payload`` turns them back into ``bytes``, so binary fields survive
+  JSON transports without changing how ``from_payload`` validates them.
 """
 
-from typing import Any, Self
+import base64
+import hashlib
+import json
+import time
+from collections.abc import Mapping
+from typing import Any, ClassVar, Self
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json, to_jsonable_python
 
-__all__ = ["TaskData", "TaskSerializationError", "TaskDeserializationError"]
+from .compression import PayloadCompression, decompress_payload
+
+__all__ = [
+    "TaskData",
+    "FrozenTaskData",
+    "TaskSerializationError",
+    "TaskDeserializationError",
+    "payload_digest",
+    "encode_payload",
+    "decode_payload",
+]
+
+_BYTES_KEY = "$bytes"
+
+
+def payload_digest(payload: Mapping[str, Any]) -> str:
+    """Return a stable SHA-256 hex digest of a task payload.
+
+    Keys are sorted and bytes are base64 encoded, so equal payloads produce the
+    same digest across processes and Python versions.
+    """
+    canonical = json.dumps(
+        to_jsonable_python(payload, bytes_mode="base64"),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _tag_bytes(value: Any) -> Any:
+    if isinstance(value, bytes | bytearray | memoryview):
+        return {_BYTES_KEY: base64.b64encode(value).decode("ascii")}
+    if isinstance(value, Mapping):
+        return {key: _tag_bytes(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_tag_bytes(item) for item in value]
+    return value
+
+
+def _untag_bytes(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1 and isinstance(obj.get(_BYTES_KEY), str):
+        return base64.b64decode(obj[_BYTES_KEY], validate=True)
+    return obj
+
+
+def encode_payload(payload: Mapping[str, Any]) -> bytes:
+    """Encode a payload as JSON, writing ``bytes`` values as ``{"$bytes": "<base64>"}``."""
+    return to_json(_tag_bytes(payload))
+
+
+def decode_payload(data: bytes | str) -> dict[str, Any]:
+    """Decode JSON produced by ``encode_payload``, restoring ``bytes`` values."""
+    return json.loads(data, object_hook=_untag_bytes)
 
 
 # =========================================================
@@ -64,7 +133,9 @@ class TaskData(BaseModel):
     data commands with explicit validation.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
+    compression: ClassVar[PayloadCompression | None] = None
 
     correlation_id: str = Field(
         ...,
@@ -77,6 +148,18 @@ class TaskData(BaseModel):
             raise TypeError("TaskData is abstract. Subclass it and add task-specific fields.")
         super().__init__(**data)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give concrete subclasses pydantic's own ``__init__``.
+
+        The abstract-class guard above only matters for ``TaskData`` itself.
+        Subclasses that do not define ``__init__`` skip it, which removes a
+        Python frame per construction and lets ``model_validate`` build
+        instances without calling ``__init__`` at all.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.__init__ is TaskData.__init__:
+            cls.__init__ = BaseModel.__init__  # type: ignore[method-assign]
+
     def to_payload(self) -> dict[str, Any]:
         """Serialize to a transport-friendly dictionary."""
         try:
@@ -91,3 +174,87 @@ class TaskData(BaseModel):
             return cls.model_validate(payload)
         except Exception as exc:
             raise TaskDeserializationError("Failed to deserialize task data.") from exc
+
+    @classmethod
+    def dumps_payload(cls, payload: dict[str, Any]) -> bytes:
+        """Encode a payload to bytes. Override to change the wire encoding."""
+        return encode_payload(payload)
+
+    @classmethod
+    def loads_payload(cls, data: bytes) -> dict[str, Any]:
+        """Decode bytes produced by ``dumps_payload``."""
+        return decode_payload(data)
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a message, compressed if ``compression`` is set."""
+        payload = self.to_payload()
+        try:
+            data = self.dumps_payload(payload)
+            if self.compression is None:
+                return data
+            return self.compression.compress(data)
+        except Exception as exc:
+            raise TaskSerializationError("Failed to serialize task data.") from exc
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Create an instance from a message, detecting its compression."""
+        dictionary = None if cls.compression is None else cls.compression.dictionary
+        try:
+            payload = cls.loads_payload(decompress_payload(data, dictionary))
+        except Exception as exc:
+            raise TaskDeserializationError("Failed to deserialize task data.") from exc
+        return cls.from_payload(payload)
+
+
+# =========================================================
+# CLASS FROZEN TASK DATA
+# =========================================================
+class FrozenTaskData(TaskData):
+    """Immutable, hashable task payload with a cached content hash.
+
+    Equality and hashing use a SHA-256 digest of the payload, computed once on
+    first use and stored in a slot, so it is never serialized, copied, or
+    compared as model state. Field values do not need to be hashable.
+    """
+
+    __slots__ = ("_content_hash", "_dedup_digest")
+
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
+
+    def content_hash(self) -> str:
+        """Return the SHA-256 digest of the full payload."""
+        try:
+            return self._content_hash
+        except AttributeError:
+            digest = payload_digest(self.to_payload())
+            object.__setattr__(self, "_content_hash", digest)
+            return digest
+
+    def dedup_key(self, window: float | None = None, *, now: float | None = None) -> str:
+        """Return a key that is equal for duplicate tasks.
+
+        Duplicates are tasks of the same class with the same payload, ignoring
+        ``correlation_id``. With ``window`` (seconds), the key also changes
+        every window, so producers can drop duplicates within that window.
+        """
+        try:
+            digest = self._dedup_digest
+        except AttributeError:
+            cls = type(self)
+            payload = self.to_payload()
+            payload.pop("correlation_id", None)
+            digest = payload_digest({"task": f"{cls.__module__}.{cls.__qualname__}", **payload})
+            object.__setattr__(self, "_dedup_digest", digest)
+        if window is None:
+            return digest
+        bucket = int((time.time() if now is None else now) // window)
+        return f"{digest}:{bucket}"
+
+    def __hash__(self) -> int:
+        return hash(self.content_hash())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenTaskData):
+            return NotImplemented
+        return type(self) is type(other) and self.content_hash() == other.content_hash()
@@ -0,0 +1,169 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Schema-versioned task payloads for rolling deploys.
+
+During a rolling deploy, workers can receive payloads from producers that run an
+older release. ``VersionedTaskData`` writes its ``schema_version`` into every
+payload and upgrades older payloads with registered migrations before
+validation.
+
+Design notes:
+- A migration upgrades a payload dictionary from one version to the next.
+  Register it with ``@MyTaskData.migration(from_version)``.
+- The steps from a given version to the current one are composed once and
+  cached per class, so each message costs one dictionary lookup plus the
+  migrations themselves.
+- Payloads without ``schema_version`` were written before versioning and are
+  treated as version 1.
+- ``accepted_versions`` limits how many versions back a class accepts,
+  including the current one. ``None`` accepts every version.
+
+Usage:
+    class SendEmailTaskData(VersionedTaskData):
+        schema_version = 2
+        recipient: str
+
+    @SendEmailTaskData.migration(1)
+    def _rename_to(payload: dict[str, Any]) -> dict[str, Any]:
+        payload["recipient"] = payload.pop("to")
+        return payload
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any, ClassVar, Self
+
+from .task_data import TaskData, TaskDeserializationError
+
+__all__ = ["Migration", "SCHEMA_VERSION_KEY", "VersionedTaskData"]
+
+SCHEMA_VERSION_KEY = "schema_version"
+
+type Migration = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+def _compose(steps: Sequence[Migration]) -> Migration:
+    if len(steps) == 1:
+        return steps[0]
+
+    def upgrade(payload: dict[str, Any]) -> dict[str, Any]:
+        for step in steps:
+            payload = step(payload)
+        return payload
+
+    return upgrade
+
+
+# =========================================================
+# CLASS VERSIONED TASK DATA
+# =========================================================
+class VersionedTaskData(TaskData):
+    """Task payload that carries a schema version and upgrades older payloads."""
+
+    schema_version: ClassVar[int] = 1
+    accepted_versions: ClassVar[int | None] = None
+
+    _migrations: ClassVar[dict[int, Migration]] = {}
+    _upgrades: ClassVar[dict[int, Migration]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.schema_version < 1:
+            raise TypeError(f"{cls.__qualname__}.schema_version must be at least 1.")
+        if cls.accepted_versions is not None and cls.accepted_versions < 1:
+            raise TypeError(f"{cls.__qualname__}.accepted_versions must be at least 1.")
+        cls._migrations = dict(cls._migrations)
+        cls._upgrades = {}
+
+    @classmethod
+    def migration(cls, from_version: int) -> Callable[[Migration], Migration]:
+        """Register a migration from ``from_version`` to ``from_version + 1``."""
+        if not 1 <= from_version < cls.schema_version:
+            raise ValueError(
+                f"Migration source version must be between 1 and {cls.schema_version - 1}."
+            )
+
+        def register(func: Migration) -> Migration:
+            cls._migrations[from_version] = func
+            cls._upgrades.clear()
+            return func
+
+        return register
+
+    @classmethod
+    def _min_version(cls) -> int:
+        if cls.accepted_versions is None:
+            return 1
+        return max(1, cls.schema_version - cls.accepted_versions + 1)
+
+    @classmethod
+    def _upgrade_for(cls, version: int) -> Migration:
+        try:
+            return cls._upgrades[version]
+        except KeyError:
+            pass
+        if not cls._min_version() <= version < cls.schema_version:
+            raise TaskDeserializationError(
+                f"{cls.__qualname__} does not accept schema version {version}; "
+                f"accepted versions are {cls._min_version()} to {cls.schema_version}."
+            )
+        steps = []
+        for step_version in range(version, cls.schema_version):
+            step = cls._migrations.get(step_version)
+            if step is None:
+                raise TaskDeserializationError(
+                    f"{cls.__qualname__} has no migration from schema version {step_version}."
+                )
+            steps.append(step)
+        upgrade = cls._upgrades[version] = _compose(steps)
+        return upgrade
+
+    @classmethod
+    def upgrade_payload(cls, payload: dict[str, Any]) -> dict[str, Any]:
+        """Return ``payload`` upgraded to the current schema, without the version key.
+
+        The input dictionary is not modified.
+        """
+        data = dict(payload)
+        version = data.pop(SCHEMA_VERSION_KEY, 1)
+        if version == cls.schema_version:
+            return data
+        if not isinstance(version, int) or isinstance(version, bool):
+            raise TaskDeserializationError(f"Invalid schema version: {version!r}.")
+        upgrade = cls._upgrade_for(version)
+        try:
+            return upgrade(data)
+        except Exception as exc:
+            raise TaskDeserializationError(
+                f"Failed to migrate {cls.__qualname__} payload from schema version {version}."
+            ) from exc
+
+    def to_payload(self) -> dict[str, Any]:
+        """Serialize to a dictionary that includes the schema version."""
+        payload = super().to_payload()
+        payload[SCHEMA_VERSION_KEY] = self.schema_version
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> Self:
+        """Upgrade ``payload`` to the current schema and validate it."""
+        return super().from_payload(cls.upgrade_payload(payload))
@@ -0,0 +1,319 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Allocation accounting for TaskData and Entity hydration.
+
+``AllocationTracker`` is an opt-in instrumentation mode built on
+``tracemalloc``. While it is installed, it measures the memory retained by
+each hydration path and attributes it to the model class produced:
+
+- ``TaskData.from_payload`` (including subclass overrides)
+- ``TaskBase.__init__``
+- ``EntityRepository.list`` (every repository class that defines it)
+- ``Entity`` construction through ``__init__`` and ``model_validate``
+
+Design notes:
+- ``install`` wraps those methods and ``uninstall`` restores them, so the
+  library carries no instrumentation cost when the tracker is not in use.
+  Methods defined on classes created after ``install`` are not wrapped.
+- Bytes are the change in ``tracemalloc``'s traced memory across the call,
+  i.e., what the call allocated and kept. Nested measurements of the same
+  site on one thread count once, at the outermost call.
+- ``measure_hydration`` is the benchmark mode: it builds objects in a loop
+  and reports the traced peak or the process peak RSS per 100k objects.
+
+Usage:
+    with AllocationTracker() as tracker:
+        handle_batch(messages)
+    print(tracker.format_report())
+"""
+
+import functools
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Sized
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Self
+
+from ..commands.task import TaskBase
+from ..commands.task_data import TaskData
+from ..structural.entity import Entity
+from ..structural.repository import EntityRepository
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - depends on the platform
+    resource = None
+
+__all__ = [
+    "AllocationStats",
+    "AllocationTracker",
+    "HydrationStats",
+    "measure_hydration",
+]
+
+_PER_OBJECTS = 100_000
+
+
+def _peak_rss_bytes() -> int:
+    """Return the process peak resident set size in bytes, or 0 if unavailable."""
+    if resource is None:  # pragma: no cover - depends on the platform
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _with_subclasses(cls: type) -> list[type]:
+    found = [cls]
+    for subclass in cls.__subclasses__():
+        found.extend(_with_subclasses(subclass))
+    return found
+
+
+# =========================================================
+# CLASS ALLOCATION STATS
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class AllocationStats:
+    """Totals for one hydration site and model class."""
+
+    site: str
+    model: str
+    calls: int
+    objects: int
+    bytes: int
+
+    @property
+    def bytes_per_object(self) -> float:
+        return self.bytes / self.objects if self.objects else 0.0
+
+
+# =========================================================
+# CLASS ALLOCATION TRACKER
+# =========================================================
+class AllocationTracker:
+    """Instrumentation mode that attributes retained allocations to model classes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._totals: dict[tuple[str, str], list[int]] = {}
+        self._patches: list[tuple[type, str, Any]] = []
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> Self:
+        self.install()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.uninstall()
+
+    @property
+    def installed(self) -> bool:
+        return bool(self._patches)
+
+    def install(self) -> None:
+        """Start ``tracemalloc`` if needed and wrap the hydration methods."""
+        if self.installed:
+            raise RuntimeError("AllocationTracker is already installed.")
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        for cls in _with_subclasses(TaskData):
+            if "from_payload" in vars(cls):
+                self._patch_classmethod(cls, "from_payload", "TaskData.from_payload", None)
+        self._patch(TaskBase, "__init__", "TaskBase.__init__", lambda task, _: task.task_data)
+        for cls in _with_subclasses(EntityRepository):
+            if "list" in vars(cls):
+                self._patch(cls, "list", "EntityRepository.list", lambda _, result: result)
+        self._patch(Entity, "__init__", "Entity.__init__", lambda entity, _: entity)
+        self._patch_classmethod(Entity, "model_validate", "Entity.model_validate", None)
+
+    def uninstall(self) -> None:
+        """Restore the wrapped methods and stop ``tracemalloc`` if ``install`` started it."""
+        for cls, name, original in reversed(self._patches):
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._patches.clear()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def report(self) -> list[AllocationStats]:
+        """Return totals per site and model class, largest first."""
+        with self._lock:
+            stats = [
+                AllocationStats(site, model, calls, objects, size)
+                for (site, model), (calls, objects, size) in self._totals.items()
+            ]
+        return sorted(stats, key=lambda entry: entry.bytes, reverse=True)
+
+    def format_report(self) -> str:
+        """Return the report as a text table."""
+        lines = [f"{'site':<24} {'model':<28} {'calls':>8} {'objects':>9} {'KiB':>10} {'B/obj':>8}"]
+        for entry in self.report():
+            lines.append(
+                f"{entry.site:<24} {entry.model:<28} {entry.calls:>8} {entry.objects:>9} "
+                f"{entry.bytes / 1024:>10.1f} {entry.bytes_per_object:>8.0f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Discard every recorded measurement."""
+        with self._lock:
+            self._totals.clear()
+
+    def _patch(
+        self,
+        cls: type,
+        name: str,
+        site: str,
+        produced: Callable[[Any, Any], Any] | None,
+    ) -> None:
+        original = vars(cls).get(name)
+        method = getattr(cls, name)
+
+        @functools.wraps(method)
+        def wrapper(self_: Any, *args: Any, **kwargs: Any) -> Any:
+            return self._measure(site, produced, method, self_, *args, **kwargs)
+
+        self._patches.append((cls, name, original))
+        setattr(cls, name, wrapper)
+
+    def _patch_classmethod(
+        self,
+        cls: type,
+        name: str,
+        site: str,
+        produced: Callable[[Any, Any], Any] | None,
+    ) -> None:
+        original = vars(cls).get(name)
+        function = getattr(cls, name).__func__
+
+        @functools.wraps(function)
+        def wrapper(cls_: type, *args: Any, **kwargs: Any) -> Any:
+            return self._measure(site, produced, function, cls_, *args, **kwargs)
+
+        self._patches.append((cls, name, original))
+        setattr(cls, name, classmethod(wrapper))
+
+    def _measure(
+        self,
+        site: str,
+        produced: Callable[[Any, Any], Any] | None,
+        function: Callable[..., Any],
+        first: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        active: set[str] = self._local.__dict__.setdefault("active", set())
+        if site in active:
+            return function(first, *args, **kwargs)
+        active.add(site)
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            result = function(first, *args, **kwargs)
+        finally:
+            active.discard(site)
+        size = tracemalloc.get_traced_memory()[0] - before
+        output = result if produced is None else produced(first, result)
+        if isinstance(output, Sized) and not isinstance(output, Entity | TaskData):
+            items = list(output)  # type: ignore[call-overload]
+            model = type(items[0]).__qualname__ if items else "-"
+            objects = len(items)
+        else:
+            model = type(output).__qualname__
+            objects = 1
+        with self._lock:
+            totals = self._totals.setdefault((site, model), [0, 0, 0])
+            totals[0] += 1
+            totals[1] += objects
+            totals[2] += size
+        return result
+
+
+# =========================================================
+# CLASS HYDRATION STATS
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class HydrationStats:
+    """Memory cost of building ``objects`` objects, scaled per 100k objects."""
+
+    objects: int
+    seconds: float
+    traced_peak_bytes: int
+    rss_growth_bytes: int
+
+    @property
+    def traced_peak_per_100k(self) -> float:
+        return self.traced_peak_bytes * _PER_OBJECTS / self.objects
+
+    @property
+    def rss_growth_per_100k(self) -> float:
+        return self.rss_growth_bytes * _PER_OBJECTS / self.objects
+
+
+def measure_hydration(
+    build: Callable[[int], Any],
+    *,
+    count: int = _PER_OBJECTS,
+    objects_per_call: int = 1,
+    trace: bool = True,
+) -> HydrationStats:
+    """Call ``build(i)`` ``count`` times, keeping every result alive, and measure memory.
+
+    Set ``objects_per_call`` when ``build`` returns a batch, e.g., a
+    repository ``list``. ``tracemalloc`` inflates RSS, so measure RSS with
+    ``trace=False``. Peak RSS only grows; run each measurement in a fresh
+    process (see ``benchmarks/bench_hydration_memory.py``).
+    """
+    if count < 1 or objects_per_call < 1:
+        raise ValueError("count and objects_per_call must be at least 1.")
+    started = trace and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    if trace:
+        tracemalloc.reset_peak()
+        traced_before = tracemalloc.get_traced_memory()[0]
+    rss_before = _peak_rss_bytes()
+    start = time.perf_counter()
+    try:
+        kept = [build(index) for index in range(count)]
+        seconds = time.perf_counter() - start
+        traced_peak = tracemalloc.get_traced_memory()[1] - traced_before if trace else 0
+        rss_growth = _peak_rss_bytes() - rss_before
+    finally:
+        if started:
+            tracemalloc.stop()
+    del kept
+    return HydrationStats(count * objects_per_call, seconds, traced_peak, rss_growth)
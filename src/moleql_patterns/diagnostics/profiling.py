@@ -0,0 +1,302 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Opt-in sampling profiler for operation and task hot paths.
+
+``Profiler`` records stack samples for a fraction of calls and aggregates
+them per label, usually the operation or task class name. The output is in
+collapsed-stack format (``frame;frame;frame count``), which flamegraph.pl,
+speedscope, and inferno read directly.
+
+Design notes:
+- ``sample_rate`` selects which calls are profiled. Selected calls register
+  their thread with a background sampler that records the thread's stack
+  every ``interval`` seconds, trimmed to frames below the profiled call.
+- Calls that are not selected, or any call while ``enabled`` is False, cost
+  one random draw or one attribute check. Nothing is installed globally:
+  with no profiler wired in, the overhead is zero.
+- The sampler reads ``sys._current_frames()``, so it profiles synchronous
+  code such as ``APIOperation.execute`` and ``Task.run``. Samples taken on
+  an event loop thread would mix coroutines and are not attributed, so
+  ``async_profiling_middleware`` and ``profiled`` on ``async def`` methods
+  record only calls and wall time.
+- Calls shorter than ``interval`` are counted but may get no samples;
+  statistical coverage builds up over many calls.
+
+Usage:
+    profiler = Profiler(sample_rate=0.01)
+    register_middleware(profiling_middleware(profiler))
+    register_async_middleware(async_profiling_middleware(profiler))
+
+    with profiler.profile("SendEmailTask"):
+        task.run()
+
+    profiler.dump("profile.folded")
+"""
+
+import contextlib
+import functools
+import inspect
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from os import PathLike
+from types import FrameType
+from typing import IO, Any
+
+__all__ = [
+    "ProfileStats",
+    "Profiler",
+    "async_profiling_middleware",
+    "profiled",
+    "profiling_middleware",
+]
+
+
+def _frame_name(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}"
+
+
+def _collapse(leaf: FrameType, root: FrameType | None) -> list[str]:
+    """Return frame names from just below ``root`` down to ``leaf``."""
+    names: list[str] = []
+    frame: FrameType | None = leaf
+    while frame is not None and frame is not root:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+# =========================================================
+# CLASS PROFILE STATS
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class ProfileStats:
+    """Totals for one label: profiled calls, their wall time, and stack samples."""
+
+    calls: int
+    seconds: float
+    samples: int
+
+
+# =========================================================
+# CLASS PROFILER
+# =========================================================
+class Profiler:
+    """Sampling profiler that aggregates collapsed stacks per label."""
+
+    def __init__(
+        self,
+        *,
+        sample_rate: float = 1.0,
+        interval: float = 0.001,
+        enabled: bool = True,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1.")
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.enabled = enabled
+        self._rng = rng
+        self._lock = threading.Lock()
+        self._active: dict[int, tuple[str, FrameType | None]] = {}
+        self._sampler: threading.Thread | None = None
+        self._stacks: dict[str, Counter[str]] = {}
+        self._calls: Counter[str] = Counter()
+        self._seconds: Counter[str] = Counter()
+
+    def should_sample(self) -> bool:
+        """Return True if the next call should be profiled."""
+        return self.enabled and (self.sample_rate >= 1.0 or self._rng() < self.sample_rate)
+
+    def profile(self, label: str) -> contextlib.AbstractContextManager[None]:
+        """Profile the block under ``label`` if this call is selected."""
+        if not self.should_sample():
+            return contextlib.nullcontext()
+        return self.record(label, sys._getframe(1))
+
+    @contextlib.contextmanager
+    def record(self, label: str, root: FrameType | None = None) -> Iterator[None]:
+        """Profile the block unconditionally.
+
+        Stacks are trimmed to frames below ``root``; pass the caller's frame
+        to leave out the framework frames above it.
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            outer = thread_id in self._active
+            if not outer:
+                self._active[thread_id] = (label, root)
+            if self._sampler is None:
+                self._sampler = threading.Thread(
+                    target=self._sample_loop, name="moleql-profiler", daemon=True
+                )
+                self._sampler.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if not outer:
+                with self._lock:
+                    del self._active[thread_id]
+            self.add_call(label, elapsed)
+
+    def add_call(self, label: str, seconds: float) -> None:
+        """Count one call of ``seconds`` wall time under ``label``, without stack samples."""
+        with self._lock:
+            self._calls[label] += 1
+            self._seconds[label] += seconds
+
+    def _sample_loop(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._sampler = None
+                    return
+                active = dict(self._active)
+            frames = sys._current_frames()
+            samples = []
+            for thread_id, (label, root) in active.items():
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    samples.append((label, ";".join([label, *_collapse(frame, root)])))
+            del frames
+            with self._lock:
+                for label, stack in samples:
+                    self._stacks.setdefault(label, Counter())[stack] += 1
+            time.sleep(self.interval)
+
+    def stats(self) -> dict[str, ProfileStats]:
+        """Return totals per label."""
+        with self._lock:
+            return {
+                label: ProfileStats(
+                    calls=calls,
+                    seconds=self._seconds[label],
+                    samples=self._stacks[label].total() if label in self._stacks else 0,
+                )
+                for label, calls in self._calls.items()
+            }
+
+    def collapsed(self, label: str | None = None) -> str:
+        """Return samples in collapsed-stack format, for one label or all of them."""
+        with self._lock:
+            lines = sorted(
+                f"{stack} {count}"
+                for name, counter in self._stacks.items()
+                if label is None or name == label
+                for stack, count in counter.items()
+            )
+        return "".join(f"{line}\n" for line in lines)
+
+    def dump(self, target: str | PathLike[str] | IO[str], label: str | None = None) -> None:
+        """Write collapsed stacks to a path or text file object."""
+        output = self.collapsed(label)
+        if isinstance(target, str | PathLike):
+            with open(target, "w", encoding="utf-8") as file:
+                file.write(output)
+        else:
+            target.write(output)
+
+    def reset(self) -> None:
+        """Discard every recorded call and sample."""
+        with self._lock:
+            self._stacks.clear()
+            self._calls.clear()
+            self._seconds.clear()
+
+
+def profiling_middleware(profiler: Profiler) -> Callable[[Callable[[Any], Any], Any], Any]:
+    """Return an operation middleware that profiles calls per operation class."""
+
+    def profile_operation(call_next: Callable[[Any], Any], operation: Any) -> Any:
+        if not profiler.should_sample():
+            return call_next(operation)
+        with profiler.record(type(operation).__qualname__, sys._getframe()):
+            return call_next(operation)
+
+    return profile_operation
+
+
+def async_profiling_middleware(
+    profiler: Profiler,
+) -> Callable[[Callable[[Any], Awaitable[Any]], Any], Awaitable[Any]]:
+    """Return an async operation middleware that counts calls and wall time per class.
+
+    Async operations get no stack samples; see the module notes.
+    """
+
+    async def profile_operation(call_next: Callable[[Any], Awaitable[Any]], operation: Any) -> Any:
+        if not profiler.should_sample():
+            return await call_next(operation)
+        start = time.perf_counter()
+        try:
+            return await call_next(operation)
+        finally:
+            profiler.add_call(type(operation).__qualname__, time.perf_counter() - start)
+
+    return profile_operation
+
+
+def profiled[**P, R](profiler: Profiler) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a method so calls are profiled under the class of ``self``.
+
+    Use it on ``Task.exec`` or ``Task.run``; the label is the task class name.
+    On ``async def`` methods, e.g., ``AsyncTask.exec``, the wrapper awaits the
+    call and records its calls and wall time.
+    """
+
+    def decorate(method: Callable[P, R]) -> Callable[P, R]:
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                if not profiler.should_sample():
+                    return await method(*args, **kwargs)  # type: ignore[misc]
+                start = time.perf_counter()
+                try:
+                    return await method(*args, **kwargs)  # type: ignore[misc]
+                finally:
+                    profiler.add_call(type(args[0]).__qualname__, time.perf_counter() - start)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(method)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not profiler.should_sample():
+                return method(*args, **kwargs)
+            with profiler.record(type(args[0]).__qualname__, sys._getframe()):
+                return method(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
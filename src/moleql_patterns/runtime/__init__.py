@@ -0,0 +1,104 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .idempotency import (
+        IdempotencyRecord,
+        IdempotencyStore,
+        IdempotentRunner,
+        InMemoryIdempotencyStore,
+        SQLiteIdempotencyStore,
+        TaskInProgressError,
+    )
+    from .process_pool import ProcessPoolTaskExecutor
+    from .scheduler import ScheduledTask, SchedulerClassStats, TaskScheduler
+    from .task_queue import QueuedTask, SQLiteTaskQueue, TaskQueue
+    from .workflow import (
+        InMemoryWorkflowStore,
+        SQLiteWorkflowStore,
+        Workflow,
+        WorkflowRunner,
+        WorkflowStep,
+        WorkflowStepError,
+        WorkflowStore,
+    )
+
+__all__ = [
+    "QueuedTask",
+    "TaskQueue",
+    "SQLiteTaskQueue",
+    "ScheduledTask",
+    "SchedulerClassStats",
+    "TaskScheduler",
+    "ProcessPoolTaskExecutor",
+    "IdempotencyRecord",
+    "IdempotencyStore",
+    "IdempotentRunner",
+    "InMemoryIdempotencyStore",
+    "SQLiteIdempotencyStore",
+    "TaskInProgressError",
+    "Workflow",
+    "WorkflowStep",
+    "WorkflowRunner",
+    "WorkflowStepError",
+    "WorkflowStore",
+    "InMemoryWorkflowStore",
+    "SQLiteWorkflowStore",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".idempotency": (
+            "IdempotencyRecord",
+            "IdempotencyStore",
+            "IdempotentRunner",
+            "InMemoryIdempotencyStore",
+            "SQLiteIdempotencyStore",
+            "TaskInProgressError",
+        ),
+        ".process_pool": ("ProcessPoolTaskExecutor",),
+        ".scheduler": (
+            "ScheduledTask",
+            "SchedulerClassStats",
+            "TaskScheduler",
+        ),
+        ".task_queue": (
+            "QueuedTask",
+            "SQLiteTaskQueue",
+            "TaskQueue",
+        ),
+        ".workflow": (
+            "InMemoryWorkflowStore",
+            "SQLiteWorkflowStore",
+            "Workflow",
+            "WorkflowRunner",
+            "WorkflowStep",
+            "WorkflowStepError",
+            "WorkflowStore",
+        ),
+    },
+)
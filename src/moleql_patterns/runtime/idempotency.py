@@ -0,0 +1,333 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Idempotent task execution for at-least-once brokers.
+
+Brokers may deliver the same task more than once. ``IdempotentRunner`` keys
+each execution on the task class, ``TaskData.correlation_id``, and a digest of
+the payload. The first delivery takes a lease and runs the task; later
+deliveries return the stored result instead of running it again.
+
+Design notes:
+- ``IdempotencyStore`` is the backend contract. ``InMemoryIdempotencyStore``
+  serves a single process; ``SQLiteIdempotencyStore`` is durable and can be
+  shared by processes on one host.
+- A lease expires after ``lease_ttl`` seconds so a crashed worker does not
+  block the key forever. A duplicate that arrives while the lease is held
+  raises ``TaskInProgressError``; the broker should redeliver it later.
+- Completed results expire after ``result_ttl`` seconds.
+- ``SQLiteIdempotencyStore`` stores results as JSON, so a pydantic model
+  result is returned as a plain dictionary on duplicate deliveries. Bytes are
+  stored as base64 text, and values JSON cannot represent are stored as their
+  ``repr`` so the task is not run again.
+- If storing the result fails anyway, the lease is released and the error is
+  raised, so the key is not blocked until the lease expires.
+- ``run_async`` calls the store from a worker thread so a blocking store does
+  not stall the event loop.
+
+Usage:
+    runner = IdempotentRunner(SQLiteIdempotencyStore("idempotency.db"), result_ttl=86400)
+    result = runner.run(ChargeCardTask(payload, gateway))
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from os import PathLike
+from types import TracebackType
+from typing import Any, Literal, Self
+
+from pydantic_core import to_json
+
+from ..commands.task import AsyncTask, Task, TaskBase
+from ..commands.task_data import FrozenTaskData, payload_digest
+
+__all__ = [
+    "IdempotencyRecord",
+    "IdempotencyStore",
+    "IdempotentRunner",
+    "InMemoryIdempotencyStore",
+    "SQLiteIdempotencyStore",
+    "TaskInProgressError",
+]
+
+
+# =========================================================
+# CLASS TASK IN PROGRESS ERROR
+# =========================================================
+class TaskInProgressError(RuntimeError):
+    """Raised when a duplicate delivery arrives while the original still runs."""
+
+
+# =========================================================
+# CLASS IDEMPOTENCY RECORD
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """Outcome of an ``IdempotencyStore.acquire`` call."""
+
+    state: Literal["acquired", "in_progress", "completed"]
+    token: str | None = None
+    result: Any = None
+
+
+# =========================================================
+# CLASS IDEMPOTENCY STORE
+# =========================================================
+class IdempotencyStore(ABC):
+    """Backend contract for leases and completed results."""
+
+    @abstractmethod
+    def acquire(self, key: str, lease_ttl: float) -> IdempotencyRecord:
+        """Take a lease on ``key``, or report that it is running or completed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, key: str, token: str, result: Any, ttl: float) -> bool:
+        """Store the result for a leased key. Return False if the lease was lost."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, key: str, token: str) -> None:
+        """Drop a lease so the key can run again (e.g., after a failure)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Delete expired leases and results and return how many were removed."""
+        raise NotImplementedError
+
+
+# =========================================================
+# CLASS IN MEMORY IDEMPOTENCY STORE
+# =========================================================
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """Process-local ``IdempotencyStore``. Results are kept as Python objects."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[str, str, float, Any]] = {}
+
+    def acquire(self, key: str, lease_ttl: float) -> IdempotencyRecord:
+        """Take a lease on ``key`` unless a live lease or result exists."""
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] > now:
+                state, _, _, result = entry
+                if state == "completed":
+                    return IdempotencyRecord("completed", result=result)
+                return IdempotencyRecord("in_progress")
+            token = uuid.uuid4().hex
+            self._entries[key] = ("acquired", token, now + lease_ttl, None)
+            return IdempotencyRecord("acquired", token=token)
+
+    def complete(self, key: str, token: str, result: Any, ttl: float) -> bool:
+        """Store the result if ``token`` still holds the lease."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != token:
+                return False
+            self._entries[key] = ("completed", token, self._clock() + ttl, result)
+            return True
+
+    def release(self, key: str, token: str) -> None:
+        """Drop the lease held by ``token``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == token and entry[0] == "acquired":
+                del self._entries[key]
+
+    def purge_expired(self) -> int:
+        """Delete expired entries."""
+        with self._lock:
+            now = self._clock()
+            expired = [key for key, entry in self._entries.items() if entry[2] <= now]
+            for key in expired:
+                del self._entries[key]
+            return len(expired)
+
+
+# =========================================================
+# CLASS SQLITE IDEMPOTENCY STORE
+# =========================================================
+class SQLiteIdempotencyStore(IdempotencyStore):
+    """Durable ``IdempotencyStore`` backed by SQLite in WAL mode."""
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS idempotency_keys ("
+        " key TEXT PRIMARY KEY,"
+        " token TEXT NOT NULL,"
+        " state TEXT NOT NULL,"
+        " result BLOB,"
+        " expires_at REAL NOT NULL"
+        ")"
+    )
+    _SELECT = "SELECT state, result, expires_at FROM idempotency_keys WHERE key = ?"
+    _LEASE = (
+        "INSERT OR REPLACE INTO idempotency_keys (key, token, state, result, expires_at)"
+        " VALUES (?, ?, 'acquired', NULL, ?)"
+    )
+    _COMPLETE = (
+        "UPDATE idempotency_keys SET state = 'completed', result = ?, expires_at = ?"
+        " WHERE key = ? AND token = ?"
+    )
+    _RELEASE = "DELETE FROM idempotency_keys WHERE key = ? AND token = ? AND state = 'acquired'"
+    _PURGE = "DELETE FROM idempotency_keys WHERE expires_at <= ?"
+
+    def __init__(
+        self,
+        database: str | PathLike[str],
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA busy_timeout=5000")
+        self._connection.execute(self._SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def acquire(self, key: str, lease_ttl: float) -> IdempotencyRecord:
+        """Take a lease on ``key`` unless a live lease or result exists."""
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            now = self._clock()
+            row = self._connection.execute(self._SELECT, (key,)).fetchone()
+            if row is not None and row[2] > now:
+                state, result, _ = row
+                if state == "completed":
+                    return IdempotencyRecord("completed", result=json.loads(result))
+                return IdempotencyRecord("in_progress")
+            token = uuid.uuid4().hex
+            self._connection.execute(self._LEASE, (key, token, now + lease_ttl))
+            return IdempotencyRecord("acquired", token=token)
+
+    def complete(self, key: str, token: str, result: Any, ttl: float) -> bool:
+        """Store the JSON-encoded result if ``token`` still holds the lease."""
+        encoded = to_json(result, bytes_mode="base64", fallback=repr)
+        with self._lock:
+            cursor = self._connection.execute(
+                self._COMPLETE, (encoded, self._clock() + ttl, key, token)
+            )
+        return cursor.rowcount == 1
+
+    def release(self, key: str, token: str) -> None:
+        """Drop the lease held by ``token``."""
+        with self._lock:
+            self._connection.execute(self._RELEASE, (key, token))
+
+    def purge_expired(self) -> int:
+        """Delete expired leases and results."""
+        with self._lock:
+            cursor = self._connection.execute(self._PURGE, (self._clock(),))
+        return cursor.rowcount
+
+
+# =========================================================
+# CLASS IDEMPOTENT RUNNER
+# =========================================================
+class IdempotentRunner:
+    """Run tasks at most once per correlation id and payload."""
+
+    def __init__(
+        self,
+        store: IdempotencyStore,
+        *,
+        result_ttl: float = 24 * 60 * 60,
+        lease_ttl: float = 5 * 60,
+    ) -> None:
+        self._store = store
+        self._result_ttl = result_ttl
+        self._lease_ttl = lease_ttl
+
+    @staticmethod
+    def key_for(task: TaskBase[Any]) -> str:
+        """Return the idempotency key for ``task``."""
+        data = task.task_data
+        digest = (
+            data.content_hash()
+            if isinstance(data, FrozenTaskData)
+            else payload_digest(data.to_payload())
+        )
+        cls = type(task)
+        return f"{cls.__module__}.{cls.__qualname__}:{data.correlation_id}:{digest}"
+
+    def run(self, task: Task[Any]) -> Any:
+        """Run ``task`` unless an identical delivery already ran or is running."""
+        key = self.key_for(task)
+        record = self._store.acquire(key, self._lease_ttl)
+        token = self._lease_token(record)
+        if token is None:
+            return record.result
+        try:
+            result = task.run()
+            self._store.complete(key, token, result, self._result_ttl)
+        except BaseException:
+            self._store.release(key, token)
+            raise
+        return result
+
+    async def run_async(self, task: AsyncTask[Any]) -> Any:
+        """Async variant of ``run`` for ``AsyncTask`` instances."""
+        key = self.key_for(task)
+        record = await asyncio.to_thread(self._store.acquire, key, self._lease_ttl)
+        token = self._lease_token(record)
+        if token is None:
+            return record.result
+        try:
+            result = await task.run()
+            await asyncio.to_thread(self._store.complete, key, token, result, self._result_ttl)
+        except BaseException:
+            await asyncio.shield(asyncio.to_thread(self._store.release, key, token))
+            raise
+        return result
+
+    @staticmethod
+    def _lease_token(record: IdempotencyRecord) -> str | None:
+        if record.state == "in_progress":
+            raise TaskInProgressError("An identical task delivery is already running.")
+        return record.token
@@ -0,0 +1,224 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Process-pool execution for CPU-bound tasks.
+
+``ProcessPoolTaskExecutor`` runs ``Task`` and ``AsyncTask`` subclasses in
+worker processes so CPU-heavy work is not serialized by the GIL. Task
+instances are never pickled: only a reference to the task class and the
+task payload cross the process boundary.
+
+Design notes:
+- Dependencies are built once per worker process by ``dependency_factory``
+  and cached there. Each task receives the dependencies whose names match
+  its ``__init__`` parameters.
+- Top-level ``bytes`` payload fields at or above ``shared_memory_threshold``
+  are copied into ``multiprocessing.shared_memory`` blocks instead of being
+  pickled. The parent unlinks each block once its task finishes.
+- Task classes must be importable by the worker (module-level, not local).
+- Tasks run through ``run``, so execution policies and rate limits apply.
+
+Usage:
+    def build_dependencies() -> dict[str, Any]:
+        return {"renderer": PdfRenderer()}
+
+    with ProcessPoolTaskExecutor(max_workers=4, dependency_factory=build_dependencies) as pool:
+        future = pool.submit(RenderReportTask, data.to_payload())
+        pdf = future.result()
+"""
+
+import asyncio
+import importlib
+import inspect
+import os
+import sys
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import cache
+from multiprocessing import resource_tracker
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any, Self
+
+from ..commands.task import AsyncTask, TaskBase
+
+__all__ = ["ProcessPoolTaskExecutor"]
+
+type DependencyFactory = Callable[[], Mapping[str, Any]]
+
+_worker_dependencies: dict[str, Any] = {}
+
+
+# =========================================================
+# CLASS PROCESS POOL TASK EXECUTOR
+# =========================================================
+class ProcessPoolTaskExecutor:
+    """Run tasks in a pool of worker processes with per-process dependencies."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        dependency_factory: DependencyFactory | None = None,
+        shared_memory_threshold: int = 1024 * 1024,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        self._shared_memory_threshold = shared_memory_threshold
+        if os.name == "posix":
+            # Start the tracker before any worker exists so every worker inherits it
+            # instead of starting its own and unlinking shared blocks on exit.
+            resource_tracker.ensure_running()
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_initialize_worker,
+            initargs=(dependency_factory,),
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    def submit(self, task_cls: type[TaskBase], payload: Mapping[str, Any]) -> Future[Any]:
+        """Schedule ``task_cls`` with ``payload`` and return a future for its result."""
+        task_ref = _task_reference(task_cls)
+        inline, blocks = self._share_large_fields(payload)
+        try:
+            future = self._pool.submit(
+                _run_task,
+                task_ref,
+                inline,
+                tuple((field, block.name, size) for field, block, size in blocks),
+            )
+        except BaseException:
+            _release(blocks)
+            raise
+        if blocks:
+            future.add_done_callback(lambda _: _release(blocks))
+        return future
+
+    async def submit_async(self, task_cls: type[TaskBase], payload: Mapping[str, Any]) -> Any:
+        """Await the result of ``task_cls`` run in a worker process."""
+        return await asyncio.wrap_future(self.submit(task_cls, payload))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        self._pool.shutdown(wait=wait)
+
+    def _share_large_fields(
+        self, payload: Mapping[str, Any]
+    ) -> tuple[dict[str, Any], list[tuple[str, SharedMemory, int]]]:
+        inline: dict[str, Any] = {}
+        blocks: list[tuple[str, SharedMemory, int]] = []
+        try:
+            for field, value in payload.items():
+                if (
+                    isinstance(value, bytes | bytearray | memoryview)
+                    and len(value) >= self._shared_memory_threshold
+                ):
+                    size = len(value)
+                    block = SharedMemory(create=True, size=size)
+                    block.buf[:size] = value
+                    blocks.append((field, block, size))
+                else:
+                    inline[field] = value
+        except BaseException:
+            _release(blocks)
+            raise
+        return inline, blocks
+
+
+def _task_reference(task_cls: type[TaskBase]) -> str:
+    """Return the importable ``module:qualname`` reference for a task class."""
+    if "<locals>" in task_cls.__qualname__:
+        raise TypeError("Tasks run in a process pool must be defined at module level.")
+    return f"{task_cls.__module__}:{task_cls.__qualname__}"
+
+
+@cache
+def _resolve_task_reference(task_ref: str) -> type[TaskBase]:
+    """Import the task class named by ``_task_reference``."""
+    module_name, _, qualname = task_ref.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+@cache
+def _injectable_parameters(task_cls: type[TaskBase]) -> frozenset[str] | None:
+    parameters = inspect.signature(task_cls.__init__).parameters.values()
+    if any(parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    return frozenset(parameter.name for parameter in parameters)
+
+
+def _initialize_worker(dependency_factory: DependencyFactory | None) -> None:
+    _worker_dependencies.clear()
+    if dependency_factory is not None:
+        _worker_dependencies.update(dependency_factory())
+
+
+def _run_task(
+    task_ref: str, payload: dict[str, Any], shared_fields: tuple[tuple[str, str, int], ...]
+) -> Any:
+    task_cls = _resolve_task_reference(task_ref)
+    for field, name, size in shared_fields:
+        payload[field] = _read_shared(name, size)
+    accepted = _injectable_parameters(task_cls)
+    dependencies = (
+        _worker_dependencies
+        if accepted is None
+        else {name: value for name, value in _worker_dependencies.items() if name in accepted}
+    )
+    task = task_cls(payload, **dependencies)
+    if isinstance(task, AsyncTask):
+        return asyncio.run(task.run())
+    return task.run()
+
+
+def _read_shared(name: str, size: int) -> bytes:
+    # Workers share the parent's resource tracker (started before the pool), which
+    # already tracks the block; the parent unlinks it once the task is done.
+    block = (
+        SharedMemory(name=name, track=False)
+        if sys.version_info >= (3, 13)
+        else SharedMemory(name=name)
+    )
+    try:
+        return bytes(block.buf[:size])
+    finally:
+        block.close()
+
+
+def _release(blocks: list[tuple[str, SharedMemory, int]]) -> None:
+    for _, block, _ in blocks:
+        block.close()
+        block.unlink()
@@ -0,0 +1,319 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Priority and fair-share scheduling across task classes.
+
+``TaskScheduler`` sits between a queue consumer and a worker pool. Producers
+submit task payloads keyed by task class; workers pull the next task to run.
+It prevents a flood of bulk tasks from starving latency-sensitive ones.
+
+Design notes:
+- Classes are grouped into strict priority tiers. A lower tier is served only
+  when no higher tier has a dispatchable task.
+- Within a tier, classes share capacity by deficit round-robin (DRR) using
+  their ``weight`` as the quantum. A class with weight 3 gets three dispatches
+  for every one of a class with weight 1 while both are backlogged.
+- ``max_concurrency`` caps in-flight tasks per class. Workers must call
+  ``complete`` for every dispatched task to release its slot.
+- A task class without its own settings inherits the settings registered for
+  its ``task_data_cls``, so a payload type can be scheduled as one unit.
+  Tasks submitted before that ``task_data_cls`` is configured are moved to
+  its queue when it is.
+
+Usage:
+    scheduler = TaskScheduler()
+    scheduler.configure(ChargeCardTask, priority=10, max_concurrency=8)
+    scheduler.configure(ReportData, weight=0.5)
+
+    scheduler.submit(ChargeCardTask, payload)
+    scheduled = scheduler.next(timeout=1.0)
+    if scheduled is not None:
+        try:
+            build_task(scheduled.task_cls, scheduled.payload).run()
+        finally:
+            scheduler.complete(scheduled)
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = ["ScheduledTask", "SchedulerClassStats", "TaskScheduler"]
+
+
+# =========================================================
+# CLASS SCHEDULED TASK
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class ScheduledTask:
+    """A task payload dispatched by the scheduler."""
+
+    task_cls: type
+    payload: dict[str, Any]
+    schedule_key: type
+    enqueued_at: float
+    dispatched_at: float
+
+    @property
+    def wait_time(self) -> float:
+        """Return the seconds the task spent queued."""
+        return self.dispatched_at - self.enqueued_at
+
+
+# =========================================================
+# CLASS SCHEDULER CLASS STATS
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class SchedulerClassStats:
+    """Point-in-time metrics for one scheduling class."""
+
+    priority: int
+    weight: float
+    max_concurrency: int | None
+    queue_depth: int
+    in_flight: int
+    dispatched: int
+    total_wait_time: float
+    max_wait_time: float
+
+    @property
+    def average_wait_time(self) -> float:
+        """Return the mean queue wait of dispatched tasks."""
+        return self.total_wait_time / self.dispatched if self.dispatched else 0.0
+
+
+# =========================================================
+# CLASS CLASS QUEUE
+# =========================================================
+@dataclass(slots=True)
+class _ClassQueue:
+    key: type
+    priority: int
+    weight: float
+    max_concurrency: int | None
+    implicit: bool = False
+    pending: deque[tuple[type, dict[str, Any], float]] = field(default_factory=deque)
+    deficit: float = 0.0
+    in_flight: int = 0
+    dispatched: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.pending) and (
+            self.max_concurrency is None or self.in_flight < self.max_concurrency
+        )
+
+
+# =========================================================
+# CLASS TIER
+# =========================================================
+@dataclass(slots=True)
+class _Tier:
+    rotation: deque[_ClassQueue] = field(default_factory=deque)
+    head_credited: bool = False
+
+
+# =========================================================
+# CLASS TASK SCHEDULER
+# =========================================================
+class TaskScheduler:
+    """Thread-safe scheduler with priority tiers and weighted fair sharing."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._queues: dict[type, _ClassQueue] = {}
+        self._tiers: dict[int, _Tier] = {}
+        self._priorities: list[int] = []
+        self._resolved: dict[type, _ClassQueue] = {}
+
+    def configure(
+        self,
+        key: type,
+        *,
+        priority: int = 0,
+        weight: float = 1.0,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Register scheduling settings for a task class or a ``task_data_cls``."""
+        if weight <= 0:
+            raise ValueError("weight must be positive.")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        with self._condition:
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = _ClassQueue(key, priority, weight, max_concurrency)
+                self._queues[key] = queue
+            else:
+                self._detach(queue)
+                queue.priority = priority
+                queue.weight = weight
+                queue.max_concurrency = max_concurrency
+                queue.implicit = False
+            self._tier(priority).rotation.append(queue)
+            self._resolved.clear()
+            self._merge_implicit_queues()
+            self._condition.notify_all()
+
+    def submit(self, task_cls: type, payload: dict[str, Any]) -> None:
+        """Queue a payload for ``task_cls``."""
+        with self._condition:
+            queue = self._resolve(task_cls)
+            queue.pending.append((task_cls, payload, self._clock()))
+            self._condition.notify()
+
+    def next(self, timeout: float | None = None) -> ScheduledTask | None:
+        """Return the next task to run, waiting up to ``timeout`` seconds.
+
+        A ``timeout`` of ``0`` never blocks. ``None`` waits indefinitely.
+        """
+        with self._condition:
+            scheduled = self._dispatch()
+            if scheduled is None and timeout != 0:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while scheduled is None:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                    scheduled = self._dispatch()
+            return scheduled
+
+    def complete(self, scheduled: ScheduledTask) -> None:
+        """Release the concurrency slot held by a dispatched task.
+
+        Completing the same task twice does not release a second slot.
+        """
+        with self._condition:
+            queue = self._queues.get(scheduled.schedule_key) or self._resolve(scheduled.task_cls)
+            if queue.in_flight > 0:
+                queue.in_flight -= 1
+            self._condition.notify()
+
+    def stats(self) -> dict[type, SchedulerClassStats]:
+        """Return queue depth, in-flight, and wait-time metrics per class."""
+        with self._condition:
+            return {
+                key: SchedulerClassStats(
+                    priority=queue.priority,
+                    weight=queue.weight,
+                    max_concurrency=queue.max_concurrency,
+                    queue_depth=len(queue.pending),
+                    in_flight=queue.in_flight,
+                    dispatched=queue.dispatched,
+                    total_wait_time=queue.total_wait_time,
+                    max_wait_time=queue.max_wait_time,
+                )
+                for key, queue in self._queues.items()
+            }
+
+    def _tier(self, priority: int) -> _Tier:
+        tier = self._tiers.get(priority)
+        if tier is None:
+            tier = self._tiers[priority] = _Tier()
+            self._priorities = sorted(self._tiers, reverse=True)
+        return tier
+
+    def _resolve(self, task_cls: type) -> _ClassQueue:
+        queue = self._resolved.get(task_cls)
+        if queue is None:
+            queue = self._queues.get(task_cls)
+            if queue is None:
+                queue = self._queues.get(getattr(task_cls, "task_data_cls", None))
+            if queue is None:
+                queue = _ClassQueue(task_cls, 0, 1.0, None, implicit=True)
+                self._queues[task_cls] = queue
+                self._tier(0).rotation.append(queue)
+            self._resolved[task_cls] = queue
+        return queue
+
+    def _merge_implicit_queues(self) -> None:
+        """Move default queues into the ``task_data_cls`` queue configured after them."""
+        for key, queue in list(self._queues.items()):
+            if not queue.implicit:
+                continue
+            target = self._queues.get(getattr(key, "task_data_cls", None))
+            if target is None or target.implicit:
+                continue
+            self._detach(queue)
+            del self._queues[key]
+            target.pending.extend(queue.pending)
+            target.in_flight += queue.in_flight
+            target.dispatched += queue.dispatched
+            target.total_wait_time += queue.total_wait_time
+            target.max_wait_time = max(target.max_wait_time, queue.max_wait_time)
+
+    def _detach(self, queue: _ClassQueue) -> None:
+        tier = self._tiers[queue.priority]
+        if tier.rotation[0] is queue:
+            tier.head_credited = False
+        tier.rotation.remove(queue)
+
+    def _dispatch(self) -> ScheduledTask | None:
+        for priority in self._priorities:
+            tier = self._tiers[priority]
+            if any(queue.ready for queue in tier.rotation):
+                return self._dispatch_from(tier)
+        return None
+
+    def _dispatch_from(self, tier: _Tier) -> ScheduledTask:
+        rotation = tier.rotation
+        while True:
+            head = rotation[0]
+            if not head.ready:
+                if not head.pending:
+                    head.deficit = 0.0
+                self._advance(tier)
+                continue
+            if not tier.head_credited:
+                head.deficit += head.weight
+                tier.head_credited = True
+            if head.deficit < 1.0:
+                self._advance(tier)
+                continue
+            head.deficit -= 1.0
+            task_cls, payload, enqueued_at = head.pending.popleft()
+            if head.deficit < 1.0 or not head.pending:
+                self._advance(tier)
+            return self._record(head, task_cls, payload, enqueued_at)
+
+    def _record(
+        self, queue: _ClassQueue, task_cls: type, payload: dict[str, Any], enqueued_at: float
+    ) -> ScheduledTask:
+        now = self._clock()
+        wait_time = now - enqueued_at
+        queue.in_flight += 1
+        queue.dispatched += 1
+        queue.total_wait_time += wait_time
+        queue.max_wait_time = max(queue.max_wait_time, wait_time)
+        return ScheduledTask(task_cls, payload, queue.key, enqueued_at, now)
+
+    @staticmethod
+    def _advance(tier: _Tier) -> None:
+        tier.rotation.rotate(-1)
+        tier.head_credited = False
@@ -0,0 +1,402 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Workflow (saga) orchestration over ``Task`` and ``AsyncTask`` steps.
+
+A ``Workflow`` is a DAG of named steps. Each step builds a task from a
+payload; ``WorkflowRunner`` runs steps whose dependencies have completed
+concurrently, up to ``max_concurrency`` at a time, and records every step
+output in a ``WorkflowStore``.
+
+Design notes:
+- A step may only depend on steps added before it, so the graph is acyclic
+  by construction and needs no cycle check at run time.
+- ``inputs`` builds a step payload from the workflow payload and the outputs
+  of completed steps. Without it, a step receives the workflow payload.
+- Synchronous ``Task`` steps run in a worker thread (``asyncio.to_thread``) so
+  they do not block the event loop or their sibling branches.
+- Outputs are saved as each step completes. Running the same workflow id
+  again skips the recorded steps, so a crashed workflow resumes after its
+  last completed steps instead of starting over.
+- When a step fails, no new steps start. Steps already running finish, then
+  completed steps are compensated one at a time in reverse completion
+  order, and ``WorkflowStepError`` is raised. A compensated step is removed
+  from the store; steps without ``compensate`` or whose compensation failed
+  stay recorded. A failing ``inputs`` callable or a store that cannot save a
+  step output fails the workflow the same way.
+- Store calls run in a worker thread so a blocking store (e.g., SQLite)
+  does not stall the event loop.
+- ``SQLiteWorkflowStore`` stores outputs as JSON, so a pydantic model output
+  is returned as a plain dictionary when a workflow resumes.
+
+Usage:
+    checkout = (
+        Workflow("checkout")
+        .step("reserve", lambda p: ReserveStockTask(p, inventory),
+              compensate=lambda p, _: ReleaseStockTask(p, inventory))
+        .step("charge", lambda p: ChargeCardTask(p, gateway),
+              compensate=lambda p, out: RefundTask({**p, "charge_id": out["id"]}, gateway))
+        .step("ship", lambda p: ShipOrderTask(p, carrier), after=("reserve", "charge"))
+    )
+    runner = WorkflowRunner(SQLiteWorkflowStore("workflows.db"), max_concurrency=4)
+    outputs = await runner.run(checkout, order_id, payload)
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from os import PathLike
+from types import TracebackType
+from typing import Any, Self
+
+from pydantic_core import to_json
+
+from ..commands.task import AsyncTask, TaskBase
+
+__all__ = [
+    "InMemoryWorkflowStore",
+    "SQLiteWorkflowStore",
+    "Workflow",
+    "WorkflowRunner",
+    "WorkflowStep",
+    "WorkflowStepError",
+    "WorkflowStore",
+]
+
+type StepFactory = Callable[[dict[str, Any]], TaskBase[Any]]
+type StepInputs = Callable[[dict[str, Any], Mapping[str, Any]], dict[str, Any]]
+type CompensationFactory = Callable[[dict[str, Any], Any], TaskBase[Any]]
+
+
+# =========================================================
+# CLASS WORKFLOW STEP ERROR
+# =========================================================
+class WorkflowStepError(RuntimeError):
+    """Raised when a workflow step fails, after compensation has run.
+
+    ``step`` names the failed step and ``__cause__`` holds its exception.
+    ``compensated`` lists the steps that were rolled back and
+    ``compensation_errors`` maps steps whose compensation failed to the error.
+    """
+
+    def __init__(
+        self,
+        workflow_id: str,
+        step: str,
+        compensated: list[str],
+        compensation_errors: dict[str, BaseException],
+    ) -> None:
+        super().__init__(f"Workflow {workflow_id!r} failed at step {step!r}.")
+        self.workflow_id = workflow_id
+        self.step = step
+        self.compensated = compensated
+        self.compensation_errors = compensation_errors
+
+
+# =========================================================
+# CLASS WORKFLOW STEP
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class WorkflowStep:
+    """One node of a ``Workflow``."""
+
+    name: str
+    task: StepFactory
+    after: tuple[str, ...] = ()
+    inputs: StepInputs | None = None
+    compensate: CompensationFactory | None = None
+
+    def payload_for(self, payload: dict[str, Any], outputs: Mapping[str, Any]) -> dict[str, Any]:
+        """Return the payload this step runs (and compensates) with."""
+        return payload if self.inputs is None else self.inputs(payload, outputs)
+
+
+# =========================================================
+# CLASS WORKFLOW
+# =========================================================
+class Workflow:
+    """A named DAG of task steps, built with chained ``step`` calls."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._steps: dict[str, WorkflowStep] = {}
+
+    @property
+    def steps(self) -> tuple[WorkflowStep, ...]:
+        """Return the steps in the order they were added (a topological order)."""
+        return tuple(self._steps.values())
+
+    def step(
+        self,
+        name: str,
+        task: StepFactory,
+        *,
+        after: Iterable[str] = (),
+        inputs: StepInputs | None = None,
+        compensate: CompensationFactory | None = None,
+    ) -> Self:
+        """Add a step that runs once every step in ``after`` has completed."""
+        if name in self._steps:
+            raise ValueError(f"Workflow {self.name!r} already has a step named {name!r}.")
+        dependencies = tuple(after)
+        unknown = [dependency for dependency in dependencies if dependency not in self._steps]
+        if unknown:
+            raise ValueError(
+                f"Step {name!r} depends on {unknown!r}, which must be added to the workflow first."
+            )
+        self._steps[name] = WorkflowStep(name, task, dependencies, inputs, compensate)
+        return self
+
+
+# =========================================================
+# CLASS WORKFLOW STORE
+# =========================================================
+class WorkflowStore(ABC):
+    """Backend contract for completed step outputs."""
+
+    @abstractmethod
+    def load(self, workflow_id: str) -> dict[str, Any]:
+        """Return the recorded outputs of ``workflow_id`` keyed by step name."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, workflow_id: str, step: str, output: Any) -> None:
+        """Record the output of a completed step."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard(self, workflow_id: str, step: str) -> None:
+        """Forget one step (e.g., after it was compensated)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, workflow_id: str) -> None:
+        """Forget every step of ``workflow_id``."""
+        raise NotImplementedError
+
+
+# =========================================================
+# CLASS IN MEMORY WORKFLOW STORE
+# =========================================================
+class InMemoryWorkflowStore(WorkflowStore):
+    """Process-local ``WorkflowStore``. Outputs are kept as Python objects."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._outputs: dict[str, dict[str, Any]] = {}
+
+    def load(self, workflow_id: str) -> dict[str, Any]:
+        """Return a copy of the recorded outputs."""
+        with self._lock:
+            return dict(self._outputs.get(workflow_id, {}))
+
+    def save(self, workflow_id: str, step: str, output: Any) -> None:
+        """Record the output of a completed step."""
+        with self._lock:
+            self._outputs.setdefault(workflow_id, {})[step] = output
+
+    def discard(self, workflow_id: str, step: str) -> None:
+        """Forget one step."""
+        with self._lock:
+            self._outputs.get(workflow_id, {}).pop(step, None)
+
+    def clear(self, workflow_id: str) -> None:
+        """Forget every step of ``workflow_id``."""
+        with self._lock:
+            self._outputs.pop(workflow_id, None)
+
+
+# =========================================================
+# CLASS SQLITE WORKFLOW STORE
+# =========================================================
+class SQLiteWorkflowStore(WorkflowStore):
+    """Durable ``WorkflowStore`` backed by SQLite in WAL mode."""
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS workflow_steps ("
+        " workflow_id TEXT NOT NULL,"
+        " step TEXT NOT NULL,"
+        " output BLOB NOT NULL,"
+        " PRIMARY KEY (workflow_id, step)"
+        ")"
+    )
+    _LOAD = "SELECT step, output FROM workflow_steps WHERE workflow_id = ?"
+    _SAVE = "INSERT OR REPLACE INTO workflow_steps (workflow_id, step, output) VALUES (?, ?, ?)"
+    _DISCARD = "DELETE FROM workflow_steps WHERE workflow_id = ? AND step = ?"
+    _CLEAR = "DELETE FROM workflow_steps WHERE workflow_id = ?"
+
+    def __init__(self, database: str | PathLike[str]) -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA busy_timeout=5000")
+        self._connection.execute(self._SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def load(self, workflow_id: str) -> dict[str, Any]:
+        """Return the recorded outputs, decoded from JSON."""
+        with self._lock:
+            rows = self._connection.execute(self._LOAD, (workflow_id,)).fetchall()
+        return {step: json.loads(output) for step, output in rows}
+
+    def save(self, workflow_id: str, step: str, output: Any) -> None:
+        """Record the JSON-encoded output of a completed step."""
+        encoded = to_json(output)
+        with self._lock:
+            self._connection.execute(self._SAVE, (workflow_id, step, encoded))
+
+    def discard(self, workflow_id: str, step: str) -> None:
+        """Forget one step."""
+        with self._lock:
+            self._connection.execute(self._DISCARD, (workflow_id, step))
+
+    def clear(self, workflow_id: str) -> None:
+        """Forget every step of ``workflow_id``."""
+        with self._lock:
+            self._connection.execute(self._CLEAR, (workflow_id,))
+
+
+# =========================================================
+# CLASS WORKFLOW RUNNER
+# =========================================================
+class WorkflowRunner:
+    """Run workflows with concurrent branches, persistence, and compensation."""
+
+    def __init__(self, store: WorkflowStore, *, max_concurrency: int = 8) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._store = store
+        self._max_concurrency = max_concurrency
+
+    async def run(
+        self, workflow: Workflow, workflow_id: str, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Run the steps of ``workflow`` not yet recorded for ``workflow_id``.
+
+        Return the outputs of every step keyed by step name. Raise
+        ``WorkflowStepError`` after compensating if a step fails.
+        """
+        outputs = await asyncio.to_thread(self._store.load, workflow_id)
+        completed = [step.name for step in workflow.steps if step.name in outputs]
+        pending = [step for step in workflow.steps if step.name not in outputs]
+        running: dict[asyncio.Task[Any], WorkflowStep] = {}
+        failure: tuple[str, BaseException] | None = None
+
+        try:
+            while pending or running:
+                if failure is None:
+                    for step in [s for s in pending if all(d in outputs for d in s.after)]:
+                        if len(running) >= self._max_concurrency:
+                            break
+                        pending.remove(step)
+                        try:
+                            step_payload = step.payload_for(payload, outputs)
+                        except Exception as exc:
+                            failure = (step.name, exc)
+                            break
+                        running[asyncio.ensure_future(_run_step(step, step_payload))] = step
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        failure = failure or (step.name, error)
+                        continue
+                    # The step has run, so it is compensated even if saving fails.
+                    outputs[step.name] = future.result()
+                    completed.append(step.name)
+                    try:
+                        await asyncio.to_thread(
+                            self._store.save, workflow_id, step.name, outputs[step.name]
+                        )
+                    except Exception as exc:
+                        failure = failure or (step.name, exc)
+        finally:
+            for future in running:
+                future.cancel()
+
+        if failure is None:
+            return outputs
+        failed_step, error = failure
+        compensated, compensation_errors = await self._compensate(
+            workflow, workflow_id, payload, outputs, completed
+        )
+        raise WorkflowStepError(
+            workflow_id, failed_step, compensated, compensation_errors
+        ) from error
+
+    async def _compensate(
+        self,
+        workflow: Workflow,
+        workflow_id: str,
+        payload: dict[str, Any],
+        outputs: dict[str, Any],
+        completed: list[str],
+    ) -> tuple[list[str], dict[str, BaseException]]:
+        steps = {step.name: step for step in workflow.steps}
+        compensated: list[str] = []
+        errors: dict[str, BaseException] = {}
+        for name in reversed(completed):
+            step = steps[name]
+            if step.compensate is None:
+                continue
+            try:
+                step_payload = step.payload_for(payload, outputs)
+                await _run_task(step.compensate(step_payload, outputs[name]))
+                await asyncio.to_thread(self._store.discard, workflow_id, name)
+            except Exception as exc:
+                errors[name] = exc
+                continue
+            compensated.append(name)
+        return compensated, errors
+
+
+async def _run_step(step: WorkflowStep, payload: dict[str, Any]) -> Any:
+    return await _run_task(step.task(payload))
+
+
+async def _run_task(task: TaskBase[Any]) -> Any:
+    if isinstance(task, AsyncTask):
+        return await task.run()
+    return await asyncio.to_thread(task.run)  # type: ignore[attr-defined]
@@ -20,7 +20,69 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from .entity import Entity
-from .repository import EntityRepository
+from typing import TYPE_CHECKING
 
-__all__ = ["Entity", "EntityRepository"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .concurrency import retry_on_conflict
+    from .entity import Entity, VersionedEntity
+    from .in_memory_repository import InMemoryEntityRepository
+    from .replicated_repository import Replica, ReplicatedEntityRepository, read_your_writes
+    from .repository import ConcurrencyConflictError, EntityRepository
+    from .sharded_repository import (
+        ConsistentHashPartitioner,
+        Partitioner,
+        RangePartitioner,
+        ShardedEntityRepository,
+    )
+    from .sqlite_repository import SQLiteEntityRepository, SQLiteQuery
+
+__all__ = [
+    "Entity",
+    "EntityRepository",
+    "VersionedEntity",
+    "ConcurrencyConflictError",
+    "InMemoryEntityRepository",
+    "SQLiteEntityRepository",
+    "SQLiteQuery",
+    "ShardedEntityRepository",
+    "Partitioner",
+    "ConsistentHashPartitioner",
+    "RangePartitioner",
+    "ReplicatedEntityRepository",
+    "Replica",
+    "read_your_writes",
+    "retry_on_conflict",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".concurrency": ("retry_on_conflict",),
+        ".entity": (
+            "Entity",
+            "VersionedEntity",
+        ),
+        ".in_memory_repository": ("InMemoryEntityRepository",),
+        ".replicated_repository": (
+            "Replica",
+            "ReplicatedEntityRepository",
+            "read_your_writes",
+        ),
+        ".repository": (
+            "ConcurrencyConflictError",
+            "EntityRepository",
+        ),
+        ".sharded_repository": (
+            "ConsistentHashPartitioner",
+            "Partitioner",
+            "RangePartitioner",
+            "ShardedEntityRepository",
+        ),
+        ".sqlite_repository": (
+            "SQLiteEntityRepository",
+            "SQLiteQuery",
+        ),
+    },
+)
@@ -0,0 +1,94 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Retry helper for optimistic concurrency conflicts.
+
+``retry_on_conflict`` re-runs a function when it raises
+``ConcurrencyConflictError``. The function must re-read the entities it
+changes, so each attempt reapplies the change to fresh data.
+
+Design notes:
+- Retries use the task ``RetryPolicy`` (exponential backoff with jitter), so
+  concurrent writers spread out instead of colliding again.
+- Works on sync and async functions, including ``APIOperation._execute`` and
+  ``AsyncAPIOperation._execute_async``.
+
+Usage:
+    class RenameUser(APIOperation[User]):
+        @retry_on_conflict(max_attempts=5)
+        def _execute(self) -> User:
+            user = self._users.get(self._user_id)
+            user.name = self._name
+            self._users.update(user)
+            return user
+"""
+
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from ..commands.execution_policy import (
+    ExecutionPolicy,
+    RetryPolicy,
+    run_with_policy,
+    run_with_policy_async,
+)
+from .repository import ConcurrencyConflictError
+
+__all__ = ["retry_on_conflict"]
+
+
+def retry_on_conflict[F: Callable[..., Any]](
+    *,
+    max_attempts: int = 3,
+    base_delay: float = 0.01,
+    max_delay: float = 0.5,
+    jitter: bool = True,
+) -> Callable[[F], F]:
+    """Retry the decorated function on ``ConcurrencyConflictError``."""
+    policy = ExecutionPolicy(
+        retry=RetryPolicy(
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            jitter=jitter,
+            retry_on=(ConcurrencyConflictError,),
+        )
+    )
+
+    def decorate(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await run_with_policy_async(functools.partial(func, *args, **kwargs), policy)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return run_with_policy(functools.partial(func, *args, **kwargs), policy)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
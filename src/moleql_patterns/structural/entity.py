@@ -31,6 +31,14 @@ Design goals:
 - Ensure each entity declares a concrete ``id`` type (e.g., ``Entity[int]``).
 - Remain fully compatible with Pydantic validation and serialization.
 - Keep the contract small and explicit to support repository abstractions.
+- ``VersionedEntity`` adds a ``version`` field for optimistic concurrency;
+  repositories compare it on update and raise ``ConcurrencyConflictError``.
+- Field assignments are tracked so repositories can write only the changed
+  fields (``changed_fields``). Set ``track_changes = False`` on a subclass to
+  restore pydantic's plain ``__setattr__``. In-place mutation of a field value
+  (e.g., ``entity.tags.append(...)``) is not detected; assign a new value.
+- Subclasses build their pydantic schema on first use (``defer_build``);
+  call ``warmup`` to build them ahead of time.
 
 Usage:
     class User(Entity[int]):
@@ -40,12 +48,12 @@ Usage:
 """
 
 import typing
-from datetime import datetime
-from typing import Any
+from datetime import UTC, datetime
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
-__all__ = ["Entity"]
+__all__ = ["Entity", "VersionedEntity"]
 
 
 # =========================================================
@@ -57,9 +65,21 @@ class Entity[IdT](BaseModel):
     Subclasses must supply a concrete type argument for ``IdT`` (e.g., ``int``,
     ``str``, ``uuid.UUID``). Using ``Any`` or omitting the type argument is
     rejected to prevent ambiguous repository contracts.
+
+    ``index_hints`` lists fields (or tuples of fields) that adapters should
+    index, e.g., ``("email", ("tenant_id", "created_at"))``.
+
+    Entities track which fields were assigned since the last ``mark_clean``.
+    An entity that was never marked clean (e.g., freshly constructed) reports
+    every field as changed.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    __slots__ = ("_changed_fields",)
+
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
+    track_changes: ClassVar[bool] = True
+    index_hints: ClassVar[tuple[str | tuple[str, ...], ...]] = ()
 
     id: IdT = Field(..., description="Entity identifier.")
     created_at: datetime
@@ -67,6 +87,41 @@ class Entity[IdT](BaseModel):
 
     __entity_id_type__: type | None = None
 
+    def _tracking_setattr(self, name: str, value: Any) -> None:
+        fields = type(self).__pydantic_fields__
+        if name not in fields:
+            BaseModel.__setattr__(self, name, value)
+            return
+        previous = self.__dict__.get(name)
+        BaseModel.__setattr__(self, name, value)
+        if previous != self.__dict__[name]:
+            # None until the first mark_clean; every field counts as changed then.
+            changed = getattr(self, "_changed_fields", None)
+            if changed is not None:
+                changed.add(name)
+
+    __setattr__ = _tracking_setattr
+
+    def changed_fields(self) -> frozenset[str]:
+        """Return the names of fields assigned a different value since ``mark_clean``."""
+        if not self.track_changes:
+            return frozenset(type(self).__pydantic_fields__)
+        try:
+            return frozenset(self._changed_fields)
+        except AttributeError:
+            return frozenset(type(self).__pydantic_fields__)
+
+    def mark_clean(self) -> None:
+        """Forget recorded changes, e.g., after loading or persisting the entity."""
+        object.__setattr__(self, "_changed_fields", set())
+
+    def touch(self, now: datetime | None = None) -> bool:
+        """Set ``updated_at`` if any other field changed. Return whether it did."""
+        if not self.changed_fields() - {"updated_at"}:
+            return False
+        self.updated_at = datetime.now(UTC) if now is None else now
+        return True
+
     @classmethod
     def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
         """Capture and validate the concrete ID type for subclasses."""
@@ -74,10 +129,30 @@ class Entity[IdT](BaseModel):
         if cls is Entity:
             return
 
+        if "__setattr__" not in cls.__dict__:
+            tracking = cls.track_changes
+            cls.__setattr__ = Entity._tracking_setattr if tracking else BaseModel.__setattr__  # type: ignore[method-assign,assignment]
+
         id_field = cls.model_fields.get("id")
         id_type = id_field.annotation if id_field else None
+        if id_type in cls.__type_params__ or id_type in cls.__pydantic_generic_metadata__["args"]:
+            return  # Generic intermediate, e.g. ``class Base[IdT](Entity[IdT])``.
 
         if id_type is Any or isinstance(id_type, typing.TypeVar) or id_type is None:
             raise TypeError("Entity subclasses must specify a concrete id type, e.g., Entity[int].")
 
         cls.__entity_id_type__ = id_type
+
+
+# =========================================================
+# CLASS VERSIONED ENTITY
+# =========================================================
+class VersionedEntity[IdT](Entity[IdT]):
+    """Entity with a version number for optimistic concurrency control.
+
+    Repositories update a versioned entity only if the stored version still
+    equals ``version``, then increment it on both the stored row and the
+    given instance. Otherwise they raise ``ConcurrencyConflictError``.
+    """
+
+    version: int = Field(default=0, ge=0, description="Optimistic concurrency version.")
@@ -0,0 +1,150 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""In-memory repository for tests, prototypes, and single-process caches.
+
+``InMemoryEntityRepository`` implements the ``EntityRepository`` contract on a
+dictionary. Queries are predicates over entities.
+
+Design notes:
+- Entities are copied on the way in and out, so callers never share state
+  with the store, as with a real database.
+- ``VersionedEntity`` updates and removals are compare-and-swap operations.
+  ``update_many`` checks every version before it applies any change.
+- Updates bump ``updated_at`` only when a field actually changed, and
+  entities come back marked clean.
+- One lock guards the store; every method is thread-safe.
+
+Usage:
+    users = InMemoryEntityRepository[int, User]()
+    users.add(user)
+    admins = users.list(lambda user: user.is_admin)
+"""
+
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from .entity import Entity, VersionedEntity
+from .repository import ConcurrencyConflictError, EntityRepository
+
+__all__ = ["InMemoryEntityRepository"]
+
+type EntityPredicate[EntityT] = Callable[[EntityT], bool]
+
+
+# =========================================================
+# CLASS IN MEMORY ENTITY REPOSITORY
+# =========================================================
+class InMemoryEntityRepository[IdT, EntityT: Entity[Any]](
+    EntityRepository[IdT, EntityT, EntityPredicate[EntityT] | None]
+):
+    """Thread-safe ``EntityRepository`` backed by a dictionary."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entities: dict[IdT, EntityT] = {}
+
+    def add(self, entity: EntityT) -> None:
+        """Add a new entity. Raises ``ValueError`` if the id exists."""
+        self.add_many((entity,))
+
+    def add_many(self, entities: Iterable[EntityT]) -> None:
+        """Add several entities atomically. Raises ``ValueError`` on any duplicate id."""
+        entities = list(entities)
+        copies = [entity.model_copy(deep=True) for entity in entities]
+        with self._lock:
+            ids = [entity.id for entity in copies]
+            duplicates = [entity_id for entity_id in ids if entity_id in self._entities]
+            if duplicates or len(set(ids)) != len(ids):
+                raise ValueError(f"Entities already exist: {duplicates or ids!r}.")
+            for entity in copies:
+                self._entities[entity.id] = entity
+        for entity in entities:
+            entity.mark_clean()
+
+    def get(self, entity_id: IdT) -> EntityT | None:
+        """Return a copy of the entity or None."""
+        with self._lock:
+            entity = self._entities.get(entity_id)
+        return None if entity is None else self._load(entity)
+
+    def get_many(self, entity_ids: Iterable[IdT]) -> dict[IdT, EntityT]:
+        """Return copies of the entities that exist, keyed by id."""
+        with self._lock:
+            found = [self._entities.get(entity_id) for entity_id in entity_ids]
+        return {entity.id: self._load(entity) for entity in found if entity is not None}
+
+    def list(self, query: EntityPredicate[EntityT] | None = None) -> Sequence[EntityT]:
+        """Return copies of all entities, or of those matching ``query``."""
+        with self._lock:
+            entities = list(self._entities.values())
+        if query is not None:
+            entities = [entity for entity in entities if query(entity)]
+        return [self._load(entity) for entity in entities]
+
+    def update(self, entity: EntityT) -> None:
+        """Persist an entity, checking its version if it has one."""
+        self.update_many((entity,))
+
+    def update_many(self, entities: Iterable[EntityT]) -> None:
+        """Persist several entities atomically, checking every version first."""
+        entities = list(entities)
+        with self._lock:
+            self._check_versions(entities)
+            for entity in entities:
+                entity.touch()
+                if isinstance(entity, VersionedEntity):
+                    entity.version += 1
+                self._entities[entity.id] = entity.model_copy(deep=True)
+                entity.mark_clean()
+
+    def remove(self, entity: EntityT) -> None:
+        """Remove an entity, checking its version if it has one."""
+        with self._lock:
+            self._check_versions((entity,))
+            del self._entities[entity.id]
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    @staticmethod
+    def _load(entity: EntityT) -> EntityT:
+        loaded = entity.model_copy(deep=True)
+        loaded.mark_clean()
+        return loaded
+
+    def _check_versions(self, entities: Iterable[EntityT]) -> None:
+        missing = []
+        conflicts = []
+        for entity in entities:
+            stored = self._entities.get(entity.id)
+            if stored is None:
+                missing.append(entity.id)
+            elif isinstance(entity, VersionedEntity) and stored.version != entity.version:  # type: ignore[attr-defined]
+                conflicts.append(entity.id)
+        if missing:
+            raise LookupError(f"Entities not found: {missing!r}.")
+        if conflicts:
+            raise ConcurrencyConflictError(
+                f"Entities were modified concurrently: {conflicts!r}.", conflicts
+            )
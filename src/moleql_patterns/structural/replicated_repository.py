@@ -0,0 +1,237 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Repository wrapper that sends reads to replicas and writes to a primary.
+
+``ReplicatedEntityRepository`` implements the ``EntityRepository`` contract
+over one primary repository and any number of read replicas.
+
+Design notes:
+- ``add``, ``update``, and ``remove`` (and their bulk forms) go to the
+  primary. ``get``, ``get_many``, and ``list`` go to a replica.
+- Inside a ``read_your_writes()`` block, ids written through the wrapper are
+  read from the primary, and ``list`` uses the primary once anything was
+  written. Open one block per request.
+- A ``Replica`` may report its replication lag in seconds. Replicas lagging
+  more than ``max_staleness`` (or whose lag check fails) are skipped; if no
+  replica qualifies, the read goes to the primary. Each lag result is cached
+  for ``lag_ttl`` seconds, so the check runs at most once per TTL per
+  replica instead of on every read. The age of a cached result is added to
+  its lag, so the bound still holds between checks.
+- Among eligible replicas, the one with the fewest outstanding requests is
+  picked, so slow replicas receive less traffic.
+
+Usage:
+    users = ReplicatedEntityRepository(
+        primary,
+        [Replica(replica_a, lag=replica_a_lag), Replica(replica_b)],
+        max_staleness=2.0,
+    )
+    with read_your_writes():
+        users.update(user)
+        users.get(user.id)  # served by the primary
+"""
+
+import contextlib
+import contextvars
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .entity import Entity
+from .repository import EntityRepository
+
+__all__ = ["Replica", "ReplicatedEntityRepository", "read_your_writes"]
+
+_written_ids: contextvars.ContextVar[dict[int, set[Any]] | None] = contextvars.ContextVar(
+    "moleql_written_ids", default=None
+)
+
+
+@contextlib.contextmanager
+def read_your_writes() -> Iterator[None]:
+    """Route reads of ids written in this block to the primary until it exits."""
+    token = _written_ids.set({})
+    try:
+        yield
+    finally:
+        _written_ids.reset(token)
+
+
+# =========================================================
+# CLASS REPLICA
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class Replica[IdT, EntityT: Entity[Any], QueryT: Any]:
+    """A read replica and an optional callable that returns its lag in seconds."""
+
+    repository: EntityRepository[IdT, EntityT, QueryT]
+    lag: Callable[[], float] | None = None
+
+
+# =========================================================
+# CLASS REPLICATED ENTITY REPOSITORY
+# =========================================================
+class ReplicatedEntityRepository[IdT, EntityT: Entity[Any], QueryT: Any](
+    EntityRepository[IdT, EntityT, QueryT]
+):
+    """``EntityRepository`` that reads from replicas and writes to a primary."""
+
+    def __init__(
+        self,
+        primary: EntityRepository[IdT, EntityT, QueryT],
+        replicas: Iterable[Replica[IdT, EntityT, QueryT] | EntityRepository[IdT, EntityT, QueryT]],
+        *,
+        max_staleness: float | None = None,
+        lag_ttl: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_staleness is not None and max_staleness < 0:
+            raise ValueError("max_staleness must be non-negative.")
+        if lag_ttl < 0:
+            raise ValueError("lag_ttl must be non-negative.")
+        self._primary = primary
+        self._replicas = tuple(
+            replica if isinstance(replica, Replica) else Replica(replica) for replica in replicas
+        )
+        self._max_staleness = max_staleness
+        self._lag_ttl = lag_ttl
+        self._clock = clock
+        # Per replica: (checked_at, lag), with lag None when the check failed.
+        self._lags: list[tuple[float, float | None] | None] = [None] * len(self._replicas)
+        self._outstanding = [0] * len(self._replicas)
+        self._rotation = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def primary(self) -> EntityRepository[IdT, EntityT, QueryT]:
+        """Return the primary repository."""
+        return self._primary
+
+    def outstanding(self) -> tuple[int, ...]:
+        """Return the number of reads in flight per replica."""
+        with self._lock:
+            return tuple(self._outstanding)
+
+    def add(self, entity: EntityT) -> None:
+        """Add an entity on the primary."""
+        self._primary.add(entity)
+        self._record_writes((entity.id,))
+
+    def add_many(self, entities: Iterable[EntityT]) -> None:
+        """Add entities on the primary."""
+        entities = list(entities)
+        self._primary.add_many(entities)
+        self._record_writes(entity.id for entity in entities)
+
+    def update(self, entity: EntityT) -> None:
+        """Persist updates on the primary."""
+        self._primary.update(entity)
+        self._record_writes((entity.id,))
+
+    def update_many(self, entities: Iterable[EntityT]) -> None:
+        """Persist updates to several entities on the primary."""
+        entities = list(entities)
+        self._primary.update_many(entities)
+        self._record_writes(entity.id for entity in entities)
+
+    def remove(self, entity: EntityT) -> None:
+        """Remove an entity on the primary."""
+        self._primary.remove(entity)
+        self._record_writes((entity.id,))
+
+    def get(self, entity_id: IdT) -> EntityT | None:
+        """Return the entity from a replica, or from the primary if written in scope."""
+        if entity_id in self._written():
+            return self._primary.get(entity_id)
+        return self._read(lambda repository: repository.get(entity_id))
+
+    def get_many(self, entity_ids: Iterable[IdT]) -> dict[IdT, EntityT]:
+        """Return existing entities, reading ids written in scope from the primary."""
+        written = self._written()
+        ids = list(entity_ids)
+        fresh = [entity_id for entity_id in ids if entity_id in written]
+        rest = [entity_id for entity_id in ids if entity_id not in written]
+        found = self._read(lambda repository: repository.get_many(rest)) if rest else {}
+        if fresh:
+            found.update(self._primary.get_many(fresh))
+        return found
+
+    def list(self, query: QueryT = None) -> Sequence[EntityT]:
+        """Return matching entities from a replica, or the primary after writes in scope."""
+        if self._written():
+            return self._primary.list(query)
+        return self._read(lambda repository: repository.list(query))
+
+    def _written(self) -> set[Any] | frozenset[Any]:
+        scope = _written_ids.get()
+        if scope is None:
+            return frozenset()
+        return scope.get(id(self), frozenset())
+
+    def _record_writes(self, entity_ids: Iterable[IdT]) -> None:
+        scope = _written_ids.get()
+        if scope is not None:
+            scope.setdefault(id(self), set()).update(entity_ids)
+
+    def _read[ResultT](
+        self, call: Callable[[EntityRepository[IdT, EntityT, QueryT]], ResultT]
+    ) -> ResultT:
+        index = self._pick_replica()
+        if index is None:
+            return call(self._primary)
+        try:
+            return call(self._replicas[index].repository)
+        finally:
+            with self._lock:
+                self._outstanding[index] -= 1
+
+    def _pick_replica(self) -> int | None:
+        """Reserve the least loaded replica within the staleness bound."""
+        eligible = [index for index in range(len(self._replicas)) if self._is_fresh(index)]
+        if not eligible:
+            return None
+        with self._lock:
+            # Rotate the starting point so ties spread across replicas.
+            start = next(self._rotation) % len(eligible)
+            rotated = eligible[start:] + eligible[:start]
+            index = min(rotated, key=self._outstanding.__getitem__)
+            self._outstanding[index] += 1
+        return index
+
+    def _is_fresh(self, index: int) -> bool:
+        replica = self._replicas[index]
+        if self._max_staleness is None or replica.lag is None:
+            return True
+        now = self._clock()
+        cached = self._lags[index]
+        if cached is None or now - cached[0] >= self._lag_ttl:
+            try:
+                lag = replica.lag()
+            except Exception:
+                lag = None
+            cached = self._lags[index] = (now, lag)
+        checked_at, lag = cached
+        return lag is not None and lag + (now - checked_at) <= self._max_staleness
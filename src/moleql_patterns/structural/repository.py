@@ -30,15 +30,28 @@ Concrete repositories hold the technology details.
 This base class allows repository instances to be injected across application logic.
 That decouples business logic from the persistence layer.
 Liskov's substitution principle allows the swap of implementations.
+Repositories that store ``VersionedEntity`` instances compare versions on update.
+They raise ``ConcurrencyConflictError`` when the stored version has moved on.
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 from .entity import Entity
 
-__all__ = ["EntityRepository"]
+__all__ = ["ConcurrencyConflictError", "EntityRepository"]
+
+
+# =========================================================
+# CLASS CONCURRENCY CONFLICT ERROR
+# =========================================================
+class ConcurrencyConflictError(RuntimeError):
+    """Raised when an entity changed since it was read (optimistic concurrency)."""
+
+    def __init__(self, message: str, entity_ids: Sequence[Any] = ()) -> None:
+        super().__init__(message)
+        self.entity_ids = tuple(entity_ids)
 
 
 # =========================================================
@@ -78,3 +91,35 @@ class EntityRepository[IdT, EntityT: Entity, QueryT: Any](ABC):
     def remove(self, entity: EntityT) -> None:
         """Remove an entity."""
         raise NotImplementedError
+
+    def add_many(self, entities: Iterable[EntityT]) -> None:
+        """Add several entities.
+
+        The default calls ``add`` per entity. Adapters should override it with
+        a batched write.
+        """
+        for entity in entities:
+            self.add(entity)
+
+    def get_many(self, entity_ids: Iterable[IdT]) -> dict[IdT, EntityT]:
+        """Return the entities that exist for ``entity_ids``, keyed by id.
+
+        The default calls ``get`` per id. Adapters should override it with a
+        batched read.
+        """
+        found: dict[IdT, EntityT] = {}
+        for entity_id in entity_ids:
+            entity = self.get(entity_id)
+            if entity is not None:
+                found[entity_id] = entity
+        return found
+
+    def update_many(self, entities: Iterable[EntityT]) -> None:
+        """Persist updates to several entities.
+
+        The default calls ``update`` per entity, so it is not atomic. Adapters
+        should override it with a batched write that checks every version
+        before applying any change.
+        """
+        for entity in entities:
+            self.update(entity)
@@ -0,0 +1,398 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Sharded repository that routes entities to several underlying repositories.
+
+``ShardedEntityRepository`` implements the ``EntityRepository`` contract on
+top of named shards, each of which is itself an ``EntityRepository``. A
+``Partitioner`` maps every entity id to a shard name.
+
+Design notes:
+- ``ConsistentHashPartitioner`` places shards on a blake2b hash ring with
+  virtual nodes, so adding or removing a shard moves only about ``1/N`` of
+  the ids. ``RangePartitioner`` assigns ordered id ranges to shards.
+- Bulk methods group entities per shard and make one bulk call per shard.
+- ``list`` queries every shard in parallel on a thread pool sized to the
+  shard set. With a ``sort_key``, the sorted shard results are combined with
+  a k-way ``heapq.merge``; otherwise they are concatenated in shard order.
+- ``rebalance`` switches to a new partitioner and moves only the entities
+  whose shard changed. Reads fall back to the previous shard until the move
+  finishes. Each group moves under a lock that ``list`` also takes while a
+  rebalance runs, so ``list`` sees every entity exactly once, including the
+  ones still in dropped shards. Writes should be paused while it runs.
+
+Usage:
+    partitioner = ConsistentHashPartitioner(["a", "b", "c"])
+    users = ShardedEntityRepository({"a": repo_a, "b": repo_b, "c": repo_c}, partitioner)
+    users.rebalance(partitioner.with_shard("d"), shards={..., "d": repo_d})
+"""
+
+import bisect
+import hashlib
+import heapq
+import itertools
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Self
+
+from .entity import Entity
+from .repository import EntityRepository
+
+__all__ = [
+    "Partitioner",
+    "ConsistentHashPartitioner",
+    "RangePartitioner",
+    "ShardedEntityRepository",
+]
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest())
+
+
+# =========================================================
+# CLASS PARTITIONER
+# =========================================================
+class Partitioner[IdT](ABC):
+    """Contract that maps entity ids to shard names."""
+
+    @property
+    @abstractmethod
+    def shard_names(self) -> tuple[str, ...]:
+        """Return every shard name this partitioner can return."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def shard_for(self, entity_id: IdT) -> str:
+        """Return the name of the shard that owns ``entity_id``."""
+        raise NotImplementedError
+
+
+# =========================================================
+# CLASS CONSISTENT HASH PARTITIONER
+# =========================================================
+class ConsistentHashPartitioner[IdT](Partitioner[IdT]):
+    """Hash ring partitioner with ``virtual_nodes`` points per shard.
+
+    Ids are hashed through ``str(entity_id)``, so ids must have a stable
+    string form (ints, strings, and UUIDs do).
+    """
+
+    def __init__(self, shards: Iterable[str], *, virtual_nodes: int = 64) -> None:
+        names = tuple(dict.fromkeys(shards))
+        if not names:
+            raise ValueError("At least one shard is required.")
+        if virtual_nodes < 1:
+            raise ValueError("virtual_nodes must be at least 1.")
+        self._names = names
+        self._virtual_nodes = virtual_nodes
+        ring = sorted(
+            (_hash(f"{name}#{index}"), name) for name in names for index in range(virtual_nodes)
+        )
+        self._points = [point for point, _ in ring]
+        self._owners = [name for _, name in ring]
+
+    @property
+    def shard_names(self) -> tuple[str, ...]:
+        return self._names
+
+    def shard_for(self, entity_id: IdT) -> str:
+        index = bisect.bisect_right(self._points, _hash(str(entity_id)))
+        return self._owners[index % len(self._owners)]
+
+    def with_shard(self, name: str) -> "ConsistentHashPartitioner[IdT]":
+        """Return a new partitioner that also includes ``name``."""
+        return ConsistentHashPartitioner((*self._names, name), virtual_nodes=self._virtual_nodes)
+
+    def without_shard(self, name: str) -> "ConsistentHashPartitioner[IdT]":
+        """Return a new partitioner without ``name``."""
+        if name not in self._names:
+            raise KeyError(name)
+        return ConsistentHashPartitioner(
+            (shard for shard in self._names if shard != name), virtual_nodes=self._virtual_nodes
+        )
+
+
+# =========================================================
+# CLASS RANGE PARTITIONER
+# =========================================================
+class RangePartitioner[IdT](Partitioner[IdT]):
+    """Partitioner that assigns ordered id ranges to shards.
+
+    ``shards[i]`` owns ids below ``bounds[i]`` and at or above
+    ``bounds[i - 1]``; the last shard owns everything from the last bound on.
+    """
+
+    def __init__(self, bounds: Sequence[IdT], shards: Sequence[str]) -> None:
+        if len(shards) != len(bounds) + 1:
+            raise ValueError("RangePartitioner needs exactly one more shard than bounds.")
+        if any(low >= high for low, high in itertools.pairwise(bounds)):  # type: ignore[operator]
+            raise ValueError("Range bounds must be strictly increasing.")
+        self._bounds = list(bounds)
+        self._shards = tuple(shards)
+
+    @property
+    def shard_names(self) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(self._shards))
+
+    def shard_for(self, entity_id: IdT) -> str:
+        return self._shards[bisect.bisect_right(self._bounds, entity_id)]  # type: ignore[type-var]
+
+
+# =========================================================
+# CLASS SHARDED ENTITY REPOSITORY
+# =========================================================
+class ShardedEntityRepository[IdT, EntityT: Entity[Any], QueryT: Any](
+    EntityRepository[IdT, EntityT, QueryT]
+):
+    """``EntityRepository`` that routes each entity to one of several shards.
+
+    ``query`` values are passed unchanged to every shard, so all shards must
+    accept the same query type. Pass ``sort_key`` (and ``reverse``) when the
+    shards return results sorted by that key, so ``list`` can merge them.
+    """
+
+    def __init__(
+        self,
+        shards: Mapping[str, EntityRepository[IdT, EntityT, QueryT]],
+        partitioner: Partitioner[IdT],
+        *,
+        sort_key: Callable[[EntityT], Any] | None = None,
+        reverse: bool = False,
+        executor: Executor | None = None,
+    ) -> None:
+        self._check_shards(shards, partitioner)
+        self._shards = dict(shards)
+        self._partitioner = partitioner
+        self._previous: Partitioner[IdT] | None = None
+        self._previous_shards: dict[str, EntityRepository[IdT, EntityT, QueryT]] = {}
+        self._sort_key = sort_key
+        self._reverse = reverse
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_workers = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._move_lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def shards(self) -> Mapping[str, EntityRepository[IdT, EntityT, QueryT]]:
+        """Return the current shards by name."""
+        return dict(self._shards)
+
+    @property
+    def partitioner(self) -> Partitioner[IdT]:
+        """Return the current partitioner."""
+        return self._partitioner
+
+    def shard_for(self, entity_id: IdT) -> EntityRepository[IdT, EntityT, QueryT]:
+        """Return the shard repository that owns ``entity_id``."""
+        return self._shards[self._partitioner.shard_for(entity_id)]
+
+    def close(self) -> None:
+        """Shut down the thread pool if this repository created it."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            executor.shutdown(wait=True)
+
+    def add(self, entity: EntityT) -> None:
+        """Add an entity to its shard."""
+        self.shard_for(entity.id).add(entity)
+
+    def add_many(self, entities: Iterable[EntityT]) -> None:
+        """Add entities with one ``add_many`` call per shard."""
+        for shard, group in self._group(entities, lambda entity: entity.id):
+            shard.add_many(group)
+
+    def get(self, entity_id: IdT) -> EntityT | None:
+        """Return the entity from its shard, or None."""
+        entity = self.shard_for(entity_id).get(entity_id)
+        if entity is None:
+            previous = self._previous_shard_for(entity_id)
+            if previous is not None:
+                entity = previous.get(entity_id)
+        return entity
+
+    def get_many(self, entity_ids: Iterable[IdT]) -> dict[IdT, EntityT]:
+        """Return the entities that exist, with one ``get_many`` call per shard."""
+        groups = list(self._group(entity_ids, lambda entity_id: entity_id))
+        found: dict[IdT, EntityT] = {}
+        for part in self._fan_out(lambda shard, ids: shard.get_many(ids), groups):
+            found.update(part)
+        if self._previous is not None:
+            missing = [
+                entity_id for _, ids in groups for entity_id in ids if entity_id not in found
+            ]
+            for entity_id in missing:
+                entity = self.get(entity_id)
+                if entity is not None:
+                    found[entity_id] = entity
+        return found
+
+    def list(self, query: QueryT = None) -> Sequence[EntityT]:
+        """Return matching entities from every shard, queried in parallel.
+
+        During a rebalance the previous shards are queried too. A ``list``
+        that overlaps the start of a rebalance is retried.
+        """
+        while True:
+            with self._lock:
+                generation, rebalancing = self._generation, self._previous is not None
+                shards = self._all_shards()
+            groups = [(shard, query) for shard in shards]
+            if rebalancing:
+                with self._move_lock:
+                    results = self._fan_out(lambda shard, arg: shard.list(arg), groups)
+                break
+            results = self._fan_out(lambda shard, arg: shard.list(arg), groups)
+            if self._generation == generation:
+                break
+        if self._sort_key is None:
+            return list(itertools.chain.from_iterable(results))
+        return list(heapq.merge(*results, key=self._sort_key, reverse=self._reverse))
+
+    def update(self, entity: EntityT) -> None:
+        """Persist updates to an entity on its shard."""
+        self.shard_for(entity.id).update(entity)
+
+    def update_many(self, entities: Iterable[EntityT]) -> None:
+        """Persist updates with one ``update_many`` call per shard.
+
+        Each shard applies its group atomically if it supports that; the
+        operation as a whole is not atomic across shards.
+        """
+        for shard, group in self._group(entities, lambda entity: entity.id):
+            shard.update_many(group)
+
+    def remove(self, entity: EntityT) -> None:
+        """Remove an entity from its shard."""
+        self.shard_for(entity.id).remove(entity)
+
+    def rebalance(
+        self,
+        partitioner: Partitioner[IdT],
+        shards: Mapping[str, EntityRepository[IdT, EntityT, QueryT]] | None = None,
+    ) -> int:
+        """Switch to ``partitioner`` and move entities whose shard changed.
+
+        ``shards`` replaces the shard mapping, e.g., to add a new shard or
+        drop a drained one. Returns the number of entities moved.
+        """
+        new_shards = dict(self._shards if shards is None else shards)
+        self._check_shards(new_shards, partitioner)
+        old_shards = self._shards
+        with self._lock:
+            self._previous, self._previous_shards = self._partitioner, old_shards
+            self._partitioner, self._shards = partitioner, new_shards
+            self._generation += 1
+        moved = 0
+        try:
+            for source in old_shards.values():
+                leaving = [
+                    entity
+                    for entity in source.list()
+                    if new_shards.get(partitioner.shard_for(entity.id)) is not source
+                ]
+                for target, group in self._group(leaving, lambda entity: entity.id):
+                    with self._move_lock:
+                        target.add_many(group)
+                        for entity in group:
+                            source.remove(entity)
+                    moved += len(group)
+        finally:
+            with self._lock:
+                self._previous, self._previous_shards = None, {}
+                self._generation += 1
+        return moved
+
+    def _all_shards(self) -> Sequence[EntityRepository[IdT, EntityT, QueryT]]:
+        current = tuple(self._shards.values())
+        dropped = tuple(
+            shard
+            for shard in self._previous_shards.values()
+            if not any(shard is other for other in current)
+        )
+        return current + dropped
+
+    def _previous_shard_for(self, entity_id: IdT) -> EntityRepository[IdT, EntityT, QueryT] | None:
+        previous = self._previous
+        if previous is None:
+            return None
+        shard = self._previous_shards.get(previous.shard_for(entity_id))
+        return None if shard is self.shard_for(entity_id) else shard
+
+    def _group[ItemT](
+        self, items: Iterable[ItemT], id_of: Callable[[ItemT], IdT]
+    ) -> Iterator[tuple[EntityRepository[IdT, EntityT, QueryT], Sequence[ItemT]]]:
+        partitioner = self._partitioner
+        groups: dict[str, list[ItemT]] = {}
+        for item in items:
+            groups.setdefault(partitioner.shard_for(id_of(item)), []).append(item)
+        for name, group in groups.items():
+            yield self._shards[name], group
+
+    def _fan_out[ArgT, ResultT](
+        self,
+        call: Callable[[EntityRepository[IdT, EntityT, QueryT], ArgT], ResultT],
+        groups: Sequence[tuple[EntityRepository[IdT, EntityT, QueryT], ArgT]],
+    ) -> Sequence[ResultT]:
+        if len(groups) <= 1:
+            return [call(shard, arg) for shard, arg in groups]
+        with self._lock:
+            executor = self._get_executor()
+            futures = [executor.submit(call, shard, arg) for shard, arg in groups]
+        return [future.result() for future in futures]
+
+    def _get_executor(self) -> Executor:
+        # Called with ``_lock`` held. An owned pool is resized when the shard
+        # set changes; the old pool finishes its queued calls and exits.
+        workers = max(len(self._all_shards()), 1)
+        stale = self._executor
+        if stale is not None and (not self._owns_executor or self._executor_workers == workers):
+            return stale
+        self._owns_executor = True
+        self._executor_workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="shard")
+        if stale is not None:
+            stale.shutdown(wait=False)
+        return self._executor
+
+    @staticmethod
+    def _check_shards(shards: Mapping[str, Any], partitioner: Partitioner[Any]) -> None:
+        unknown = [name for name in partitioner.shard_names if name not in shards]
+        if unknown:
+            raise ValueError(f"Partitioner refers to unknown shards: {unknown!r}.")
@@ -0,0 +1,475 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""SQLite adapter for the ``EntityRepository`` contract.
+
+``SQLiteEntityRepository`` stores one entity class in one table. The table
+layout is derived from the entity's ``model_fields`` once per class; SQL text
+for every statement is built at the same time.
+
+Design notes:
+- Scalar fields (numbers, strings, booleans, dates, UUIDs) map to
+  native columns so they can be filtered and indexed. Other fields (lists,
+  dicts, nested models) are stored as JSON text.
+- Statement text is fixed per table, so ``sqlite3``'s per-connection
+  statement cache reuses the prepared statements.
+- Bulk methods use ``executemany`` in a single transaction.
+- ``update`` writes only ``changed_fields()`` and skips entities with no
+  changes. ``VersionedEntity`` updates and removals are compare-and-swap
+  operations that raise ``ConcurrencyConflictError``.
+- Connections come from a small pool shared by all threads. Each one runs in
+  WAL mode so readers do not block the writer.
+- ``Entity.index_hints`` become ``CREATE INDEX IF NOT EXISTS`` statements.
+
+Usage:
+    users = SQLiteEntityRepository(User, "app.db")
+    users.add_many(new_users)
+    admins = users.list(SQLiteQuery(filters={"is_admin": True}, order_by=("-created_at",)))
+"""
+
+import contextlib
+import json
+import queue
+import re
+import sqlite3
+import types
+import uuid
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+from os import PathLike
+from types import TracebackType
+from typing import Any, Self, Union, get_args, get_origin
+
+from pydantic import TypeAdapter
+
+from .entity import Entity, VersionedEntity
+from .repository import ConcurrencyConflictError, EntityRepository
+
+__all__ = ["SQLiteEntityRepository", "SQLiteQuery"]
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_TEXT_SCALARS = (str, datetime, date, time, uuid.UUID, Decimal)
+
+
+def _quote(identifier: str) -> str:
+    if not _IDENTIFIER.match(identifier):
+        raise ValueError(f"Invalid SQL identifier: {identifier!r}.")
+    return f'"{identifier}"'
+
+
+def _column_type(annotation: Any) -> str | None:
+    """Return the SQLite type for a scalar annotation, or None for JSON columns."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) != 1:
+            return None
+        annotation = members[0]
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, bool | int):
+        return "INTEGER"
+    if issubclass(annotation, float):
+        return "REAL"
+    if issubclass(annotation, _TEXT_SCALARS):
+        return "TEXT"
+    return None
+
+
+# =========================================================
+# CLASS SQLITE QUERY
+# =========================================================
+@dataclass(frozen=True, slots=True)
+class SQLiteQuery:
+    """Equality filters, ordering, and limit for ``SQLiteEntityRepository.list``.
+
+    ``order_by`` takes field names; prefix one with ``-`` to sort descending.
+    """
+
+    filters: Mapping[str, Any] = field(default_factory=dict)
+    order_by: tuple[str, ...] = ()
+    limit: int | None = None
+
+
+# =========================================================
+# CLASS TABLE MAPPING
+# =========================================================
+class _TableMapping:
+    """Columns and SQL text for one entity class and table."""
+
+    def __init__(self, entity_cls: type[Entity[Any]], table: str) -> None:
+        self.entity_cls = entity_cls
+        self.columns = tuple(entity_cls.model_fields)
+        self.json_columns = frozenset(
+            name
+            for name, info in entity_cls.model_fields.items()
+            if _column_type(info.annotation) is None
+        )
+        self._adapters: dict[str, TypeAdapter[Any]] = {}
+        self._update_sql: dict[frozenset[str], tuple[str, tuple[str, ...]]] = {}
+
+        self.table = _quote(table)
+        self._table_name = table
+        column_list = ", ".join(map(_quote, self.columns))
+        placeholders = ", ".join("?" * len(self.columns))
+        self.select_sql = f"SELECT {column_list} FROM {self.table}"
+        self.select_by_id_sql = f'{self.select_sql} WHERE "id" = ?'
+        self.insert_sql = f"INSERT INTO {self.table} ({column_list}) VALUES ({placeholders})"
+        self.versioned = issubclass(entity_cls, VersionedEntity)
+        version_column = '"version"' if self.versioned else '"id"'
+        self.version_sql = f'SELECT {version_column} FROM {self.table} WHERE "id" = ?'
+        version_check = ' AND "version" = ?' if self.versioned else ""
+        self.delete_sql = f'DELETE FROM {self.table} WHERE "id" = ?{version_check}'
+
+    def create_statements(self) -> list[str]:
+        definitions = []
+        for name, info in self.entity_cls.model_fields.items():
+            column_type = _column_type(info.annotation) or "TEXT"
+            primary_key = " PRIMARY KEY" if name == "id" else ""
+            definitions.append(f"{_quote(name)} {column_type}{primary_key}")
+        statements = [f"CREATE TABLE IF NOT EXISTS {self.table} ({', '.join(definitions)})"]
+        for hint in self.entity_cls.index_hints:
+            fields = (hint,) if isinstance(hint, str) else tuple(hint)
+            unknown = [name for name in fields if name not in self.columns]
+            if unknown:
+                raise ValueError(f"Index hint refers to unknown fields: {unknown!r}.")
+            index = _quote(f"ix_{self._table_name}_{'_'.join(fields)}")
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {index} ON {self.table} "
+                f"({', '.join(map(_quote, fields))})"
+            )
+        return statements
+
+    def update_sql(self, changed: frozenset[str]) -> tuple[str, tuple[str, ...]]:
+        """Return the UPDATE statement and its parameter columns for ``changed``."""
+        try:
+            return self._update_sql[changed]
+        except KeyError:
+            pass
+        columns = tuple(name for name in self.columns if name in changed and name != "id")
+        assignments = ", ".join(f"{_quote(name)} = ?" for name in columns)
+        if self.versioned:
+            sql = f'UPDATE {self.table} SET {assignments} WHERE "id" = ? AND "version" = ?'
+        else:
+            sql = f'UPDATE {self.table} SET {assignments} WHERE "id" = ?'
+        entry = self._update_sql[changed] = (sql, columns)
+        return entry
+
+    def encode(self, entity: Entity[Any], columns: Sequence[str] | None = None) -> list[Any]:
+        if columns is None:
+            columns = self.columns
+            data = entity.model_dump(mode="json")
+        else:
+            data = entity.model_dump(mode="json", include=set(columns))
+        json_columns = self.json_columns
+        return [json.dumps(data[name]) if name in json_columns else data[name] for name in columns]
+
+    def encode_value(self, name: str, value: Any) -> Any:
+        if name not in self.columns:
+            raise ValueError(f"Unknown field {name!r}.")
+        adapter = self._adapters.get(name)
+        if adapter is None:
+            annotation = self.entity_cls.model_fields[name].annotation
+            adapter = self._adapters[name] = TypeAdapter(annotation)
+        encoded = adapter.dump_python(value, mode="json")
+        return json.dumps(encoded) if name in self.json_columns else encoded
+
+    def encode_id(self, value: Any) -> Any:
+        """Encode an id the way ``encode`` writes the ``id`` column."""
+        return self.encode_value("id", value)
+
+    def decode(self, row: Sequence[Any]) -> Entity[Any]:
+        data = dict(zip(self.columns, row, strict=True))
+        for name in self.json_columns:
+            value = data[name]
+            if value is not None:
+                data[name] = json.loads(value)
+        entity = self.entity_cls.model_validate(data)
+        entity.mark_clean()
+        return entity
+
+
+# =========================================================
+# CLASS CONNECTION POOL
+# =========================================================
+class _ConnectionPool:
+    """Fixed-size pool of SQLite connections shared across threads."""
+
+    def __init__(self, database: str | PathLike[str], size: int) -> None:
+        self._database = database
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._all: list[sqlite3.Connection] = []
+        self._slots = queue.Queue[None]()
+        for _ in range(size):
+            self._slots.put(None)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._database, isolation_level=None, check_same_thread=False, cached_statements=256
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=5000")
+        self._all.append(connection)
+        return connection
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        self._slots.get()
+        try:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._connect()
+            try:
+                yield connection
+            finally:
+                self._idle.put(connection)
+        finally:
+            self._slots.put(None)
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def close(self) -> None:
+        for connection in self._all:
+            connection.close()
+        self._all.clear()
+
+
+# =========================================================
+# CLASS SQLITE ENTITY REPOSITORY
+# =========================================================
+class SQLiteEntityRepository[IdT, EntityT: Entity[Any]](
+    EntityRepository[IdT, EntityT, SQLiteQuery | None]
+):
+    """``EntityRepository`` that stores one entity class in a SQLite table."""
+
+    _mappings: dict[tuple[type, str], _TableMapping] = {}
+
+    def __init__(
+        self,
+        entity_cls: type[EntityT],
+        database: str | PathLike[str],
+        *,
+        table: str | None = None,
+        pool_size: int = 4,
+    ) -> None:
+        table = table or entity_cls.__name__.lower()
+        key = (entity_cls, table)
+        mapping = self._mappings.get(key)
+        if mapping is None:
+            mapping = self._mappings[key] = _TableMapping(entity_cls, table)
+        self._mapping = mapping
+        if str(database) == ":memory:":
+            pool_size = 1  # Every connection to ":memory:" opens a separate database.
+        self._pool = _ConnectionPool(database, pool_size)
+        with self._pool.connection() as connection:
+            for statement in mapping.create_statements():
+                connection.execute(statement)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self._pool.close()
+
+    def add(self, entity: EntityT) -> None:
+        """Insert an entity. Raises ``ValueError`` if the id exists."""
+        self.add_many((entity,))
+
+    def add_many(self, entities: Iterable[EntityT]) -> None:
+        """Insert several entities in one transaction with ``executemany``."""
+        entities = list(entities)
+        rows = [self._mapping.encode(entity) for entity in entities]
+        try:
+            with self._pool.transaction() as connection:
+                connection.executemany(self._mapping.insert_sql, rows)
+        except sqlite3.IntegrityError as exc:
+            raise ValueError("An entity with the same id already exists.") from exc
+        for entity in entities:
+            entity.mark_clean()
+
+    def get(self, entity_id: IdT) -> EntityT | None:
+        """Return the entity or None."""
+        with self._pool.connection() as connection:
+            row = connection.execute(
+                self._mapping.select_by_id_sql, (self._mapping.encode_id(entity_id),)
+            ).fetchone()
+        return None if row is None else self._mapping.decode(row)  # type: ignore[return-value]
+
+    def get_many(self, entity_ids: Iterable[IdT]) -> dict[IdT, EntityT]:
+        """Return the entities that exist, keyed by id, using batched ``IN`` queries."""
+        ids = [self._mapping.encode_id(entity_id) for entity_id in dict.fromkeys(entity_ids)]
+        rows: list[Sequence[Any]] = []
+        with self._pool.connection() as connection:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                sql = f'{self._mapping.select_sql} WHERE "id" IN ({", ".join("?" * len(chunk))})'
+                rows.extend(connection.execute(sql, chunk).fetchall())
+        entities = (self._mapping.decode(row) for row in rows)
+        return {entity.id: entity for entity in entities}  # type: ignore[misc]
+
+    def list(self, query: SQLiteQuery | None = None) -> Sequence[EntityT]:
+        """Return entities matching ``query``, or all entities."""
+        sql, params = self._select(query)
+        with self._pool.connection() as connection:
+            rows = connection.execute(sql, params).fetchall()
+        return [self._mapping.decode(row) for row in rows]  # type: ignore[misc]
+
+    def update(self, entity: EntityT) -> None:
+        """Write the entity's changed fields."""
+        self.update_many((entity,))
+
+    def update_many(self, entities: Iterable[EntityT]) -> None:
+        """Write changed fields of several entities in one transaction.
+
+        Entities are grouped by their set of changed fields, and each group
+        is written with ``executemany``. For versioned entities, every
+        version is checked before the transaction commits. Entities are
+        touched, versioned, and marked clean only after the commit.
+        """
+        mapping = self._mapping
+        pending = []
+        for entity in entities:
+            changed = entity.changed_fields() - {"id"}
+            if changed:
+                pending.append((entity, changed))
+        if not pending:
+            return
+        now = datetime.now(UTC)
+        groups: dict[frozenset[str], list[list[Any]]] = {}
+        for entity, changed in pending:
+            touched = bool(changed - {"updated_at"})
+            if touched:
+                changed = changed | {"updated_at"}
+            if mapping.versioned:
+                changed = changed | {"version"}
+            sql_columns = mapping.update_sql(changed)[1]
+            params = mapping.encode(entity, sql_columns)
+            if touched:
+                params[sql_columns.index("updated_at")] = mapping.encode_value("updated_at", now)
+            if mapping.versioned:
+                params[sql_columns.index("version")] = entity.version + 1  # type: ignore[attr-defined]
+                params += [mapping.encode_id(entity.id), entity.version]  # type: ignore[attr-defined]
+            else:
+                params.append(mapping.encode_id(entity.id))
+            groups.setdefault(changed, []).append(params)
+        with self._pool.transaction() as connection:
+            connection.execute("SAVEPOINT batch")
+            written = 0
+            for changed, rows in groups.items():
+                sql = mapping.update_sql(changed)[0]
+                written += connection.executemany(sql, rows).rowcount
+            if written != len(pending):
+                connection.execute("ROLLBACK TO batch")
+                self._raise_write_conflict(connection, [entity for entity, _ in pending])
+        for entity, _ in pending:
+            entity.touch(now)
+            if mapping.versioned:
+                entity.version += 1  # type: ignore[attr-defined]
+            entity.mark_clean()
+
+    def remove(self, entity: EntityT) -> None:
+        """Delete an entity, checking its version if it has one."""
+        params: tuple[Any, ...] = (self._mapping.encode_id(entity.id),)
+        if self._mapping.versioned:
+            params += (entity.version,)  # type: ignore[attr-defined]
+        with self._pool.transaction() as connection:
+            if connection.execute(self._mapping.delete_sql, params).rowcount != 1:
+                self._raise_write_conflict(connection, [entity])
+
+    def _select(self, query: SQLiteQuery | None) -> tuple[str, Sequence[Any]]:
+        mapping = self._mapping
+        if query is None:
+            return mapping.select_sql, []
+        sql = mapping.select_sql
+        params: list[Any] = []
+        if query.filters:
+            conditions = []
+            for name, value in query.filters.items():
+                if value is None:
+                    conditions.append(f"{_quote(name)} IS NULL")
+                else:
+                    conditions.append(f"{_quote(name)} = ?")
+                    params.append(mapping.encode_value(name, value))
+            sql += " WHERE " + " AND ".join(conditions)
+        if query.order_by:
+            terms = []
+            for term in query.order_by:
+                name = term.removeprefix("-")
+                if name not in mapping.columns:
+                    raise ValueError(f"Unknown field {name!r}.")
+                terms.append(f"{_quote(name)} {'DESC' if term.startswith('-') else 'ASC'}")
+            sql += " ORDER BY " + ", ".join(terms)
+        if query.limit is not None:
+            sql += " LIMIT ?"
+            params.append(query.limit)
+        return sql, params
+
+    def _raise_write_conflict(
+        self, connection: sqlite3.Connection, entities: Sequence[EntityT]
+    ) -> None:
+        """Report which entities made a write fail, before its transaction rolls back.
+
+        The transaction still holds the write lock and its writes are undone,
+        so the rows read here are the ones the write saw.
+        """
+        missing = []
+        conflicts = []
+        rows = [
+            connection.execute(
+                self._mapping.version_sql, (self._mapping.encode_id(entity.id),)
+            ).fetchone()
+            for entity in entities
+        ]
+        for entity, row in zip(entities, rows, strict=True):
+            if row is None:
+                missing.append(entity.id)
+            elif self._mapping.versioned and row[0] != entity.version:  # type: ignore[attr-defined]
+                conflicts.append(entity.id)
+        if missing:
+            raise LookupError(f"Entities not found: {missing!r}.")
+        if not conflicts:
+            # The rows match, so no single entity can be blamed; report the batch.
+            conflicts = [entity.id for entity in entities]
+        raise ConcurrencyConflictError(
+            f"Entities were modified concurrently: {conflicts!r}.", conflicts
+        )
@@ -22,6 +22,23 @@
 
 """Backward-compatible re-exports for task commands."""
 
-from .commands.task import AsyncTask, Task, TaskBase, TaskDataDeserializationError
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .commands.task import AsyncTask, Task, TaskBase, TaskDataDeserializationError
 
 __all__ = ["TaskBase", "Task", "AsyncTask", "TaskDataDeserializationError"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".commands.task": (
+            "AsyncTask",
+            "Task",
+            "TaskBase",
+            "TaskDataDeserializationError",
+        ),
+    },
+)
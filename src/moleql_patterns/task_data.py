@@ -22,6 +22,22 @@
 
 """Backward-compatible re-exports for task data commands."""
 
-from .commands.task_data import TaskData, TaskDeserializationError, TaskSerializationError
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .commands.task_data import TaskData, TaskDeserializationError, TaskSerializationError
 
 __all__ = ["TaskData", "TaskSerializationError", "TaskDeserializationError"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".commands.task_data": (
+            "TaskData",
+            "TaskDeserializationError",
+            "TaskSerializationError",
+        ),
+    },
+)
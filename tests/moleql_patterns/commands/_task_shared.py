@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from moleql_patterns.commands import AsyncTask, Task, TaskData
+from moleql_patterns.commands import AsyncTask, ExecutionPolicy, RetryPolicy, Task, TaskData
 
 
 # =========================================================
@@ -66,6 +66,23 @@ class AsyncTaskWithoutDataCls(AsyncTask[ExampleTaskData]):
         return "ok"
 
 
+# =========================================================
+# CLASS TASK WITH NONE DATA CLS
+# =========================================================
+class TaskWithNoneDataCls(Task[ExampleTaskData]):
+    task_data_cls = None
+
+    def exec(self) -> str:
+        return "ok"
+
+
+# =========================================================
+# CLASS DERIVED SYNC TASK
+# =========================================================
+class DerivedSyncTask(SyncTask):
+    pass
+
+
 # =========================================================
 # CLASS TASK WITHOUT EXEC
 # =========================================================
@@ -78,3 +95,39 @@ class TaskWithoutExec(Task[ExampleTaskData]):
 # =========================================================
 class AsyncTaskWithoutExec(AsyncTask[ExampleTaskData]):
     task_data_cls = ExampleTaskData
+
+
+# =========================================================
+# CLASS RETRYING TASK
+# =========================================================
+class RetryingTask(Task[ExampleTaskData]):
+    task_data_cls = ExampleTaskData
+    execution_policy = ExecutionPolicy(retry=RetryPolicy(max_attempts=2, base_delay=0.0))
+
+    def __init__(self, task_data: dict[str, str]) -> None:
+        super().__init__(task_data)
+        self.calls = 0
+
+    def exec(self) -> str:
+        self.calls += 1
+        if self.calls == 1:
+            raise ConnectionError("transient")
+        return "ok"
+
+
+# =========================================================
+# CLASS ASYNC RETRYING TASK
+# =========================================================
+class AsyncRetryingTask(AsyncTask[ExampleTaskData]):
+    task_data_cls = ExampleTaskData
+    execution_policy = ExecutionPolicy(retry=RetryPolicy(max_attempts=2, base_delay=0.0))
+
+    def __init__(self, task_data: dict[str, str]) -> None:
+        super().__init__(task_data)
+        self.calls = 0
+
+    async def exec(self) -> str:
+        self.calls += 1
+        if self.calls == 1:
+            raise ConnectionError("transient")
+        return "ok"
@@ -0,0 +1,327 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+from collections.abc import Iterable
+
+import pytest
+from pydantic import BaseModel
+
+from moleql_patterns.commands import (
+    AccessDeniedError,
+    AccessPolicyMixin,
+    AllOf,
+    AnyOf,
+    APIOperation,
+    AsyncAPIOperation,
+    Not,
+    Permission,
+    Policy,
+    Predicate,
+    permission_scope,
+)
+
+
+# =========================================================
+# CLASS INVOICE
+# =========================================================
+class Invoice(BaseModel):
+    owner: str
+    approved: bool = False
+
+
+# =========================================================
+# CLASS PERMISSION DIRECTORY
+# =========================================================
+class PermissionDirectory:
+    def __init__(self, grants: dict[str, set[str]]) -> None:
+        self.grants = grants
+        self.lookups: list[str] = []
+
+    def permissions_for(self, user: str) -> set[str]:
+        self.lookups.append(user)
+        return self.grants.get(user, set())
+
+
+# =========================================================
+# CLASS INVOICE OPERATION
+# =========================================================
+class InvoiceOperation(AccessPolicyMixin, APIOperation[Invoice]):
+    def __init__(self, invoice: Invoice, user: str, directory: PermissionDirectory) -> None:
+        self.invoice = invoice
+        self.user = user
+        self._directory = directory
+
+    def principal_id(self) -> str:
+        return self.user
+
+    def load_permissions(self) -> Iterable[str]:
+        return self._directory.permissions_for(self.user)
+
+
+# =========================================================
+# CLASS APPROVE INVOICE
+# =========================================================
+class ApproveInvoice(InvoiceOperation):
+    access_policy = Permission("invoices:approve") & ~Predicate(
+        lambda operation: operation.invoice.owner == operation.user
+    )
+
+    def _execute(self) -> Invoice:
+        return self.invoice.model_copy(update={"approved": True})
+
+
+# =========================================================
+# CLASS READ INVOICE
+# =========================================================
+class ReadInvoice(InvoiceOperation):
+    access_policy = Permission("invoices:read") | Permission("invoices:admin")
+
+    def _execute(self) -> Invoice:
+        return self.invoice
+
+
+# =========================================================
+# CLASS OWN INVOICE
+# =========================================================
+class OwnInvoice(InvoiceOperation):
+    access_policy = Predicate(lambda operation: operation.invoice.owner == operation.user)
+
+    def _execute(self) -> Invoice:
+        return self.invoice
+
+
+# =========================================================
+# CLASS UNDECLARED INVOICE
+# =========================================================
+class UndeclaredInvoice(InvoiceOperation):
+    def _execute(self) -> Invoice:
+        return self.invoice
+
+
+# =========================================================
+# CLASS ASYNC READ INVOICE
+# =========================================================
+class AsyncReadInvoice(AccessPolicyMixin, AsyncAPIOperation[Invoice]):
+    access_policy = Permission("invoices:read")
+
+    def __init__(self, invoice: Invoice, user: str, directory: PermissionDirectory) -> None:
+        self.invoice = invoice
+        self.user = user
+        self._directory = directory
+
+    def principal_id(self) -> str:
+        return self.user
+
+    def load_permissions(self) -> Iterable[str]:
+        return self._directory.permissions_for(self.user)
+
+    async def _execute_async(self) -> Invoice:
+        return self.invoice
+
+
+@pytest.fixture
+def directory() -> PermissionDirectory:
+    return PermissionDirectory(
+        {
+            "alice": {"invoices:read", "invoices:approve"},
+            "bob": {"invoices:admin"},
+        }
+    )
+
+
+INVOICE = Invoice(owner="bob")
+
+
+def evaluate(policy: Policy, permissions: set[str], operation: object = None) -> bool:
+    return policy.compile()(operation, frozenset(permissions))
+
+
+# =========================================================
+# CLASS TEST POLICY EXPRESSIONS
+# =========================================================
+class TestPolicyExpressions:
+    def test_permission(self) -> None:
+        assert evaluate(Permission("a"), {"a"})
+        assert not evaluate(Permission("a"), {"b"})
+
+    def test_all_of_permissions(self) -> None:
+        policy = Permission("a") & Permission("b")
+
+        assert evaluate(policy, {"a", "b", "c"})
+        assert not evaluate(policy, {"a"})
+
+    def test_any_of_permissions(self) -> None:
+        policy = Permission("a") | Permission("b")
+
+        assert evaluate(policy, {"b"})
+        assert not evaluate(policy, {"c"})
+
+    def test_not(self) -> None:
+        assert evaluate(~Permission("a"), set())
+        assert not evaluate(~Permission("a"), {"a"})
+
+    def test_predicate_receives_operation(self) -> None:
+        policy = Predicate(lambda operation: operation == "me")
+
+        assert evaluate(policy, set(), "me")
+        assert not evaluate(policy, set(), "you")
+
+    def test_mixed_all_of(self) -> None:
+        policy = Permission("a") & Predicate(lambda operation: operation)
+
+        assert evaluate(policy, {"a"}, True)
+        assert not evaluate(policy, {"a"}, False)
+        assert not evaluate(policy, set(), True)
+
+    def test_mixed_any_of(self) -> None:
+        policy = Permission("a") | Predicate(lambda operation: operation)
+
+        assert evaluate(policy, {"a"}, False)
+        assert evaluate(policy, set(), True)
+        assert not evaluate(policy, set(), False)
+
+    def test_nested_composites_are_flattened(self) -> None:
+        policy = Permission("a") & Permission("b") & Permission("c")
+
+        assert isinstance(policy, AllOf)
+        assert len(policy.policies) == 3
+
+    def test_different_composites_are_not_flattened(self) -> None:
+        policy = AnyOf(AllOf(Permission("a"), Permission("b")), Permission("c"))
+
+        assert evaluate(policy, {"a", "b"})
+        assert evaluate(policy, {"c"})
+        assert not evaluate(policy, {"a"})
+
+    def test_permission_names(self) -> None:
+        policy = (Permission("a") | ~Permission("b")) & Predicate(bool)
+
+        assert policy.permission_names() == {"a", "b"}
+
+    @pytest.mark.parametrize("cls", [AllOf, AnyOf])
+    def test_composite_requires_policies(self, cls: type[Policy]) -> None:
+        with pytest.raises(ValueError):
+            cls()
+
+    def test_repr(self) -> None:
+        policy = Permission("a") & Not(Predicate(bool))
+
+        assert repr(policy) == "AllOf(Permission('a'), Not(Predicate('bool')))"
+
+    def test_base_class_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            Policy()
+
+    @pytest.mark.parametrize("method", ["compile", "permission_names"])
+    def test_base_methods_raise(self, method: str) -> None:
+        with pytest.raises(NotImplementedError):
+            getattr(Policy, method)(Permission("a"))
+
+
+# =========================================================
+# CLASS TEST ACCESS POLICY MIXIN
+# =========================================================
+class TestAccessPolicyMixin:
+    def test_policy_is_compiled_per_class(self) -> None:
+        assert ApproveInvoice._access_evaluator is not ReadInvoice._access_evaluator
+        assert ApproveInvoice._loads_permissions
+        assert not OwnInvoice._loads_permissions
+
+    def test_grants_access(self, directory: PermissionDirectory) -> None:
+        result = ApproveInvoice(INVOICE, "alice", directory).execute()
+
+        assert result.approved
+
+    def test_denies_access(self, directory: PermissionDirectory) -> None:
+        with pytest.raises(AccessDeniedError, match="ApproveInvoice"):
+            ApproveInvoice(Invoice(owner="alice"), "alice", directory).execute()
+
+    def test_any_of_grants_access(self, directory: PermissionDirectory) -> None:
+        assert ReadInvoice(INVOICE, "bob", directory).execute() == INVOICE
+
+    def test_unknown_principal_is_denied(self, directory: PermissionDirectory) -> None:
+        with pytest.raises(AccessDeniedError):
+            ReadInvoice(INVOICE, "mallory", directory).execute()
+
+    def test_predicate_only_policy_skips_lookup(self, directory: PermissionDirectory) -> None:
+        OwnInvoice(INVOICE, "bob", directory).execute()
+
+        assert directory.lookups == []
+
+    def test_missing_policy_denies(self, directory: PermissionDirectory) -> None:
+        with pytest.raises(AccessDeniedError, match="no access policy"):
+            UndeclaredInvoice(INVOICE, "alice", directory).execute()
+
+    def test_async_operation(self, directory: PermissionDirectory) -> None:
+        result = asyncio.run(AsyncReadInvoice(INVOICE, "alice", directory).execute_async())
+
+        assert result == INVOICE
+
+    @pytest.mark.parametrize("method", ["principal_id", "load_permissions"])
+    def test_base_methods_raise(self, method: str, directory: PermissionDirectory) -> None:
+        operation = ReadInvoice(INVOICE, "alice", directory)
+
+        with pytest.raises(NotImplementedError):
+            getattr(AccessPolicyMixin, method)(operation)
+
+
+# =========================================================
+# CLASS TEST PERMISSION SCOPE
+# =========================================================
+class TestPermissionScope:
+    def test_without_scope_permissions_load_every_time(
+        self, directory: PermissionDirectory
+    ) -> None:
+        ReadInvoice(INVOICE, "alice", directory).execute()
+        ReadInvoice(INVOICE, "alice", directory).execute()
+
+        assert directory.lookups == ["alice", "alice"]
+
+    def test_scope_caches_per_principal(self, directory: PermissionDirectory) -> None:
+        with permission_scope():
+            ReadInvoice(INVOICE, "alice", directory).execute()
+            ApproveInvoice(INVOICE, "alice", directory).execute()
+            ReadInvoice(INVOICE, "bob", directory).execute()
+
+        assert directory.lookups == ["alice", "bob"]
+
+    def test_cache_ends_with_scope(self, directory: PermissionDirectory) -> None:
+        with permission_scope():
+            ReadInvoice(INVOICE, "alice", directory).execute()
+        with permission_scope():
+            ReadInvoice(INVOICE, "alice", directory).execute()
+
+        assert directory.lookups == ["alice", "alice"]
+
+    def test_async_tasks_have_separate_scopes(self, directory: PermissionDirectory) -> None:
+        async def request() -> None:
+            with permission_scope():
+                await AsyncReadInvoice(INVOICE, "alice", directory).execute_async()
+                await AsyncReadInvoice(INVOICE, "alice", directory).execute_async()
+
+        async def scenario() -> None:
+            await asyncio.gather(request(), request())
+
+        asyncio.run(scenario())
+
+        assert directory.lookups == ["alice", "alice"]
@@ -0,0 +1,267 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from moleql_patterns.commands import (
+    AccessDeniedError,
+    APIOperation,
+    AsyncAPIOperation,
+    async_bridge,
+    shutdown_bridges,
+)
+
+from ._api_operation_shared import ExampleResult
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="none")
+
+
+# =========================================================
+# CLASS THREAD RECORDING OPERATION
+# =========================================================
+class ThreadRecordingOperation(APIOperation[ExampleResult]):
+    def __init__(self) -> None:
+        self.thread: threading.Thread | None = None
+        self.request_id: str | None = None
+
+    def verify_access(self) -> None:
+        pass
+
+    def _execute(self) -> ExampleResult:
+        self.thread = threading.current_thread()
+        self.request_id = request_id.get()
+        return ExampleResult(value=1)
+
+
+# =========================================================
+# CLASS DENIED OPERATION
+# =========================================================
+class DeniedOperation(ThreadRecordingOperation):
+    def verify_access(self) -> None:
+        raise AccessDeniedError("no")
+
+
+# =========================================================
+# CLASS GATED OPERATION
+# =========================================================
+class GatedOperation(APIOperation[ExampleResult]):
+    executor_concurrency = 2
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def verify_access(self) -> None:
+        pass
+
+    def _execute(self) -> ExampleResult:
+        cls = type(self)
+        with cls.lock:
+            cls.running += 1
+            cls.peak = max(cls.peak, cls.running)
+        cls.release.wait(5)
+        with cls.lock:
+            cls.running -= 1
+        return ExampleResult(value=1)
+
+
+# =========================================================
+# CLASS ASYNC RECORDING OPERATION
+# =========================================================
+class AsyncRecordingOperation(AsyncAPIOperation[ExampleResult]):
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.request_id: str | None = None
+        self.cancelled = False
+
+    def verify_access(self) -> None:
+        pass
+
+    async def _execute_async(self) -> ExampleResult:
+        self.loop = asyncio.get_running_loop()
+        self.request_id = request_id.get()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return ExampleResult(value=2)
+
+
+@pytest.fixture(autouse=True)
+def bridges() -> Iterator[None]:
+    yield
+    shutdown_bridges()
+
+
+# =========================================================
+# CLASS TEST EXECUTE IN EXECUTOR
+# =========================================================
+class TestExecuteInExecutor:
+    def test_runs_in_worker_thread(self) -> None:
+        operation = ThreadRecordingOperation()
+
+        result = asyncio.run(operation.execute_in_executor())
+
+        assert result == ExampleResult(value=1)
+        assert operation.thread is not threading.current_thread()
+
+    def test_propagates_context(self) -> None:
+        operation = ThreadRecordingOperation()
+
+        async def scenario() -> None:
+            request_id.set("req-1")
+            await operation.execute_in_executor()
+
+        asyncio.run(scenario())
+
+        assert operation.request_id == "req-1"
+
+    def test_access_errors_propagate(self) -> None:
+        with pytest.raises(AccessDeniedError):
+            asyncio.run(DeniedOperation().execute_in_executor())
+
+    def test_custom_executor(self) -> None:
+        operation = ThreadRecordingOperation()
+
+        with concurrent.futures.ThreadPoolExecutor(thread_name_prefix="custom") as executor:
+            asyncio.run(operation.execute_in_executor(executor=executor))
+
+        assert operation.thread.name.startswith("custom")
+
+    def test_enforces_class_concurrency(self) -> None:
+        GatedOperation.release.clear()
+        GatedOperation.peak = 0
+
+        async def scenario() -> None:
+            calls = [
+                asyncio.ensure_future(GatedOperation().execute_in_executor()) for _ in range(5)
+            ]
+            await asyncio.sleep(0.05)
+            GatedOperation.release.set()
+            await asyncio.gather(*calls)
+
+        asyncio.run(scenario())
+
+        assert GatedOperation.peak == 2
+
+    def test_cancellation_releases_slot(self) -> None:
+        GatedOperation.release.clear()
+
+        async def scenario() -> ExampleResult:
+            first = asyncio.ensure_future(GatedOperation().execute_in_executor())
+            second = asyncio.ensure_future(GatedOperation().execute_in_executor())
+            waiting = asyncio.ensure_future(GatedOperation().execute_in_executor())
+            await asyncio.sleep(0.05)
+            first.cancel()
+            GatedOperation.release.set()
+            await asyncio.gather(second, waiting)
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await GatedOperation().execute_in_executor()
+
+        assert asyncio.run(scenario()) == ExampleResult(value=1)
+
+    def test_submit_failure_releases_slot(self) -> None:
+        executor = concurrent.futures.ThreadPoolExecutor()
+        executor.shutdown()
+
+        async def scenario() -> None:
+            for _ in range(3):
+                with pytest.raises(RuntimeError):
+                    await GatedOperation().execute_in_executor(executor=executor)
+
+        asyncio.run(scenario())
+
+    def test_release_after_loop_closed_is_ignored(self) -> None:
+        loop = asyncio.new_event_loop()
+        loop.close()
+
+        async_bridge._release_from_thread(loop, asyncio.Semaphore(1))
+
+
+# =========================================================
+# CLASS TEST EXECUTE SYNC
+# =========================================================
+class TestExecuteSync:
+    def test_runs_on_shared_background_loop(self) -> None:
+        first = AsyncRecordingOperation()
+        second = AsyncRecordingOperation()
+
+        assert first.execute_sync() == ExampleResult(value=2)
+        second.execute_sync()
+
+        assert first.loop is second.loop
+        assert first.loop is async_bridge._loop
+
+    def test_propagates_context(self) -> None:
+        operation = AsyncRecordingOperation()
+
+        def call() -> None:
+            request_id.set("req-2")
+            operation.execute_sync()
+
+        contextvars.copy_context().run(call)
+
+        assert operation.request_id == "req-2"
+
+    def test_timeout_cancels_call(self) -> None:
+        operation = AsyncRecordingOperation(delay=5.0)
+
+        with pytest.raises(TimeoutError):
+            operation.execute_sync(timeout=0.05)
+
+        async_bridge._loop.call_soon_threadsafe(lambda: None)
+        for _ in range(100):
+            if operation.cancelled:
+                break
+            threading.Event().wait(0.01)
+        assert operation.cancelled
+
+    def test_rejects_calls_from_background_loop(self) -> None:
+        AsyncRecordingOperation().execute_sync()
+
+        async def nested() -> None:
+            AsyncRecordingOperation().execute_sync()
+
+        future = asyncio.run_coroutine_threadsafe(nested(), async_bridge._loop)
+
+        with pytest.raises(RuntimeError, match="background loop"):
+            future.result(5)
+
+    def test_shutdown_recreates_loop(self) -> None:
+        first = AsyncRecordingOperation()
+        first.execute_sync()
+        shutdown_bridges()
+
+        second = AsyncRecordingOperation()
+        second.execute_sync()
+
+        assert first.loop.is_closed()
+        assert second.loop is not first.loop
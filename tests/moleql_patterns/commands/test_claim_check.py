@@ -0,0 +1,325 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from pathlib import Path
+
+import pytest
+
+from moleql_patterns.commands import (
+    Blob,
+    BlobNotFoundError,
+    BlobStore,
+    ClaimCheckTaskData,
+    FileSystemBlobStore,
+    InMemoryBlobStore,
+    TaskDeserializationError,
+    TaskSerializationError,
+)
+
+LARGE = b"x" * 64
+SMALL = b"tiny"
+
+
+# =========================================================
+# CLASS REPORT TASK DATA
+# =========================================================
+class ReportTaskData(ClaimCheckTaskData):
+    blob_store = InMemoryBlobStore()
+    offload_threshold = 32
+
+    title: str
+    dataset: Blob
+    thumbnail: Blob | None = None
+
+
+# =========================================================
+# CLASS INLINE REPORT TASK DATA
+# =========================================================
+class InlineReportTaskData(ClaimCheckTaskData):
+    title: str
+    dataset: Blob
+
+
+# =========================================================
+# CLASS PLAIN CLAIM CHECK TASK DATA
+# =========================================================
+class PlainClaimCheckTaskData(ClaimCheckTaskData):
+    blob_store = InMemoryBlobStore()
+    title: str
+
+
+def make_report(**overrides: object) -> ReportTaskData:
+    return ReportTaskData(correlation_id="c-1", title="q3", dataset=LARGE, **overrides)
+
+
+# =========================================================
+# CLASS TEST BLOB STORE CONTRACT
+# =========================================================
+class TestBlobStoreContract:
+    def test_base_class_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            BlobStore()
+
+    @pytest.mark.parametrize(
+        ("method", "args"), [("put", (b"",)), ("get", ("k",)), ("delete", ("k",))]
+    )
+    def test_base_methods_raise(self, method: str, args: tuple[object, ...]) -> None:
+        with pytest.raises(NotImplementedError):
+            getattr(BlobStore, method)(object(), *args)
+
+
+# =========================================================
+# CLASS TEST BLOB STORES
+# =========================================================
+class TestBlobStores:
+    @pytest.fixture(params=["memory", "filesystem"])
+    def store(self, request: pytest.FixtureRequest, tmp_path: Path) -> BlobStore:
+        if request.param == "memory":
+            return InMemoryBlobStore()
+        return FileSystemBlobStore(tmp_path / "blobs")
+
+    def test_put_and_get(self, store: BlobStore) -> None:
+        key = store.put(LARGE)
+
+        assert bytes(store.get(key)) == LARGE
+
+    def test_keys_are_content_addressed(self, store: BlobStore) -> None:
+        assert store.put(LARGE) == store.put(bytearray(LARGE))
+
+    def test_empty_blob(self, store: BlobStore) -> None:
+        key = store.put(b"")
+
+        assert bytes(store.get(key)) == b""
+
+    def test_missing_blob(self, store: BlobStore) -> None:
+        with pytest.raises(BlobNotFoundError):
+            store.get("0" * 64)
+
+    def test_delete(self, store: BlobStore) -> None:
+        key = store.put(LARGE)
+
+        store.delete(key)
+        store.delete(key)
+
+        with pytest.raises(BlobNotFoundError):
+            store.get(key)
+
+    def test_filesystem_rejects_invalid_keys(self, tmp_path: Path) -> None:
+        store = FileSystemBlobStore(tmp_path)
+
+        with pytest.raises(BlobNotFoundError):
+            store.get("../escape")
+
+    def test_filesystem_write_is_atomic(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = FileSystemBlobStore(tmp_path)
+
+        def fail(*args: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("os.replace", fail)
+
+        with pytest.raises(OSError):
+            store.put(LARGE)
+        assert [path for path in tmp_path.rglob("*") if path.is_file()] == []
+
+    def test_filesystem_get_is_memory_mapped(self, tmp_path: Path) -> None:
+        store = FileSystemBlobStore(tmp_path)
+        key = store.put(LARGE)
+
+        view = store.get(key)
+
+        assert view.readonly
+        assert type(view.obj).__name__ == "mmap"
+
+    def test_in_memory_store_size(self) -> None:
+        store = InMemoryBlobStore()
+
+        key = store.put(LARGE)
+        store.put(LARGE)
+
+        assert key in store
+        assert len(store) == 1
+
+
+# =========================================================
+# CLASS TEST BLOB
+# =========================================================
+class TestBlob:
+    def test_wraps_bytes(self) -> None:
+        blob = Blob(LARGE)
+
+        assert bytes(blob) == LARGE
+        assert len(blob) == len(LARGE)
+        assert blob.is_loaded
+
+    def test_reference_loads_lazily(self) -> None:
+        store = InMemoryBlobStore()
+        key = store.put(LARGE)
+
+        blob = Blob.reference(store, key, len(LARGE))
+
+        assert not blob.is_loaded
+        assert len(blob) == len(LARGE)
+        assert bytes(blob) == LARGE
+        assert blob.is_loaded
+
+    def test_references_with_same_key_are_equal_without_loading(self) -> None:
+        store = InMemoryBlobStore()
+        key = store.put(LARGE)
+        first = Blob.reference(store, key, len(LARGE))
+        second = Blob.reference(store, key, len(LARGE))
+
+        assert first == second
+        assert not first.is_loaded
+
+    def test_equality_compares_content(self) -> None:
+        assert Blob(LARGE) == Blob(bytearray(LARGE))
+        assert Blob(LARGE) != Blob(SMALL)
+        assert Blob(LARGE) != LARGE
+
+    def test_is_not_hashable(self) -> None:
+        with pytest.raises(TypeError):
+            hash(Blob(LARGE))
+
+    def test_repr(self) -> None:
+        assert repr(Blob(SMALL)) == "Blob(size=4, key=None)"
+
+
+# =========================================================
+# CLASS TEST CLAIM CHECK TASK DATA
+# =========================================================
+class TestClaimCheckTaskData:
+    def test_detects_blob_fields(self) -> None:
+        assert ReportTaskData._blob_fields == {"dataset", "thumbnail"}
+        assert PlainClaimCheckTaskData._blob_fields == frozenset()
+
+    def test_accepts_bytes(self) -> None:
+        data = make_report()
+
+        assert isinstance(data.dataset, Blob)
+        assert bytes(data.dataset) == LARGE
+
+    def test_rejects_other_types(self) -> None:
+        with pytest.raises(ValueError):
+            ReportTaskData(correlation_id="c-1", title="q3", dataset=5)
+
+    def test_large_blob_is_offloaded(self) -> None:
+        payload = make_report().to_payload()
+
+        reference = payload["dataset"]
+        assert reference["size"] == len(LARGE)
+        assert bytes(ReportTaskData.blob_store.get(reference["$blob"])) == LARGE
+
+    def test_small_blob_stays_inline(self) -> None:
+        payload = make_report(thumbnail=SMALL).to_payload()
+
+        assert payload["thumbnail"] == SMALL
+
+    def test_optional_blob_none(self) -> None:
+        payload = make_report().to_payload()
+
+        assert payload["thumbnail"] is None
+
+    def test_round_trip_loads_lazily(self) -> None:
+        original = make_report(thumbnail=SMALL)
+
+        restored = ReportTaskData.from_payload(original.to_payload())
+
+        assert not restored.dataset.is_loaded
+        assert restored == original
+        assert bytes(restored.thumbnail) == SMALL
+
+    def test_reserializing_reuses_reference_without_loading(self) -> None:
+        restored = ReportTaskData.from_payload(make_report().to_payload())
+
+        payload = restored.to_payload()
+
+        assert payload["dataset"]["$blob"] == make_report().to_payload()["dataset"]["$blob"]
+        assert not restored.dataset.is_loaded
+
+    def test_no_store_keeps_blobs_inline(self) -> None:
+        data = InlineReportTaskData(correlation_id="c-1", title="q3", dataset=LARGE)
+
+        payload = data.to_payload()
+
+        assert payload["dataset"] == LARGE
+        assert InlineReportTaskData.from_payload(payload) == data
+
+    def test_class_without_blob_fields(self) -> None:
+        data = PlainClaimCheckTaskData(correlation_id="c-1", title="q3")
+
+        assert PlainClaimCheckTaskData.from_payload(data.to_payload()) == data
+
+    def test_filesystem_store_round_trip(self, tmp_path: Path) -> None:
+        # =========================================================
+        # CLASS FILE REPORT TASK DATA
+        # =========================================================
+        class FileReportTaskData(ReportTaskData):
+            blob_store = FileSystemBlobStore(tmp_path)
+
+        original = FileReportTaskData(correlation_id="c-1", title="q3", dataset=LARGE)
+
+        restored = FileReportTaskData.from_payload(original.to_payload())
+
+        assert bytes(restored.dataset) == LARGE
+
+    def test_reference_without_store_fails(self) -> None:
+        payload = make_report().to_payload()
+
+        with pytest.raises(TaskDeserializationError, match="no blob_store"):
+            InlineReportTaskData.from_payload(payload)
+
+    def test_invalid_reference_fails(self) -> None:
+        payload = {"correlation_id": "c-1", "title": "q3", "dataset": {"$blob": "k"}}
+
+        with pytest.raises(TaskDeserializationError, match="Invalid blob reference"):
+            ReportTaskData.from_payload(payload)
+
+    def test_missing_blob_fails_on_access(self) -> None:
+        payload = {
+            "correlation_id": "c-1",
+            "title": "q3",
+            "dataset": {"$blob": "0" * 64, "size": 3},
+        }
+
+        data = ReportTaskData.from_payload(payload)
+
+        with pytest.raises(BlobNotFoundError):
+            bytes(data.dataset)
+
+    def test_serialization_error_is_wrapped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        data = make_report()
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise ValueError("boom")
+
+        monkeypatch.setattr(ReportTaskData, "model_dump", fail)
+
+        with pytest.raises(TaskSerializationError):
+            data.to_payload()
+
+    def test_model_dump_json_encodes_blob_bytes(self) -> None:
+        data = InlineReportTaskData(correlation_id="c-1", title="q3", dataset=SMALL)
+
+        assert '"dataset":"tiny"' in data.model_dump_json()
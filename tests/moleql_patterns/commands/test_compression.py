@@ -0,0 +1,284 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import zlib
+
+import pytest
+from pydantic import ValidationError
+
+from moleql_patterns.commands import (
+    PayloadCompression,
+    TaskData,
+    TaskDeserializationError,
+    TaskSerializationError,
+    available_codecs,
+)
+from moleql_patterns.commands.compression import decompress_payload
+
+SAMPLES = [
+    json.dumps(
+        {
+            "correlation_id": f"c-{index}",
+            "recipient": f"user{index}@example.com",
+            "template": "welcome",
+        }
+    ).encode()
+    for index in range(50)
+]
+LARGE = json.dumps({"items": ["repeated value"] * 200}).encode()
+
+
+# =========================================================
+# CLASS EMAIL TASK DATA
+# =========================================================
+class EmailTaskData(TaskData):
+    recipient: str
+    template: str
+
+
+# =========================================================
+# CLASS COMPRESSED EMAIL TASK DATA
+# =========================================================
+class CompressedEmailTaskData(EmailTaskData):
+    compression = PayloadCompression(threshold=0)
+
+
+# =========================================================
+# CLASS DICTIONARY EMAIL TASK DATA
+# =========================================================
+class DictionaryEmailTaskData(EmailTaskData):
+    compression = PayloadCompression(
+        threshold=0, dictionary=PayloadCompression.train_dictionary(SAMPLES, size=2048)
+    )
+
+
+# =========================================================
+# CLASS LINE ENCODED TASK DATA
+# =========================================================
+class LineEncodedTaskData(EmailTaskData):
+    compression = PayloadCompression(threshold=0, codec="lzma")
+
+    @classmethod
+    def dumps_payload(cls, payload: dict[str, object]) -> bytes:
+        return "\n".join(f"{key}={value}" for key, value in payload.items()).encode()
+
+    @classmethod
+    def loads_payload(cls, data: bytes) -> dict[str, object]:
+        return dict(line.split("=", 1) for line in data.decode().splitlines())
+
+
+# =========================================================
+# CLASS ATTACHMENT TASK DATA
+# =========================================================
+class AttachmentTaskData(TaskData):
+    content: bytes
+
+
+# =========================================================
+# CLASS COMPRESSED ATTACHMENT TASK DATA
+# =========================================================
+class CompressedAttachmentTaskData(AttachmentTaskData):
+    compression = PayloadCompression(threshold=0)
+
+
+def make_email(cls: type[EmailTaskData] = EmailTaskData) -> EmailTaskData:
+    return cls(correlation_id="c-1", recipient="bob@example.com", template="welcome")
+
+
+# =========================================================
+# CLASS TEST PAYLOAD COMPRESSION
+# =========================================================
+class TestPayloadCompression:
+    @pytest.mark.parametrize("codec", available_codecs())
+    def test_round_trip(self, codec: str) -> None:
+        compression = PayloadCompression(codec=codec, threshold=0)
+
+        assert compression.decompress(compression.compress(LARGE)) == LARGE
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_compresses_repetitive_data(self, codec: str) -> None:
+        compression = PayloadCompression(codec=codec, threshold=0)
+
+        assert len(compression.compress(LARGE)) < len(LARGE) // 5
+
+    def test_below_threshold_is_not_compressed(self) -> None:
+        compression = PayloadCompression(threshold=len(LARGE) + 1)
+
+        frame = compression.compress(LARGE)
+
+        assert frame == b"\x00" + LARGE
+        assert compression.decompress(frame) == LARGE
+
+    def test_header_identifies_codec(self) -> None:
+        frame = PayloadCompression(codec="lzma", threshold=0).compress(LARGE)
+
+        assert frame[0] == 2
+        assert PayloadCompression(codec="zlib").decompress(frame) == LARGE
+
+    def test_plain_json_passes_through(self) -> None:
+        assert decompress_payload(b'{"a": 1}') == b'{"a": 1}'
+
+    @pytest.mark.parametrize("frame", [b"", b"\x7f data"])
+    def test_invalid_frames(self, frame: bytes) -> None:
+        with pytest.raises(ValueError):
+            decompress_payload(frame)
+
+    def test_level_is_applied(self) -> None:
+        fast = PayloadCompression(threshold=0, level=0).compress(LARGE)
+
+        assert len(fast) > len(PayloadCompression(threshold=0, level=9).compress(LARGE))
+
+    @pytest.mark.parametrize("codec", sorted({"zstd", "lz4"} - set(available_codecs())))
+    def test_missing_optional_codec(self, codec: str) -> None:
+        with pytest.raises(ValidationError, match="requires"):
+            PayloadCompression(codec=codec)
+
+    def test_unavailable_codec_in_header(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("moleql_patterns.commands.compression.lz4_frame", None)
+
+        with pytest.raises(ValueError, match="requires the 'lz4' package"):
+            decompress_payload(b"\x04data")
+
+    def test_dictionary_requires_supporting_codec(self) -> None:
+        with pytest.raises(ValidationError, match="does not support dictionaries"):
+            PayloadCompression(codec="lzma", dictionary=b"abc")
+
+
+# =========================================================
+# CLASS TEST COMPRESSION DICTIONARIES
+# =========================================================
+class TestCompressionDictionaries:
+    def test_dictionary_improves_small_payloads(self) -> None:
+        sample = make_email().model_dump_json().encode()
+        dictionary = PayloadCompression.train_dictionary(SAMPLES, size=2048)
+
+        plain = PayloadCompression(threshold=0).compress(sample)
+        trained = PayloadCompression(threshold=0, dictionary=dictionary).compress(sample)
+
+        assert len(trained) < len(plain)
+
+    def test_header_carries_dictionary_id(self) -> None:
+        dictionary = PayloadCompression.train_dictionary(SAMPLES)
+
+        frame = PayloadCompression(threshold=0, dictionary=dictionary).compress(LARGE)
+
+        assert frame[0] == 0x81
+        assert int.from_bytes(frame[1:5], "big") == zlib.crc32(dictionary)
+
+    def test_wrong_dictionary_is_rejected(self) -> None:
+        frame = PayloadCompression(threshold=0, dictionary=b"first").compress(LARGE)
+
+        with pytest.raises(ValueError, match="dictionary"):
+            PayloadCompression(dictionary=b"second").decompress(frame)
+
+    def test_missing_dictionary_is_rejected(self) -> None:
+        frame = PayloadCompression(threshold=0, dictionary=b"first").compress(LARGE)
+
+        with pytest.raises(ValueError, match="dictionary"):
+            decompress_payload(frame)
+
+    def test_zlib_dictionary_is_bounded(self) -> None:
+        dictionary = PayloadCompression.train_dictionary([b"x" * 100_000], size=64 * 1024)
+
+        assert len(dictionary) == 32 * 1024
+
+    def test_training_requires_samples(self) -> None:
+        with pytest.raises(ValueError):
+            PayloadCompression.train_dictionary([])
+
+    def test_training_rejects_codec_without_dictionaries(self) -> None:
+        with pytest.raises(ValueError):
+            PayloadCompression.train_dictionary(SAMPLES, codec="lzma")
+
+    @pytest.mark.skipif("zstd" in available_codecs(), reason="zstandard is installed")
+    def test_zstd_training_requires_zstandard(self) -> None:
+        with pytest.raises(ValueError, match="zstandard"):
+            PayloadCompression.train_dictionary(SAMPLES, codec="zstd")
+
+    @pytest.mark.skipif("zstd" not in available_codecs(), reason="zstandard is not installed")
+    def test_zstd_dictionary_round_trip(self) -> None:
+        samples = SAMPLES * 40
+        dictionary = PayloadCompression.train_dictionary(samples, size=1024, codec="zstd")
+        compression = PayloadCompression(codec="zstd", threshold=0, dictionary=dictionary)
+
+        assert compression.decompress(compression.compress(SAMPLES[0])) == SAMPLES[0]
+
+
+# =========================================================
+# CLASS TEST TASK DATA BYTES
+# =========================================================
+class TestTaskDataBytes:
+    def test_uncompressed_is_plain_json(self) -> None:
+        data = make_email()
+
+        encoded = data.to_bytes()
+
+        assert json.loads(encoded) == data.to_payload()
+        assert EmailTaskData.from_bytes(encoded) == data
+
+    @pytest.mark.parametrize(
+        "cls", [CompressedEmailTaskData, DictionaryEmailTaskData, LineEncodedTaskData]
+    )
+    def test_round_trip(self, cls: type[EmailTaskData]) -> None:
+        data = make_email(cls)
+
+        encoded = data.to_bytes()
+
+        assert encoded[:1] != b"{"
+        assert cls.from_bytes(encoded) == data
+
+    @pytest.mark.parametrize("cls", [AttachmentTaskData, CompressedAttachmentTaskData])
+    def test_round_trip_non_utf8_bytes(self, cls: type[AttachmentTaskData]) -> None:
+        data = cls(correlation_id="c-1", content=b"\xff\x00\xfe")
+
+        assert cls.from_bytes(data.to_bytes()) == data
+
+    def test_reader_detects_compression(self) -> None:
+        encoded = make_email(CompressedEmailTaskData).to_bytes()
+
+        assert EmailTaskData.from_bytes(encoded) == make_email()
+
+    def test_compressed_reader_accepts_plain_json(self) -> None:
+        encoded = make_email().to_bytes()
+
+        assert CompressedEmailTaskData.from_bytes(encoded) == make_email(CompressedEmailTaskData)
+
+    def test_invalid_bytes(self) -> None:
+        with pytest.raises(TaskDeserializationError):
+            EmailTaskData.from_bytes(b"\x01not zlib")
+
+    def test_invalid_payload_after_decoding(self) -> None:
+        with pytest.raises(TaskDeserializationError):
+            EmailTaskData.from_bytes(b'{"correlation_id": "c-1"}')
+
+    def test_encoding_error_is_wrapped(self) -> None:
+        # =========================================================
+        # CLASS BROKEN TASK DATA
+        # =========================================================
+        class BrokenTaskData(EmailTaskData):
+            @classmethod
+            def dumps_payload(cls, payload: dict[str, object]) -> bytes:
+                raise ValueError("boom")
+
+        with pytest.raises(TaskSerializationError):
+            make_email(BrokenTaskData).to_bytes()
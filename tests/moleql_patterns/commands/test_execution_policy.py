@@ -0,0 +1,359 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from moleql_patterns.commands import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ExecutionPolicy,
+    RetryPolicy,
+    TaskTimeoutError,
+)
+from moleql_patterns.commands.execution_policy import run_with_policy, run_with_policy_async
+
+REQUEST_ID: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+# =========================================================
+# CLASS FAKE CLOCK
+# =========================================================
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# =========================================================
+# CLASS FLAKY
+# =========================================================
+class Flaky:
+    def __init__(self, failures: int, exc: type[Exception] = ConnectionError) -> None:
+        self.failures = failures
+        self.exc = exc
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.exc("downstream failed")
+        return "ok"
+
+    async def run_async(self) -> str:
+        return self()
+
+
+# =========================================================
+# CLASS TEST RETRY POLICY
+# =========================================================
+class TestRetryPolicy:
+    def test_delay_grows_exponentially(self) -> None:
+        policy = RetryPolicy(base_delay=0.5, multiplier=2.0, jitter=False)
+
+        delays = [policy.compute_delay(attempt) for attempt in (1, 2, 3)]
+
+        assert delays == [0.5, 1.0, 2.0]
+
+    def test_delay_is_capped(self) -> None:
+        policy = RetryPolicy(base_delay=1.0, max_delay=3.0, jitter=False)
+
+        assert policy.compute_delay(10) == 3.0
+
+    def test_jitter_stays_within_bounds(self) -> None:
+        policy = RetryPolicy(base_delay=1.0, jitter=True)
+
+        delays = [policy.compute_delay(2) for _ in range(100)]
+
+        assert all(0.0 <= delay <= 2.0 for delay in delays)
+
+    def test_should_retry_respects_attempts_and_types(self) -> None:
+        policy = RetryPolicy(max_attempts=2, retry_on=(ConnectionError,))
+
+        assert policy.should_retry(ConnectionError(), 1) is True
+        assert policy.should_retry(ConnectionError(), 2) is False
+        assert policy.should_retry(ValueError(), 1) is False
+
+    def test_open_circuit_is_never_retried(self) -> None:
+        policy = RetryPolicy(max_attempts=5)
+
+        assert policy.should_retry(CircuitOpenError(), 1) is False
+
+    def test_rejects_invalid_attempts(self) -> None:
+        with pytest.raises(ValidationError):
+            RetryPolicy(max_attempts=0)
+
+
+# =========================================================
+# CLASS TEST CIRCUIT BREAKER
+# =========================================================
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self) -> None:
+        breaker = CircuitBreaker("smtp", failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_half_open_allows_single_probe(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("smtp", failure_threshold=1, recovery_timeout=10.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 10.0
+
+        assert breaker.state == "half_open"
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_successful_probe_closes(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("smtp", failure_threshold=1, recovery_timeout=1.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 1.0
+        breaker.before_call()
+
+        breaker.record_success()
+
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("smtp", failure_threshold=3, recovery_timeout=1.0, clock=clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 1.0
+        breaker.before_call()
+
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+
+    def test_before_call_reports_probe(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("smtp", failure_threshold=1, recovery_timeout=1.0, clock=clock)
+
+        assert breaker.before_call() is False
+        breaker.record_failure()
+        clock.now = 1.0
+        assert breaker.before_call() is True
+
+    def test_released_probe_admits_next_probe(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("smtp", failure_threshold=1, recovery_timeout=1.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 1.0
+        breaker.before_call()
+
+        breaker.release_probe()
+
+        assert breaker.state == "half_open"
+        assert breaker.before_call() is True
+
+    def test_rejects_invalid_threshold(self) -> None:
+        with pytest.raises(ValueError):
+            CircuitBreaker("smtp", failure_threshold=0)
+
+
+# =========================================================
+# CLASS TEST RUN WITH POLICY
+# =========================================================
+class TestRunWithPolicy:
+    def test_without_policy_calls_directly(self) -> None:
+        assert run_with_policy(lambda: "ok", None) == "ok"
+
+    def test_retries_until_success(self) -> None:
+        flaky = Flaky(failures=2)
+        policy = ExecutionPolicy(retry=RetryPolicy(max_attempts=3, base_delay=0.0))
+
+        result = run_with_policy(flaky, policy)
+
+        assert result == "ok"
+        assert flaky.calls == 3
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        flaky = Flaky(failures=5)
+        policy = ExecutionPolicy(retry=RetryPolicy(max_attempts=2, base_delay=0.0))
+
+        with pytest.raises(ConnectionError):
+            run_with_policy(flaky, policy)
+        assert flaky.calls == 2
+
+    def test_no_retry_policy_raises_first_error(self) -> None:
+        flaky = Flaky(failures=1)
+
+        with pytest.raises(ConnectionError):
+            run_with_policy(flaky, ExecutionPolicy())
+
+    def test_timeout_raises(self) -> None:
+        release = threading.Event()
+        policy = ExecutionPolicy(timeout=0.05)
+
+        with pytest.raises(TaskTimeoutError):
+            run_with_policy(lambda: release.wait(5.0), policy)
+        release.set()
+
+    def test_timeout_returns_result_and_propagates_context(self) -> None:
+        REQUEST_ID.set("req-1")
+        policy = ExecutionPolicy(timeout=5.0)
+
+        result = run_with_policy(REQUEST_ID.get, policy)
+
+        assert result == "req-1"
+
+    def test_timeout_propagates_errors(self) -> None:
+        with pytest.raises(ConnectionError):
+            run_with_policy(Flaky(failures=1), ExecutionPolicy(timeout=5.0))
+
+    def test_open_breaker_fails_fast(self) -> None:
+        breaker = CircuitBreaker("smtp", failure_threshold=1)
+        flaky = Flaky(failures=10)
+        policy = ExecutionPolicy(
+            retry=RetryPolicy(max_attempts=5, base_delay=0.0), circuit_breaker=breaker
+        )
+
+        with pytest.raises(CircuitOpenError):
+            run_with_policy(flaky, policy)
+        assert flaky.calls == 1
+
+    def test_interrupted_probe_is_released(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("smtp", failure_threshold=1, recovery_timeout=1.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 1.0
+
+        def interrupted() -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            run_with_policy(interrupted, ExecutionPolicy(circuit_breaker=breaker))
+
+        assert run_with_policy(lambda: "ok", ExecutionPolicy(circuit_breaker=breaker)) == "ok"
+        assert breaker.state == "closed"
+
+    def test_breaker_records_success(self) -> None:
+        breaker = CircuitBreaker("smtp", failure_threshold=2)
+        breaker.record_failure()
+
+        run_with_policy(lambda: "ok", ExecutionPolicy(circuit_breaker=breaker))
+
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+
+# =========================================================
+# CLASS TEST RUN WITH POLICY ASYNC
+# =========================================================
+class TestRunWithPolicyAsync:
+    def test_without_policy_awaits_directly(self) -> None:
+        flaky = Flaky(failures=0)
+
+        assert asyncio.run(run_with_policy_async(flaky.run_async, None)) == "ok"
+
+    def test_retries_until_success(self) -> None:
+        flaky = Flaky(failures=2)
+        policy = ExecutionPolicy(retry=RetryPolicy(max_attempts=3, base_delay=0.0))
+
+        result = asyncio.run(run_with_policy_async(flaky.run_async, policy))
+
+        assert result == "ok"
+        assert flaky.calls == 3
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        flaky = Flaky(failures=5)
+        policy = ExecutionPolicy(retry=RetryPolicy(max_attempts=2, base_delay=0.0))
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(run_with_policy_async(flaky.run_async, policy))
+
+    def test_timeout_raises(self) -> None:
+        async def slow() -> None:
+            await asyncio.sleep(5.0)
+
+        with pytest.raises(TaskTimeoutError):
+            asyncio.run(run_with_policy_async(slow, ExecutionPolicy(timeout=0.01)))
+
+    def test_inner_timeout_is_not_rewrapped(self) -> None:
+        async def inner_timeout() -> None:
+            raise TimeoutError("inner")
+
+        with pytest.raises(TimeoutError) as exc_info:
+            asyncio.run(run_with_policy_async(inner_timeout, ExecutionPolicy(timeout=5.0)))
+        assert not isinstance(exc_info.value, TaskTimeoutError)
+
+    def test_timeout_returns_result(self) -> None:
+        flaky = Flaky(failures=0)
+
+        result = asyncio.run(run_with_policy_async(flaky.run_async, ExecutionPolicy(timeout=5.0)))
+
+        assert result == "ok"
+
+    def test_breaker_records_outcomes(self) -> None:
+        breaker = CircuitBreaker("smtp", failure_threshold=1, recovery_timeout=60.0)
+        policy = ExecutionPolicy(circuit_breaker=breaker)
+
+        assert asyncio.run(run_with_policy_async(Flaky(failures=0).run_async, policy)) == "ok"
+        with pytest.raises(ConnectionError):
+            asyncio.run(run_with_policy_async(Flaky(failures=1).run_async, policy))
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(run_with_policy_async(Flaky(failures=0).run_async, policy))
+
+    def test_cancelled_probe_is_released(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("smtp", failure_threshold=1, recovery_timeout=1.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 1.0
+        policy = ExecutionPolicy(circuit_breaker=breaker)
+
+        async def scenario() -> str:
+            probe = asyncio.ensure_future(run_with_policy_async(lambda: asyncio.sleep(5.0), policy))
+            await asyncio.sleep(0)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+            return await run_with_policy_async(Flaky(failures=0).run_async, policy)
+
+        assert asyncio.run(scenario()) == "ok"
+        assert breaker.state == "closed"
+
+    def test_sleeps_between_attempts(self) -> None:
+        flaky = Flaky(failures=1)
+        policy = ExecutionPolicy(retry=RetryPolicy(base_delay=0.02, jitter=False))
+        started = time.perf_counter()
+
+        asyncio.run(run_with_policy_async(flaky.run_async, policy))
+
+        assert time.perf_counter() - started >= 0.02
@@ -0,0 +1,241 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+import pytest
+
+from moleql_patterns.commands import (
+    AccessDeniedError,
+    APIOperation,
+    AsyncAPIOperation,
+    clear_middlewares,
+    compose_middlewares,
+    register_async_middleware,
+    register_middleware,
+    unregister_middleware,
+)
+
+from ._api_operation_shared import ExampleResult
+
+calls: list[str] = []
+
+
+def recording(name: str) -> Callable[..., Any]:
+    def middleware(call_next: Callable[[Any], Any], operation: Any) -> Any:
+        calls.append(f"{name}:before")
+        result = call_next(operation)
+        calls.append(f"{name}:after")
+        return result
+
+    return middleware
+
+
+def async_recording(name: str) -> Callable[..., Awaitable[Any]]:
+    async def middleware(call_next: Callable[[Any], Awaitable[Any]], operation: Any) -> Any:
+        calls.append(f"{name}:before")
+        result = await call_next(operation)
+        calls.append(f"{name}:after")
+        return result
+
+    return middleware
+
+
+def short_circuit(call_next: Callable[[Any], Any], operation: Any) -> ExampleResult:
+    return ExampleResult(value=2)
+
+
+# =========================================================
+# CLASS PLAIN OPERATION
+# =========================================================
+class PlainOperation(APIOperation[ExampleResult]):
+    def verify_access(self) -> None:
+        calls.append("verify")
+
+    def _execute(self) -> ExampleResult:
+        calls.append("execute")
+        return ExampleResult(value=1)
+
+
+# =========================================================
+# CLASS WRAPPED OPERATION
+# =========================================================
+class WrappedOperation(PlainOperation):
+    middlewares = (recording("outer"), recording("inner"))
+
+
+# =========================================================
+# CLASS CACHED OPERATION
+# =========================================================
+class CachedOperation(PlainOperation):
+    middlewares = (short_circuit,)
+
+
+# =========================================================
+# CLASS DENIED OPERATION
+# =========================================================
+class DeniedOperation(WrappedOperation):
+    def verify_access(self) -> None:
+        raise AccessDeniedError("no")
+
+
+# =========================================================
+# CLASS ASYNC WRAPPED OPERATION
+# =========================================================
+class AsyncWrappedOperation(AsyncAPIOperation[ExampleResult]):
+    middlewares = (async_recording("outer"), async_recording("inner"))
+
+    def verify_access(self) -> None:
+        calls.append("verify")
+
+    async def _execute_async(self) -> ExampleResult:
+        calls.append("execute")
+        return ExampleResult(value=1)
+
+
+@pytest.fixture(autouse=True)
+def reset() -> Iterator[None]:
+    calls.clear()
+    yield
+    clear_middlewares()
+
+
+# =========================================================
+# CLASS TEST COMPOSE MIDDLEWARES
+# =========================================================
+class TestComposeMiddlewares:
+    def test_without_middlewares_returns_terminal(self) -> None:
+        def terminal(operation: Any) -> Any:
+            return operation
+
+        assert compose_middlewares((), terminal) is terminal
+
+    def test_runs_outermost_first(self) -> None:
+        chain = compose_middlewares(
+            (recording("a"), recording("b")), lambda operation: calls.append("end")
+        )
+
+        chain(None)
+
+        assert calls == ["a:before", "b:before", "end", "b:after", "a:after"]
+
+
+# =========================================================
+# CLASS TEST OPERATION MIDDLEWARES
+# =========================================================
+class TestOperationMiddlewares:
+    def test_operation_without_middlewares(self) -> None:
+        assert PlainOperation().execute() == ExampleResult(value=1)
+        assert calls == ["verify", "execute"]
+
+    def test_class_middlewares_wrap_execution(self) -> None:
+        WrappedOperation().execute()
+
+        assert calls == [
+            "verify",
+            "outer:before",
+            "inner:before",
+            "execute",
+            "inner:after",
+            "outer:after",
+        ]
+
+    def test_middleware_can_short_circuit(self) -> None:
+        assert CachedOperation().execute() == ExampleResult(value=2)
+        assert "execute" not in calls
+
+    def test_access_is_checked_before_middlewares(self) -> None:
+        with pytest.raises(AccessDeniedError):
+            DeniedOperation().execute()
+
+        assert calls == []
+
+    def test_chain_is_cached_per_class(self) -> None:
+        WrappedOperation().execute()
+        chain = WrappedOperation.__dict__["_middleware_chain_cache"]
+
+        WrappedOperation().execute()
+
+        assert WrappedOperation.__dict__["_middleware_chain_cache"] is chain
+        assert "_middleware_chain_cache" not in DeniedOperation.__dict__
+
+    def test_global_middlewares_run_outside_class_middlewares(self) -> None:
+        WrappedOperation().execute()
+        register_middleware(recording("global"))
+        calls.clear()
+
+        WrappedOperation().execute()
+
+        assert calls[:3] == ["verify", "global:before", "outer:before"]
+        assert calls[-1] == "global:after"
+
+    def test_unregister_middleware(self) -> None:
+        middleware = register_middleware(recording("global"))
+        PlainOperation().execute()
+        unregister_middleware(middleware)
+        calls.clear()
+
+        PlainOperation().execute()
+
+        assert calls == ["verify", "execute"]
+
+    def test_async_middlewares_do_not_apply_to_sync_operations(self) -> None:
+        register_async_middleware(async_recording("global"))
+
+        PlainOperation().execute()
+
+        assert calls == ["verify", "execute"]
+
+
+# =========================================================
+# CLASS TEST ASYNC OPERATION MIDDLEWARES
+# =========================================================
+class TestAsyncOperationMiddlewares:
+    def test_class_middlewares_wrap_execution(self) -> None:
+        result = asyncio.run(AsyncWrappedOperation().execute_async())
+
+        assert result == ExampleResult(value=1)
+        assert calls == [
+            "verify",
+            "outer:before",
+            "inner:before",
+            "execute",
+            "inner:after",
+            "outer:after",
+        ]
+
+    def test_global_async_middleware(self) -> None:
+        register_async_middleware(async_recording("global"))
+
+        asyncio.run(AsyncWrappedOperation().execute_async())
+
+        assert calls[1] == "global:before"
+        assert calls[-1] == "global:after"
+
+    def test_sync_middlewares_do_not_apply_to_async_operations(self) -> None:
+        register_middleware(recording("global"))
+
+        asyncio.run(AsyncWrappedOperation().execute_async())
+
+        assert "global:before" not in calls
@@ -0,0 +1,351 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from moleql_patterns.commands import (
+    APIOperation,
+    AsyncAPIOperation,
+    AsyncTask,
+    CircuitBreaker,
+    ExecutionPolicy,
+    RateLimit,
+    RateLimiter,
+    RateLimitExceededError,
+    RetryPolicy,
+    SlidingWindowLimiter,
+    Task,
+    TaskData,
+    TokenBucketLimiter,
+)
+
+
+# =========================================================
+# CLASS FAKE CLOCK
+# =========================================================
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# =========================================================
+# CLASS COUNT RESULT
+# =========================================================
+class CountResult(BaseModel):
+    value: int
+
+
+# =========================================================
+# CLASS LIMITED OPERATION
+# =========================================================
+class LimitedOperation(APIOperation[CountResult]):
+    rate_limit = RateLimit(limiter=TokenBucketLimiter(rate=0.001, capacity=1))
+
+    def __init__(self, principal: str) -> None:
+        self._principal = principal
+
+    def verify_access(self) -> None:
+        return None
+
+    def rate_limit_key(self) -> str:
+        return self._principal
+
+    def _execute(self) -> CountResult:
+        return CountResult(value=1)
+
+
+# =========================================================
+# CLASS ASYNC LIMITED OPERATION
+# =========================================================
+class AsyncLimitedOperation(AsyncAPIOperation[CountResult]):
+    rate_limit = RateLimit(limiter=SlidingWindowLimiter(limit=1, window=60.0))
+
+    def verify_access(self) -> None:
+        return None
+
+    async def _execute_async(self) -> CountResult:
+        return CountResult(value=1)
+
+
+# =========================================================
+# CLASS LIMITED TASK DATA
+# =========================================================
+class LimitedTaskData(TaskData):
+    pass
+
+
+# =========================================================
+# CLASS LIMITED TASK
+# =========================================================
+class LimitedTask(Task[LimitedTaskData]):
+    task_data_cls = LimitedTaskData
+    rate_limit = RateLimit(limiter=TokenBucketLimiter(rate=0.001, capacity=1))
+
+    def exec(self) -> str:
+        return "ok"
+
+
+# =========================================================
+# CLASS ASYNC LIMITED TASK
+# =========================================================
+class AsyncLimitedTask(AsyncTask[LimitedTaskData]):
+    task_data_cls = LimitedTaskData
+    rate_limit = RateLimit(limiter=TokenBucketLimiter(rate=0.001, capacity=1))
+
+    async def exec(self) -> str:
+        return "ok"
+
+
+# =========================================================
+# CLASS FLAKY LIMITED TASK
+# =========================================================
+class FlakyLimitedTask(Task[LimitedTaskData]):
+    task_data_cls = LimitedTaskData
+    rate_limit = RateLimit(limiter=TokenBucketLimiter(rate=0.001, capacity=2))
+    execution_policy = ExecutionPolicy(retry=RetryPolicy(max_attempts=3, base_delay=0.0))
+    attempts = 0
+
+    def exec(self) -> str:
+        type(self).attempts += 1
+        raise ConnectionError("unavailable")
+
+
+# =========================================================
+# CLASS GUARDED LIMITED TASK
+# =========================================================
+class GuardedLimitedTask(Task[LimitedTaskData]):
+    task_data_cls = LimitedTaskData
+    rate_limit = RateLimit(limiter=TokenBucketLimiter(rate=0.001, capacity=1))
+    execution_policy = ExecutionPolicy(
+        circuit_breaker=CircuitBreaker("guarded", failure_threshold=1)
+    )
+
+    def exec(self) -> str:
+        return "ok"
+
+
+# =========================================================
+# CLASS TEST RATE LIMITER CONTRACT
+# =========================================================
+class TestRateLimiterContract:
+    def test_base_class_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            RateLimiter()
+
+    def test_base_try_acquire_raises(self) -> None:
+        with pytest.raises(NotImplementedError):
+            RateLimiter.try_acquire(object(), "key")
+
+
+# =========================================================
+# CLASS TEST TOKEN BUCKET LIMITER
+# =========================================================
+class TestTokenBucketLimiter:
+    def test_allows_burst_up_to_capacity(self) -> None:
+        limiter = TokenBucketLimiter(rate=1.0, capacity=3, clock=FakeClock())
+
+        delays = [limiter.try_acquire("user") for _ in range(4)]
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert delays[3] == pytest.approx(1.0)
+
+    def test_refills_over_time(self) -> None:
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=2.0, capacity=1, clock=clock)
+        limiter.try_acquire("user")
+        clock.now = 0.5
+
+        assert limiter.try_acquire("user") == 0.0
+
+    def test_keys_are_independent(self) -> None:
+        limiter = TokenBucketLimiter(rate=1.0, capacity=1, clock=FakeClock())
+        limiter.try_acquire("alice")
+
+        assert limiter.try_acquire("bob") == 0.0
+
+    def test_async_variant_delegates(self) -> None:
+        limiter = TokenBucketLimiter(rate=1.0, capacity=1, clock=FakeClock())
+
+        assert asyncio.run(limiter.try_acquire_async("user")) == 0.0
+
+    def test_prunes_idle_keys(self) -> None:
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=1.0, capacity=1, max_keys=2, clock=clock)
+        limiter.try_acquire("a")
+        limiter.try_acquire("b")
+        clock.now = 5.0
+
+        limiter.try_acquire("c")
+
+        assert set(limiter._buckets) == {"c"}
+
+    def test_rejects_invalid_configuration(self) -> None:
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(rate=0, capacity=1)
+
+    def test_rejects_cost_above_capacity(self) -> None:
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(rate=1.0, capacity=1).try_acquire("user", tokens=2)
+
+
+# =========================================================
+# CLASS TEST SLIDING WINDOW LIMITER
+# =========================================================
+class TestSlidingWindowLimiter:
+    def test_limits_events_in_window(self) -> None:
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(limit=2, window=10.0, clock=clock)
+        limiter.try_acquire("user")
+        clock.now = 4.0
+        limiter.try_acquire("user")
+        clock.now = 6.0
+
+        assert limiter.try_acquire("user") == pytest.approx(4.0)
+
+    def test_window_slides(self) -> None:
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(limit=1, window=10.0, clock=clock)
+        limiter.try_acquire("user")
+        clock.now = 10.0
+
+        assert limiter.try_acquire("user") == 0.0
+
+    def test_prunes_idle_keys(self) -> None:
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(limit=1, window=1.0, max_keys=2, clock=clock)
+        limiter.try_acquire("a")
+        limiter.try_acquire("b")
+        clock.now = 5.0
+
+        limiter.try_acquire("c")
+
+        assert set(limiter._logs) == {"c"}
+
+    def test_rejects_invalid_configuration(self) -> None:
+        with pytest.raises(ValueError):
+            SlidingWindowLimiter(limit=0, window=1.0)
+
+    def test_rejects_cost_above_limit(self) -> None:
+        with pytest.raises(ValueError):
+            SlidingWindowLimiter(limit=1, window=1.0).try_acquire("user", tokens=2)
+
+
+# =========================================================
+# CLASS TEST RATE LIMIT
+# =========================================================
+class TestRateLimit:
+    def test_reject_mode_raises_with_retry_after(self) -> None:
+        rate_limit = RateLimit(limiter=TokenBucketLimiter(rate=1.0, capacity=1, clock=FakeClock()))
+        rate_limit.acquire("user")
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            rate_limit.acquire("user")
+        assert exc_info.value.retry_after == pytest.approx(1.0)
+
+    def test_wait_mode_sleeps_until_granted(self) -> None:
+        rate_limit = RateLimit(limiter=TokenBucketLimiter(rate=100.0, capacity=1), mode="wait")
+        rate_limit.acquire("user")
+
+        rate_limit.acquire("user")
+
+    def test_wait_mode_respects_max_wait(self) -> None:
+        rate_limit = RateLimit(
+            limiter=TokenBucketLimiter(rate=0.01, capacity=1), mode="wait", max_wait=0.5
+        )
+        rate_limit.acquire("user")
+
+        with pytest.raises(RateLimitExceededError):
+            rate_limit.acquire("user")
+
+    def test_async_wait_mode_sleeps_until_granted(self) -> None:
+        rate_limit = RateLimit(limiter=SlidingWindowLimiter(limit=1, window=0.01), mode="wait")
+
+        async def acquire_twice() -> None:
+            await rate_limit.acquire_async("user")
+            await rate_limit.acquire_async("user")
+
+        asyncio.run(acquire_twice())
+
+    def test_async_reject_mode_raises(self) -> None:
+        rate_limit = RateLimit(limiter=SlidingWindowLimiter(limit=1, window=60.0))
+
+        async def acquire_twice() -> None:
+            await rate_limit.acquire_async("user")
+            await rate_limit.acquire_async("user")
+
+        with pytest.raises(RateLimitExceededError):
+            asyncio.run(acquire_twice())
+
+
+# =========================================================
+# CLASS TEST DECLARATIVE RATE LIMITS
+# =========================================================
+class TestDeclarativeRateLimits:
+    def test_default_key_is_qualified_class_name(self) -> None:
+        operation = LimitedOperation("alice")
+
+        assert APIOperation.rate_limit_key(operation) == f"{__name__}.LimitedOperation"
+        assert LimitedTask({"correlation_id": "a"}).rate_limit_key() == f"{__name__}.LimitedTask"
+
+    def test_operation_is_limited_per_key(self) -> None:
+        LimitedOperation("alice").execute()
+        LimitedOperation("bob").execute()
+
+        with pytest.raises(RateLimitExceededError):
+            LimitedOperation("alice").execute()
+
+    def test_async_operation_is_limited(self) -> None:
+        asyncio.run(AsyncLimitedOperation().execute_async())
+
+        with pytest.raises(RateLimitExceededError):
+            asyncio.run(AsyncLimitedOperation().execute_async())
+
+    def test_task_run_is_limited(self) -> None:
+        assert LimitedTask({"correlation_id": "a"}).run() == "ok"
+
+        with pytest.raises(RateLimitExceededError):
+            LimitedTask({"correlation_id": "b"}).run()
+
+    def test_async_task_run_is_limited(self) -> None:
+        assert asyncio.run(AsyncLimitedTask({"correlation_id": "a"}).run()) == "ok"
+
+        with pytest.raises(RateLimitExceededError):
+            asyncio.run(AsyncLimitedTask({"correlation_id": "b"}).run())
+
+    def test_task_retries_take_a_token_per_attempt(self) -> None:
+        with pytest.raises(RateLimitExceededError):
+            FlakyLimitedTask({"correlation_id": "a"}).run()
+
+        assert FlakyLimitedTask.attempts == 2
+
+    def test_task_rejection_is_not_a_breaker_failure(self) -> None:
+        GuardedLimitedTask({"correlation_id": "a"}).run()
+
+        with pytest.raises(RateLimitExceededError):
+            GuardedLimitedTask({"correlation_id": "b"}).run()
+        assert GuardedLimitedTask.execution_policy.circuit_breaker.state == "closed"
@@ -0,0 +1,170 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import json
+
+import pytest
+from pydantic import BaseModel, Field
+
+from moleql_patterns.commands import APIOperation, AsyncAPIOperation, Projection
+from moleql_patterns.commands.serialization import dump_json
+
+
+# =========================================================
+# CLASS PROFILE
+# =========================================================
+class Profile(BaseModel):
+    email: str
+    bio: str | None = None
+
+
+# =========================================================
+# CLASS USER
+# =========================================================
+class User(BaseModel):
+    id: int
+    display_name: str = Field(serialization_alias="displayName")
+    password_hash: str
+    profile: Profile
+
+
+USER = User(
+    id=7,
+    display_name="Ada",
+    password_hash="secret",
+    profile=Profile(email="ada@example.com"),
+)
+PUBLIC_USER = Projection(exclude={"password_hash": True, "profile": {"email"}})
+
+
+# =========================================================
+# CLASS GET USER
+# =========================================================
+class GetUser(APIOperation[User]):
+    def verify_access(self) -> None:
+        pass
+
+    def _execute(self) -> User:
+        return USER
+
+
+# =========================================================
+# CLASS GET PUBLIC USER
+# =========================================================
+class GetPublicUser(GetUser):
+    json_projection = PUBLIC_USER
+
+
+# =========================================================
+# CLASS GET USER ASYNC
+# =========================================================
+class GetUserAsync(AsyncAPIOperation[User]):
+    json_projection = PUBLIC_USER
+
+    def verify_access(self) -> None:
+        pass
+
+    async def _execute_async(self) -> User:
+        return USER
+
+
+# =========================================================
+# CLASS TEST PROJECTION
+# =========================================================
+class TestProjection:
+    def test_sets_are_normalized(self) -> None:
+        projection = Projection(include={"id", "profile"})
+
+        assert projection.include == {"id": True, "profile": True}
+
+    def test_nested_rules_are_normalized(self) -> None:
+        projection = Projection(exclude={"profile": {"email"}, "id": ...})
+
+        assert projection.exclude == {"profile": {"email": True}, "id": ...}
+
+    def test_defaults(self) -> None:
+        projection = Projection()
+
+        assert projection.include is None
+        assert projection.exclude is None
+
+    def test_is_immutable(self) -> None:
+        with pytest.raises(AttributeError):
+            PUBLIC_USER.include = None
+
+
+# =========================================================
+# CLASS TEST DUMP JSON
+# =========================================================
+class TestDumpJson:
+    def test_matches_model_dump_json(self) -> None:
+        assert dump_json(USER) == USER.model_dump_json().encode()
+
+    @pytest.mark.parametrize(
+        "projection",
+        [
+            Projection(include={"id", "profile"}),
+            PUBLIC_USER,
+            Projection(by_alias=True, exclude_none=True),
+        ],
+    )
+    def test_projection_matches_model_dump_json(self, projection: Projection) -> None:
+        expected = USER.model_dump_json(
+            include=projection.include,
+            exclude=projection.exclude,
+            by_alias=projection.by_alias,
+            exclude_none=projection.exclude_none,
+        )
+
+        assert dump_json(USER, projection) == expected.encode()
+
+
+# =========================================================
+# CLASS TEST EXECUTE JSON
+# =========================================================
+class TestExecuteJson:
+    def test_returns_json_bytes(self) -> None:
+        assert json.loads(GetUser().execute_json())["password_hash"] == "secret"
+
+    def test_uses_class_projection(self) -> None:
+        body = json.loads(GetPublicUser().execute_json())
+
+        assert "password_hash" not in body
+        assert body["profile"] == {"bio": None}
+
+    def test_argument_overrides_class_projection(self) -> None:
+        body = json.loads(GetPublicUser().execute_json(Projection(include={"id"})))
+
+        assert body == {"id": 7}
+
+    def test_async(self) -> None:
+        body = json.loads(asyncio.run(GetUserAsync().execute_async_json()))
+
+        assert "password_hash" not in body
+
+    def test_async_argument_overrides_class_projection(self) -> None:
+        projection = Projection(include={"display_name"}, by_alias=True)
+
+        body = asyncio.run(GetUserAsync().execute_async_json(projection))
+
+        assert json.loads(body) == {"displayName": "Ada"}
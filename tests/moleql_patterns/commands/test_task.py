@@ -27,11 +27,15 @@ import pytest
 from moleql_patterns.commands import AsyncTask, Task, TaskBase, TaskDataDeserializationError
 
 from ._task_shared import (
+    AsyncRetryingTask,
     AsyncTaskExample,
     AsyncTaskWithoutDataCls,
     AsyncTaskWithoutExec,
+    DerivedSyncTask,
     ExampleTaskData,
+    RetryingTask,
     SyncTask,
+    TaskWithNoneDataCls,
     TaskWithoutDataCls,
     TaskWithoutExec,
 )
@@ -53,6 +57,15 @@ class TestTaskBaseInit:
         with pytest.raises(TaskDataDeserializationError):
             AsyncTaskWithoutDataCls({"correlation_id": "test"})
 
+    def test_none_task_data_cls_raises(self) -> None:
+        with pytest.raises(TaskDataDeserializationError):
+            TaskWithNoneDataCls({"correlation_id": "test"})
+
+    def test_task_data_cls_is_inherited(self) -> None:
+        task = DerivedSyncTask({"correlation_id": "test"})
+
+        assert isinstance(task.task_data, ExampleTaskData)
+
     def test_init_sets_task_data(self) -> None:
         task = SyncTask({"correlation_id": "test"})
 
@@ -79,6 +92,24 @@ class TestTaskExec:
             TaskWithoutExec({"correlation_id": "test"})
 
 
+# =========================================================
+# CLASS TEST TASK RUN
+# =========================================================
+class TestTaskRun:
+    def test_run_without_policy_calls_exec(self) -> None:
+        task = SyncTask({"correlation_id": "test"})
+
+        assert task.run() == "ok"
+
+    def test_run_applies_execution_policy(self) -> None:
+        task = RetryingTask({"correlation_id": "test"})
+
+        result = task.run()
+
+        assert result == "ok"
+        assert task.calls == 2
+
+
 # =========================================================
 # CLASS TEST ASYNC TASK EXEC
 # =========================================================
@@ -97,3 +128,21 @@ class TestAsyncTaskExec:
     def test_exec_is_required(self) -> None:
         with pytest.raises(TypeError):
             AsyncTaskWithoutExec({"correlation_id": "test"})
+
+
+# =========================================================
+# CLASS TEST ASYNC TASK RUN
+# =========================================================
+class TestAsyncTaskRun:
+    def test_run_without_policy_awaits_exec(self) -> None:
+        task = AsyncTaskExample({"correlation_id": "test"})
+
+        assert asyncio.run(task.run()) == "ok"
+
+    def test_run_applies_execution_policy(self) -> None:
+        task = AsyncRetryingTask({"correlation_id": "test"})
+
+        result = asyncio.run(task.run())
+
+        assert result == "ok"
+        assert task.calls == 2
@@ -20,10 +20,20 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
-from moleql_patterns.commands import TaskData, TaskDeserializationError, TaskSerializationError
+from moleql_patterns.commands import (
+    FrozenTaskData,
+    TaskData,
+    TaskDeserializationError,
+    TaskSerializationError,
+    decode_payload,
+    encode_payload,
+    payload_digest,
+)
 
 
 # =========================================================
@@ -33,6 +43,33 @@ class _ConcreteTaskData(TaskData):
     pass
 
 
+# =========================================================
+# CLASS RESIZE TASK DATA
+# =========================================================
+class _ResizeTaskData(FrozenTaskData):
+    image_ids: list[int]
+    thumbnail: bytes = b""
+
+
+# =========================================================
+# CLASS CROP TASK DATA
+# =========================================================
+class _CropTaskData(FrozenTaskData):
+    image_ids: list[int]
+    thumbnail: bytes = b""
+
+
+# =========================================================
+# CLASS CUSTOM INIT TASK DATA
+# =========================================================
+class _CustomInitTaskData(TaskData):
+    label: str
+
+    def __init__(self, **data: object) -> None:
+        data.setdefault("label", "default")
+        super().__init__(**data)
+
+
 # =========================================================
 # CLASS TEST TASK DATA VALIDATION
 # =========================================================
@@ -53,6 +90,15 @@ class TestTaskDataValidation:
         with pytest.raises(ValidationError):
             _ConcreteTaskData(correlation_id="test", extra_field="nope")
 
+    def test_subclass_uses_pydantic_init(self) -> None:
+        assert _ConcreteTaskData.__pydantic_custom_init__ is False
+
+    def test_subclass_custom_init_is_kept(self) -> None:
+        data = _CustomInitTaskData(correlation_id="test")
+
+        assert data.label == "default"
+        assert _CustomInitTaskData.__pydantic_custom_init__ is True
+
 
 # =========================================================
 # CLASS TEST TASK DATA TO PAYLOAD
@@ -98,3 +144,103 @@ class TestTaskDataFromPayload:
 
         with pytest.raises(TaskDeserializationError):
             _ConcreteTaskData.from_payload(payload)
+
+    def test_from_payload_reads_text_as_utf8_bytes(self) -> None:
+        payload = {"correlation_id": "c-1", "image_ids": [1], "thumbnail": "aGVsbG8="}
+
+        data = _ResizeTaskData.from_payload(payload)
+
+        assert data.thumbnail == b"aGVsbG8="
+
+
+# =========================================================
+# CLASS TEST PAYLOAD ENCODING
+# =========================================================
+class TestPayloadEncoding:
+    def test_round_trips_nested_bytes(self) -> None:
+        payload = {"blob": b"\xff\x00", "parts": [b"", (b"a",)], "meta": {"raw": b"\xfe"}}
+
+        decoded = decode_payload(encode_payload(payload))
+
+        assert decoded == {"blob": b"\xff\x00", "parts": [b"", [b"a"]], "meta": {"raw": b"\xfe"}}
+
+    def test_bytes_are_tagged_base64(self) -> None:
+        encoded = encode_payload({"correlation_id": "c-1", "blob": b"tiny"})
+
+        assert json.loads(encoded) == {"correlation_id": "c-1", "blob": {"$bytes": "dGlueQ=="}}
+
+    def test_other_dicts_are_left_alone(self) -> None:
+        payload = {"a": {"$bytes": 1}, "b": {"$bytes": "eA==", "extra": True}}
+
+        assert decode_payload(encode_payload(payload)) == payload
+
+
+# =========================================================
+# CLASS TEST PAYLOAD DIGEST
+# =========================================================
+class TestPayloadDigest:
+    def test_digest_ignores_key_order(self) -> None:
+        assert payload_digest({"a": 1, "b": 2}) == payload_digest({"b": 2, "a": 1})
+
+    def test_digest_supports_binary_values(self) -> None:
+        assert payload_digest({"blob": b"\xff\x00"}) != payload_digest({"blob": b"\x00"})
+
+
+# =========================================================
+# CLASS TEST FROZEN TASK DATA
+# =========================================================
+class TestFrozenTaskData:
+    def test_is_immutable(self) -> None:
+        data = _ResizeTaskData(correlation_id="c-1", image_ids=[1])
+
+        with pytest.raises(ValidationError):
+            data.correlation_id = "c-2"
+
+    def test_equal_payloads_are_deduplicated_in_sets(self) -> None:
+        first = _ResizeTaskData(correlation_id="c-1", image_ids=[1, 2])
+        second = _ResizeTaskData(correlation_id="c-1", image_ids=[1, 2])
+
+        assert first == second
+        assert len({first, second}) == 1
+
+    def test_different_classes_are_not_equal(self) -> None:
+        resize = _ResizeTaskData(correlation_id="c-1", image_ids=[1])
+        crop = _CropTaskData(correlation_id="c-1", image_ids=[1])
+
+        assert resize != crop
+        assert resize != object()
+
+    def test_content_hash_is_cached(self) -> None:
+        data = _ResizeTaskData(correlation_id="c-1", image_ids=[1])
+
+        assert data.content_hash() is data.content_hash()
+        assert data.content_hash() == payload_digest(data.to_payload())
+
+    def test_cached_hash_is_not_model_state(self) -> None:
+        data = _ResizeTaskData(correlation_id="c-1", image_ids=[1])
+        data.content_hash()
+
+        copied = data.model_copy(update={"image_ids": [2]})
+
+        assert "_content_hash" not in data.model_dump()
+        assert copied.content_hash() != data.content_hash()
+
+    def test_dedup_key_ignores_correlation_id(self) -> None:
+        first = _ResizeTaskData(correlation_id="c-1", image_ids=[1], thumbnail=b"\xff")
+        second = _ResizeTaskData(correlation_id="c-2", image_ids=[1], thumbnail=b"\xff")
+
+        assert first.dedup_key() == second.dedup_key()
+        assert first != second
+
+    def test_dedup_key_includes_task_class(self) -> None:
+        resize = _ResizeTaskData(correlation_id="c-1", image_ids=[1])
+        crop = _CropTaskData(correlation_id="c-1", image_ids=[1])
+
+        assert resize.dedup_key() != crop.dedup_key()
+
+    def test_dedup_key_changes_per_window(self) -> None:
+        data = _ResizeTaskData(correlation_id="c-1", image_ids=[1])
+
+        assert data.dedup_key(60.0, now=10.0) == data.dedup_key(60.0, now=50.0)
+        assert data.dedup_key(60.0, now=10.0) != data.dedup_key(60.0, now=70.0)
+        assert data.dedup_key(60.0).startswith(data.dedup_key())
@@ -0,0 +1,229 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from typing import Any
+
+import pytest
+
+from moleql_patterns.commands import SCHEMA_VERSION_KEY, TaskDeserializationError, VersionedTaskData
+
+
+# =========================================================
+# CLASS EMAIL TASK DATA
+# =========================================================
+class EmailTaskData(VersionedTaskData):
+    schema_version = 3
+    accepted_versions = 3
+
+    recipient: str
+    subject: str
+
+
+@EmailTaskData.migration(1)
+def _rename_to(payload: dict[str, Any]) -> dict[str, Any]:
+    payload["recipient"] = payload.pop("to")
+    return payload
+
+
+@EmailTaskData.migration(2)
+def _add_subject(payload: dict[str, Any]) -> dict[str, Any]:
+    payload.setdefault("subject", "(no subject)")
+    return payload
+
+
+# =========================================================
+# CLASS RECENT EMAIL TASK DATA
+# =========================================================
+class RecentEmailTaskData(EmailTaskData):
+    accepted_versions = 2
+
+
+# =========================================================
+# CLASS UNVERSIONED TASK DATA
+# =========================================================
+class UnversionedTaskData(VersionedTaskData):
+    name: str
+
+
+# =========================================================
+# CLASS TEST VERSIONED TASK DATA PAYLOAD
+# =========================================================
+class TestVersionedTaskDataPayload:
+    def test_to_payload_includes_schema_version(self) -> None:
+        data = EmailTaskData(correlation_id="c-1", recipient="a@example.com", subject="Hi")
+
+        payload = data.to_payload()
+
+        assert payload[SCHEMA_VERSION_KEY] == 3
+
+    def test_round_trip(self) -> None:
+        data = EmailTaskData(correlation_id="c-1", recipient="a@example.com", subject="Hi")
+
+        assert EmailTaskData.from_payload(data.to_payload()) == data
+
+    def test_default_version_is_one(self) -> None:
+        data = UnversionedTaskData(correlation_id="c-1", name="job")
+
+        assert UnversionedTaskData.from_payload(data.to_payload()) == data
+        assert data.to_payload()[SCHEMA_VERSION_KEY] == 1
+
+    def test_schema_version_is_not_a_field(self) -> None:
+        assert SCHEMA_VERSION_KEY not in EmailTaskData.model_fields
+
+
+# =========================================================
+# CLASS TEST VERSIONED TASK DATA MIGRATIONS
+# =========================================================
+class TestVersionedTaskDataMigrations:
+    def test_upgrades_previous_version(self) -> None:
+        payload = {
+            "correlation_id": "c-1",
+            SCHEMA_VERSION_KEY: 2,
+            "recipient": "a@example.com",
+        }
+
+        data = EmailTaskData.from_payload(payload)
+
+        assert data.subject == "(no subject)"
+
+    def test_upgrades_across_several_versions(self) -> None:
+        payload = {"correlation_id": "c-1", SCHEMA_VERSION_KEY: 1, "to": "a@example.com"}
+
+        data = EmailTaskData.from_payload(payload)
+
+        assert data.recipient == "a@example.com"
+        assert data.subject == "(no subject)"
+
+    def test_missing_version_is_treated_as_one(self) -> None:
+        data = EmailTaskData.from_payload({"correlation_id": "c-1", "to": "a@example.com"})
+
+        assert data.recipient == "a@example.com"
+
+    def test_input_payload_is_not_modified(self) -> None:
+        payload = {"correlation_id": "c-1", SCHEMA_VERSION_KEY: 1, "to": "a@example.com"}
+
+        EmailTaskData.from_payload(payload)
+
+        assert payload == {"correlation_id": "c-1", SCHEMA_VERSION_KEY: 1, "to": "a@example.com"}
+
+    def test_composed_upgrade_is_cached(self) -> None:
+        EmailTaskData.from_payload({"correlation_id": "c-1", "to": "a@example.com"})
+        cached = EmailTaskData._upgrades[1]
+
+        EmailTaskData.from_payload({"correlation_id": "c-2", "to": "b@example.com"})
+
+        assert EmailTaskData._upgrades[1] is cached
+
+    def test_subclass_inherits_migrations(self) -> None:
+        payload = {"correlation_id": "c-1", SCHEMA_VERSION_KEY: 2, "recipient": "a@example.com"}
+
+        data = RecentEmailTaskData.from_payload(payload)
+
+        assert data.subject == "(no subject)"
+        assert RecentEmailTaskData._migrations is not EmailTaskData._migrations
+
+    def test_registering_clears_cached_upgrades(self) -> None:
+        # =========================================================
+        # CLASS REPORT TASK DATA
+        # =========================================================
+        class ReportTaskData(VersionedTaskData):
+            schema_version = 2
+            title: str
+
+        @ReportTaskData.migration(1)
+        def _first(payload: dict[str, Any]) -> dict[str, Any]:
+            payload["title"] = "first"
+            return payload
+
+        ReportTaskData.from_payload({"correlation_id": "c-1"})
+
+        @ReportTaskData.migration(1)
+        def _second(payload: dict[str, Any]) -> dict[str, Any]:
+            payload["title"] = "second"
+            return payload
+
+        assert ReportTaskData.from_payload({"correlation_id": "c-1"}).title == "second"
+
+
+# =========================================================
+# CLASS TEST VERSIONED TASK DATA ERRORS
+# =========================================================
+class TestVersionedTaskDataErrors:
+    def test_rejects_version_outside_accepted_window(self) -> None:
+        payload = {"correlation_id": "c-1", SCHEMA_VERSION_KEY: 1, "to": "a@example.com"}
+
+        with pytest.raises(TaskDeserializationError, match="accepted versions are 2 to 3"):
+            RecentEmailTaskData.from_payload(payload)
+
+    def test_rejects_newer_version(self) -> None:
+        payload = {"correlation_id": "c-1", SCHEMA_VERSION_KEY: 4, "recipient": "a@example.com"}
+
+        with pytest.raises(TaskDeserializationError, match="schema version 4"):
+            EmailTaskData.from_payload(payload)
+
+    @pytest.mark.parametrize("version", ["2", True, None])
+    def test_rejects_invalid_version(self, version: object) -> None:
+        payload = {"correlation_id": "c-1", SCHEMA_VERSION_KEY: version}
+
+        with pytest.raises(TaskDeserializationError, match="Invalid schema version"):
+            EmailTaskData.from_payload(payload)
+
+    def test_missing_migration_step(self) -> None:
+        # =========================================================
+        # CLASS GAPPED TASK DATA
+        # =========================================================
+        class GappedTaskData(VersionedTaskData):
+            schema_version = 3
+            name: str
+
+        @GappedTaskData.migration(2)
+        def _step(payload: dict[str, Any]) -> dict[str, Any]:
+            return payload
+
+        with pytest.raises(TaskDeserializationError, match="no migration from schema version 1"):
+            GappedTaskData.from_payload({"correlation_id": "c-1", "name": "x"})
+
+    def test_failing_migration_is_wrapped(self) -> None:
+        payload = {"correlation_id": "c-1", SCHEMA_VERSION_KEY: 1}
+
+        with pytest.raises(TaskDeserializationError, match="from schema version 1") as info:
+            EmailTaskData.from_payload(payload)
+
+        assert isinstance(info.value.__cause__, KeyError)
+
+    def test_migrated_payload_is_still_validated(self) -> None:
+        payload = {"correlation_id": "c-1", SCHEMA_VERSION_KEY: 2, "recipient": 5}
+
+        with pytest.raises(TaskDeserializationError):
+            EmailTaskData.from_payload(payload)
+
+    @pytest.mark.parametrize("from_version", [0, 3])
+    def test_migration_version_must_be_older_than_current(self, from_version: int) -> None:
+        with pytest.raises(ValueError):
+            EmailTaskData.migration(from_version)
+
+    @pytest.mark.parametrize(
+        "attributes", [{"schema_version": 0}, {"schema_version": 2, "accepted_versions": 0}]
+    )
+    def test_invalid_class_settings(self, attributes: dict[str, int]) -> None:
+        with pytest.raises(TypeError):
+            type("BadTaskData", (VersionedTaskData,), {"__module__": __name__, **attributes})
@@ -0,0 +1,185 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from moleql_patterns.commands import Task, TaskData, TaskDeserializationError, VersionedTaskData
+from moleql_patterns.diagnostics import AllocationTracker, measure_hydration
+from moleql_patterns.structural import Entity, InMemoryEntityRepository
+
+from ..structural._repository_shared import NOW, Note, make_note
+
+
+# =========================================================
+# CLASS IMPORT DATA
+# =========================================================
+class ImportData(TaskData):
+    rows: list[str]
+
+
+# =========================================================
+# CLASS IMPORT DATA V2
+# =========================================================
+class ImportDataV2(VersionedTaskData):
+    rows: list[str]
+
+
+# =========================================================
+# CLASS IMPORT TASK
+# =========================================================
+class ImportTask(Task[ImportData]):
+    task_data_cls = ImportData
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        super().__init__(payload)
+
+    def exec(self) -> int:
+        return len(self.task_data.rows)
+
+
+def payload(rows: int = 100) -> dict[str, Any]:
+    return {"correlation_id": "c", "rows": [f"row-{index}" * 10 for index in range(rows)]}
+
+
+def totals(tracker: AllocationTracker) -> dict[tuple[str, str], tuple[int, int, int]]:
+    return {
+        (entry.site, entry.model): (entry.calls, entry.objects, entry.bytes)
+        for entry in tracker.report()
+    }
+
+
+# =========================================================
+# CLASS TEST ALLOCATION TRACKER
+# =========================================================
+class TestAllocationTracker:
+    def test_task_data_from_payload(self) -> None:
+        with AllocationTracker() as tracker:
+            kept = [ImportData.from_payload(payload()) for _ in range(3)]
+
+        calls, objects, size = totals(tracker)[("TaskData.from_payload", "ImportData")]
+        assert (calls, objects) == (3, 3)
+        assert size > 0
+        assert len(kept) == 3
+
+    def test_subclass_overrides_count_once(self) -> None:
+        with AllocationTracker() as tracker:
+            ImportDataV2.from_payload(payload())
+
+        assert totals(tracker)[("TaskData.from_payload", "ImportDataV2")][:2] == (1, 1)
+
+    def test_task_construction(self) -> None:
+        with AllocationTracker() as tracker:
+            ImportTask(payload())
+
+        report = totals(tracker)
+        assert report[("TaskBase.__init__", "ImportData")][:2] == (1, 1)
+        assert report[("TaskData.from_payload", "ImportData")][:2] == (1, 1)
+
+    def test_entities_and_repository_list(self) -> None:
+        repo = InMemoryEntityRepository[int, Note]()
+        with AllocationTracker() as tracker:
+            repo.add_many(make_note(index) for index in range(20))
+            Note.model_validate({"id": 99, "title": "x", "created_at": NOW, "updated_at": NOW})
+            repo.list()
+            repo.list(lambda note: note.id > 100)
+
+        report = totals(tracker)
+        assert report[("Entity.__init__", "Note")][:2] == (20, 20)
+        assert report[("Entity.model_validate", "Note")][:2] == (1, 1)
+        assert report[("EntityRepository.list", "Note")][:2] == (1, 20)
+        assert report[("EntityRepository.list", "-")][:2] == (1, 0)
+
+    def test_uninstall_restores_methods(self) -> None:
+        originals = (
+            vars(TaskData)["from_payload"],
+            Entity.__init__,
+            InMemoryEntityRepository.list,
+        )
+        tracing = tracemalloc.is_tracing()
+
+        with AllocationTracker():
+            assert InMemoryEntityRepository.list is not originals[2]
+
+        assert vars(TaskData)["from_payload"] is originals[0]
+        assert Entity.__init__ is originals[1]
+        assert InMemoryEntityRepository.list is originals[2]
+        assert "__init__" not in vars(Entity)
+        assert tracemalloc.is_tracing() == tracing
+
+    def test_keeps_running_tracemalloc(self) -> None:
+        tracemalloc.start()
+        try:
+            with AllocationTracker():
+                pass
+
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_install_twice_fails(self) -> None:
+        with AllocationTracker() as tracker, pytest.raises(RuntimeError):
+            tracker.install()
+
+    def test_format_report_and_reset(self) -> None:
+        with AllocationTracker() as tracker:
+            ImportData.from_payload(payload())
+
+        table = tracker.format_report()
+        tracker.reset()
+
+        assert "TaskData.from_payload" in table
+        assert "ImportData" in table
+        assert tracker.report() == []
+        assert not tracker.installed
+
+    def test_errors_are_not_recorded(self) -> None:
+        with AllocationTracker() as tracker, pytest.raises(TaskDeserializationError):
+            ImportData.from_payload({"rows": "missing correlation id"})
+
+        assert tracker.report() == []
+
+
+# =========================================================
+# CLASS TEST MEASURE HYDRATION
+# =========================================================
+class TestMeasureHydration:
+    def test_reports_per_100k(self) -> None:
+        stats = measure_hydration(lambda index: make_note(index), count=2000)
+
+        assert stats.objects == 2000
+        assert stats.traced_peak_bytes > 0
+        assert stats.traced_peak_per_100k == pytest.approx(stats.traced_peak_bytes * 50)
+        assert stats.rss_growth_per_100k == stats.rss_growth_bytes * 50
+        assert not tracemalloc.is_tracing()
+
+    def test_invalid_count(self) -> None:
+        with pytest.raises(ValueError):
+            measure_hydration(make_note, count=0)
+
+    def test_allocation_stats_per_object(self) -> None:
+        with AllocationTracker() as tracker:
+            InMemoryEntityRepository[int, Note]().list()
+
+        assert tracker.report()[0].bytes_per_object == 0.0
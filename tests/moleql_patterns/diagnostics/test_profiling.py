@@ -0,0 +1,223 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import io
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from moleql_patterns.commands import APIOperation, AsyncAPIOperation, AsyncTask, Task, TaskData
+from moleql_patterns.diagnostics import (
+    Profiler,
+    ProfileStats,
+    async_profiling_middleware,
+    profiled,
+    profiling_middleware,
+)
+
+from ..commands._api_operation_shared import ExampleResult
+
+profiler = Profiler(interval=0.0005)
+
+
+def spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def hot_loop() -> None:
+    spin(0.03)
+
+
+# =========================================================
+# CLASS REPORT OPERATION
+# =========================================================
+class ReportOperation(APIOperation[ExampleResult]):
+    middlewares = (profiling_middleware(profiler),)
+
+    def verify_access(self) -> None:
+        pass
+
+    def _execute(self) -> ExampleResult:
+        hot_loop()
+        return ExampleResult(value=1)
+
+
+# =========================================================
+# CLASS ASYNC REPORT OPERATION
+# =========================================================
+class AsyncReportOperation(AsyncAPIOperation[ExampleResult]):
+    middlewares = (async_profiling_middleware(profiler),)
+
+    def verify_access(self) -> None:
+        pass
+
+    async def _execute_async(self) -> ExampleResult:
+        await asyncio.sleep(0.01)
+        return ExampleResult(value=1)
+
+
+# =========================================================
+# CLASS REPORT DATA
+# =========================================================
+class ReportData(TaskData):
+    pass
+
+
+# =========================================================
+# CLASS REPORT TASK
+# =========================================================
+class ReportTask(Task[ReportData]):
+    task_data_cls = ReportData
+
+    @profiled(profiler)
+    def exec(self) -> str:
+        hot_loop()
+        return "done"
+
+
+# =========================================================
+# CLASS ASYNC REPORT TASK
+# =========================================================
+class AsyncReportTask(AsyncTask[ReportData]):
+    task_data_cls = ReportData
+
+    @profiled(profiler)
+    async def exec(self) -> str:
+        await asyncio.sleep(0.02)
+        return "done"
+
+
+@pytest.fixture(autouse=True)
+def clean_profiler() -> Iterator[None]:
+    profiler.reset()
+    profiler.enabled = True
+    profiler.sample_rate = 1.0
+    yield
+    profiler.reset()
+
+
+# =========================================================
+# CLASS TEST PROFILER
+# =========================================================
+class TestProfiler:
+    def test_operation_middleware_records_samples(self) -> None:
+        ReportOperation().execute()
+
+        stats = profiler.stats()["ReportOperation"]
+        folded = profiler.collapsed("ReportOperation")
+        assert stats.calls == 1
+        assert stats.samples > 0
+        assert stats.seconds >= 0.03
+        assert f"{__name__}:hot_loop" in folded
+        assert all(line.startswith("ReportOperation;") for line in folded.splitlines())
+        assert "pytest" not in folded
+
+    def test_async_operation_middleware_records_calls(self) -> None:
+        result = asyncio.run(AsyncReportOperation().execute_async())
+
+        stats = profiler.stats()["AsyncReportOperation"]
+        assert result == ExampleResult(value=1)
+        assert stats.calls == 1
+        assert stats.seconds >= 0.01
+        assert stats.samples == 0
+
+    def test_task_decorator_records_samples(self) -> None:
+        result = ReportTask({"correlation_id": "c"}).run()
+
+        assert result == "done"
+        assert profiler.stats()["ReportTask"].samples > 0
+        assert ReportTask.exec.__name__ == "exec"
+
+    def test_async_task_decorator_awaits_the_call(self) -> None:
+        result = asyncio.run(AsyncReportTask({"correlation_id": "c"}).run())
+
+        stats = profiler.stats()["AsyncReportTask"]
+        assert result == "done"
+        assert stats.calls == 1
+        assert stats.seconds >= 0.02
+        assert stats.samples == 0
+
+    def test_add_call(self) -> None:
+        profiler.add_call("external", 0.5)
+        profiler.add_call("external", 0.25)
+
+        assert profiler.stats()["external"] == ProfileStats(calls=2, seconds=0.75, samples=0)
+
+    def test_context_manager(self) -> None:
+        with profiler.profile("block"):
+            hot_loop()
+
+        assert profiler.stats()["block"].samples > 0
+
+    def test_nested_calls_keep_outer_label(self) -> None:
+        with profiler.profile("outer"), profiler.profile("inner"):
+            hot_loop()
+
+        stats = profiler.stats()
+        assert stats["inner"].calls == 1
+        assert stats["inner"].samples == 0
+        assert stats["outer"].samples > 0
+
+    def test_sample_rate_selects_calls(self) -> None:
+        draws = iter([0.9, 0.1, 0.9, 0.1])
+        sampled = Profiler(sample_rate=0.5, rng=lambda: next(draws))
+
+        for _ in range(4):
+            with sampled.profile("op"):
+                pass
+
+        assert sampled.stats()["op"].calls == 2
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        profiler.enabled = False
+
+        ReportOperation().execute()
+        asyncio.run(AsyncReportOperation().execute_async())
+        asyncio.run(AsyncReportTask({"correlation_id": "c"}).run())
+        ReportTask({"correlation_id": "c"}).run()
+        with profiler.profile("block"):
+            pass
+
+        assert profiler.stats() == {}
+        assert profiler.collapsed() == ""
+
+    def test_dump(self, tmp_path: Path) -> None:
+        ReportOperation().execute()
+        buffer = io.StringIO()
+
+        profiler.dump(tmp_path / "profile.folded")
+        profiler.dump(buffer)
+
+        assert (tmp_path / "profile.folded").read_text() == buffer.getvalue() != ""
+        for line in buffer.getvalue().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+
+    @pytest.mark.parametrize("kwargs", [{"sample_rate": 1.5}, {"interval": 0}])
+    def test_invalid_settings(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            Profiler(**kwargs)
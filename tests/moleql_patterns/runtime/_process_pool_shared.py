@@ -0,0 +1,67 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import hashlib
+import os
+from typing import Any
+
+from moleql_patterns.commands import AsyncTask, Task, TaskData
+
+
+# =========================================================
+# CLASS DIGEST TASK DATA
+# =========================================================
+class DigestTaskData(TaskData):
+    blob: bytes
+
+
+# =========================================================
+# CLASS DIGEST TASK
+# =========================================================
+class DigestTask(Task[DigestTaskData]):
+    task_data_cls = DigestTaskData
+
+    def __init__(self, task_data: dict[str, Any], hasher: str) -> None:
+        self._hasher = hasher
+        super().__init__(task_data)
+
+    def exec(self) -> tuple[str, int]:
+        digest = hashlib.new(self._hasher, self.task_data.blob).hexdigest()
+        return digest, os.getpid()
+
+
+# =========================================================
+# CLASS ASYNC DIGEST TASK
+# =========================================================
+class AsyncDigestTask(AsyncTask[DigestTaskData]):
+    task_data_cls = DigestTaskData
+
+    def __init__(self, task_data: dict[str, Any], **dependencies: Any) -> None:
+        self._hasher = dependencies["hasher"]
+        super().__init__(task_data)
+
+    async def exec(self) -> str:
+        return hashlib.new(self._hasher, self.task_data.blob).hexdigest()
+
+
+def build_dependencies() -> dict[str, Any]:
+    return {"hasher": "sha256", "unused": object()}
@@ -0,0 +1,445 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from moleql_patterns.commands import AsyncTask, FrozenTaskData, Task, TaskData
+from moleql_patterns.runtime import (
+    IdempotencyStore,
+    IdempotentRunner,
+    InMemoryIdempotencyStore,
+    SQLiteIdempotencyStore,
+    TaskInProgressError,
+)
+
+
+# =========================================================
+# CLASS CHARGE TASK DATA
+# =========================================================
+class ChargeTaskData(TaskData):
+    amount: int
+
+
+# =========================================================
+# CLASS FROZEN CHARGE TASK DATA
+# =========================================================
+class FrozenChargeTaskData(FrozenTaskData):
+    amount: int
+
+
+# =========================================================
+# CLASS CHARGE TASK
+# =========================================================
+class ChargeTask(Task[ChargeTaskData]):
+    task_data_cls = ChargeTaskData
+    calls: list[int] = []
+
+    def exec(self) -> dict[str, int]:
+        self.calls.append(self.task_data.amount)
+        return {"charged": self.task_data.amount}
+
+
+# =========================================================
+# CLASS FROZEN CHARGE TASK
+# =========================================================
+class FrozenChargeTask(Task[FrozenChargeTaskData]):
+    task_data_cls = FrozenChargeTaskData
+
+    def exec(self) -> int:
+        return self.task_data.amount
+
+
+# =========================================================
+# CLASS FAILING TASK
+# =========================================================
+class FailingTask(Task[ChargeTaskData]):
+    task_data_cls = ChargeTaskData
+
+    def exec(self) -> None:
+        raise ValueError("declined")
+
+
+# =========================================================
+# CLASS ASYNC CHARGE TASK
+# =========================================================
+class AsyncChargeTask(AsyncTask[ChargeTaskData]):
+    task_data_cls = ChargeTaskData
+    calls: list[int] = []
+
+    async def exec(self) -> int:
+        self.calls.append(self.task_data.amount)
+        return self.task_data.amount
+
+
+# =========================================================
+# CLASS ASYNC FAILING TASK
+# =========================================================
+class AsyncFailingTask(AsyncTask[ChargeTaskData]):
+    task_data_cls = ChargeTaskData
+
+    async def exec(self) -> None:
+        raise ValueError("declined")
+
+
+# =========================================================
+# CLASS FAKE CLOCK
+# =========================================================
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(
+    request: pytest.FixtureRequest, tmp_path: Path, clock: FakeClock
+) -> Iterator[IdempotencyStore]:
+    if request.param == "memory":
+        yield InMemoryIdempotencyStore(clock=clock)
+    else:
+        with SQLiteIdempotencyStore(tmp_path / "idempotency.db", clock=clock) as store:
+            yield store
+
+
+@pytest.fixture(autouse=True)
+def reset_calls() -> None:
+    ChargeTask.calls = []
+    AsyncChargeTask.calls = []
+
+
+# =========================================================
+# CLASS HANDLE
+# =========================================================
+class Handle:
+    def __repr__(self) -> str:
+        return "Handle()"
+
+
+PAYLOAD = {"correlation_id": "order-1", "amount": 42}
+
+
+# =========================================================
+# CLASS TEST IDEMPOTENCY STORE CONTRACT
+# =========================================================
+class TestIdempotencyStoreContract:
+    def test_base_class_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            IdempotencyStore()
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("acquire", ("key", 1.0)),
+            ("complete", ("key", "token", None, 1.0)),
+            ("release", ("key", "token")),
+            ("purge_expired", ()),
+        ],
+    )
+    def test_base_methods_raise(self, method: str, args: tuple[object, ...]) -> None:
+        with pytest.raises(NotImplementedError):
+            getattr(IdempotencyStore, method)(object(), *args)
+
+
+# =========================================================
+# CLASS TEST IDEMPOTENCY STORES
+# =========================================================
+class TestIdempotencyStores:
+    def test_first_acquire_takes_lease(self, store: IdempotencyStore) -> None:
+        record = store.acquire("key", 10.0)
+
+        assert record.state == "acquired"
+        assert record.token is not None
+
+    def test_second_acquire_reports_in_progress(self, store: IdempotencyStore) -> None:
+        store.acquire("key", 10.0)
+
+        record = store.acquire("key", 10.0)
+
+        assert record.state == "in_progress"
+        assert record.token is None
+
+    def test_completed_result_is_returned(self, store: IdempotencyStore) -> None:
+        token = store.acquire("key", 10.0).token
+        assert store.complete("key", token, {"charged": 42}, 60.0)
+
+        record = store.acquire("key", 10.0)
+
+        assert record.state == "completed"
+        assert record.result == {"charged": 42}
+
+    def test_expired_lease_can_be_taken_over(
+        self, store: IdempotencyStore, clock: FakeClock
+    ) -> None:
+        stale = store.acquire("key", 10.0).token
+        clock.now += 11
+
+        record = store.acquire("key", 10.0)
+
+        assert record.state == "acquired"
+        assert record.token != stale
+        assert not store.complete("key", stale, 1, 60.0)
+
+    def test_complete_unknown_key_fails(self, store: IdempotencyStore) -> None:
+        assert not store.complete("missing", "token", 1, 60.0)
+
+    def test_expired_result_is_evicted(self, store: IdempotencyStore, clock: FakeClock) -> None:
+        token = store.acquire("key", 10.0).token
+        store.complete("key", token, 1, 60.0)
+        clock.now += 61
+
+        assert store.acquire("key", 10.0).state == "acquired"
+
+    def test_release_allows_retry(self, store: IdempotencyStore) -> None:
+        token = store.acquire("key", 10.0).token
+
+        store.release("key", token)
+
+        assert store.acquire("key", 10.0).state == "acquired"
+
+    def test_release_with_wrong_token_is_ignored(self, store: IdempotencyStore) -> None:
+        store.acquire("key", 10.0)
+
+        store.release("key", "other")
+
+        assert store.acquire("key", 10.0).state == "in_progress"
+
+    def test_release_does_not_drop_completed_result(self, store: IdempotencyStore) -> None:
+        token = store.acquire("key", 10.0).token
+        store.complete("key", token, 1, 60.0)
+
+        store.release("key", token)
+
+        assert store.acquire("key", 10.0).state == "completed"
+
+    def test_purge_expired(self, store: IdempotencyStore, clock: FakeClock) -> None:
+        store.acquire("short", 1.0)
+        store.acquire("long", 100.0)
+        clock.now += 2
+
+        assert store.purge_expired() == 1
+        assert store.acquire("long", 100.0).state == "in_progress"
+
+
+# =========================================================
+# CLASS TEST IDEMPOTENT RUNNER
+# =========================================================
+class TestIdempotentRunner:
+    def test_duplicate_returns_stored_result(self, store: IdempotencyStore) -> None:
+        runner = IdempotentRunner(store)
+
+        first = runner.run(ChargeTask(PAYLOAD))
+        second = runner.run(ChargeTask(PAYLOAD))
+
+        assert first == second == {"charged": 42}
+        assert ChargeTask.calls == [42]
+
+    def test_different_payload_runs_again(self, store: IdempotencyStore) -> None:
+        runner = IdempotentRunner(store)
+
+        runner.run(ChargeTask(PAYLOAD))
+        runner.run(ChargeTask({**PAYLOAD, "amount": 7}))
+
+        assert ChargeTask.calls == [42, 7]
+
+    def test_different_correlation_id_runs_again(self, store: IdempotencyStore) -> None:
+        runner = IdempotentRunner(store)
+
+        runner.run(ChargeTask(PAYLOAD))
+        runner.run(ChargeTask({**PAYLOAD, "correlation_id": "order-2"}))
+
+        assert ChargeTask.calls == [42, 42]
+
+    def test_result_expires(self, store: IdempotencyStore, clock: FakeClock) -> None:
+        runner = IdempotentRunner(store, result_ttl=10.0)
+        runner.run(ChargeTask(PAYLOAD))
+        clock.now += 11
+
+        runner.run(ChargeTask(PAYLOAD))
+
+        assert ChargeTask.calls == [42, 42]
+
+    def test_failure_releases_lease(self, store: IdempotencyStore) -> None:
+        runner = IdempotentRunner(store)
+        with pytest.raises(ValueError):
+            runner.run(FailingTask(PAYLOAD))
+
+        record = store.acquire(IdempotentRunner.key_for(FailingTask(PAYLOAD)), 10.0)
+
+        assert record.state == "acquired"
+
+    def test_unserializable_result_is_stored(self, tmp_path: Path) -> None:
+        # =========================================================
+        # CLASS OPAQUE TASK
+        # =========================================================
+        class OpaqueTask(Task[ChargeTaskData]):
+            task_data_cls = ChargeTaskData
+            calls = 0
+
+            def exec(self) -> dict[str, object]:
+                OpaqueTask.calls += 1
+                return {"receipt": b"\xff", "handle": Handle()}
+
+        with SQLiteIdempotencyStore(tmp_path / "idempotency.db") as store:
+            runner = IdempotentRunner(store)
+            runner.run(OpaqueTask(PAYLOAD))
+
+            duplicate = runner.run(OpaqueTask(PAYLOAD))
+
+        assert duplicate == {"receipt": "_w==", "handle": "Handle()"}
+        assert OpaqueTask.calls == 1
+
+    def test_store_failure_releases_lease(
+        self, store: IdempotencyStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail(*args: object) -> bool:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(store, "complete", fail)
+
+        with pytest.raises(OSError):
+            IdempotentRunner(store).run(ChargeTask(PAYLOAD))
+
+        assert store.acquire(IdempotentRunner.key_for(ChargeTask(PAYLOAD)), 10.0).state == (
+            "acquired"
+        )
+
+    def test_concurrent_duplicate_raises_in_progress(self, store: IdempotencyStore) -> None:
+        runner = IdempotentRunner(store)
+        store.acquire(IdempotentRunner.key_for(ChargeTask(PAYLOAD)), 60.0)
+
+        with pytest.raises(TaskInProgressError):
+            runner.run(ChargeTask(PAYLOAD))
+        assert ChargeTask.calls == []
+
+    def test_frozen_task_data_uses_cached_content_hash(self, store: IdempotencyStore) -> None:
+        runner = IdempotentRunner(store)
+        task = FrozenChargeTask(PAYLOAD)
+
+        key = IdempotentRunner.key_for(task)
+
+        assert key.endswith(task.task_data.content_hash())
+        assert runner.run(task) == runner.run(FrozenChargeTask(PAYLOAD)) == 42
+
+    def test_key_includes_task_class(self) -> None:
+        key = IdempotentRunner.key_for(ChargeTask(PAYLOAD))
+
+        assert key.startswith(f"{__name__}.ChargeTask:order-1:")
+
+    def test_only_one_thread_runs(self) -> None:
+        store = InMemoryIdempotencyStore()
+        runner = IdempotentRunner(store)
+        started = threading.Event()
+        release = threading.Event()
+
+        # =========================================================
+        # CLASS SLOW TASK
+        # =========================================================
+        class SlowTask(Task[ChargeTaskData]):
+            task_data_cls = ChargeTaskData
+
+            def exec(self) -> int:
+                started.set()
+                release.wait(5)
+                return self.task_data.amount
+
+        worker = threading.Thread(target=runner.run, args=(SlowTask(PAYLOAD),))
+        worker.start()
+        started.wait(5)
+
+        with pytest.raises(TaskInProgressError):
+            runner.run(SlowTask(PAYLOAD))
+        release.set()
+        worker.join()
+        assert runner.run(SlowTask(PAYLOAD)) == 42
+
+
+# =========================================================
+# CLASS TEST IDEMPOTENT RUNNER ASYNC
+# =========================================================
+class TestIdempotentRunnerAsync:
+    def test_duplicate_returns_stored_result(self, store: IdempotencyStore) -> None:
+        runner = IdempotentRunner(store)
+
+        async def scenario() -> tuple[int, int]:
+            return (
+                await runner.run_async(AsyncChargeTask(PAYLOAD)),
+                await runner.run_async(AsyncChargeTask(PAYLOAD)),
+            )
+
+        assert asyncio.run(scenario()) == (42, 42)
+        assert AsyncChargeTask.calls == [42]
+
+    def test_failure_releases_lease(self, store: IdempotencyStore) -> None:
+        runner = IdempotentRunner(store)
+
+        with pytest.raises(ValueError):
+            asyncio.run(runner.run_async(AsyncFailingTask(PAYLOAD)))
+
+        key = IdempotentRunner.key_for(AsyncFailingTask(PAYLOAD))
+        assert store.acquire(key, 10.0).state == "acquired"
+
+    def test_cancellation_releases_lease(self, store: IdempotencyStore) -> None:
+        started = threading.Event()
+
+        # =========================================================
+        # CLASS HANGING TASK
+        # =========================================================
+        class HangingTask(AsyncTask[ChargeTaskData]):
+            task_data_cls = ChargeTaskData
+
+            async def exec(self) -> None:
+                started.set()
+                await asyncio.sleep(5.0)
+
+        runner = IdempotentRunner(store)
+
+        async def scenario() -> None:
+            run = asyncio.ensure_future(runner.run_async(HangingTask(PAYLOAD)))
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            run.cancel()
+            await run
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(scenario())
+
+        key = IdempotentRunner.key_for(HangingTask(PAYLOAD))
+        assert store.acquire(key, 10.0).state == "acquired"
+
+    def test_concurrent_duplicate_raises_in_progress(self, store: IdempotencyStore) -> None:
+        runner = IdempotentRunner(store)
+        store.acquire(IdempotentRunner.key_for(AsyncChargeTask(PAYLOAD)), 60.0)
+
+        with pytest.raises(TaskInProgressError):
+            asyncio.run(runner.run_async(AsyncChargeTask(PAYLOAD)))
@@ -0,0 +1,162 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import hashlib
+import os
+from collections.abc import Iterator
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from moleql_patterns.commands import Task, TaskDeserializationError
+from moleql_patterns.runtime import ProcessPoolTaskExecutor, process_pool
+
+from ._process_pool_shared import AsyncDigestTask, DigestTask, DigestTaskData, build_dependencies
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[ProcessPoolTaskExecutor]:
+    with ProcessPoolTaskExecutor(
+        max_workers=2, dependency_factory=build_dependencies, shared_memory_threshold=1024
+    ) as pool:
+        yield pool
+
+
+# =========================================================
+# CLASS TEST PROCESS POOL TASK EXECUTOR SUBMIT
+# =========================================================
+class TestProcessPoolTaskExecutorSubmit:
+    def test_runs_task_in_worker_process(self, pool: ProcessPoolTaskExecutor) -> None:
+        data = DigestTaskData(correlation_id="c-1", blob=b"small")
+
+        digest, pid = pool.submit(DigestTask, data.to_payload()).result(timeout=30)
+
+        assert digest == hashlib.sha256(b"small").hexdigest()
+        assert pid != os.getpid()
+
+    def test_large_fields_use_shared_memory(self, pool: ProcessPoolTaskExecutor) -> None:
+        blob = os.urandom(64 * 1024)
+        data = DigestTaskData(correlation_id="c-1", blob=blob)
+
+        digest, _ = pool.submit(DigestTask, data.to_payload()).result(timeout=30)
+
+        assert digest == hashlib.sha256(blob).hexdigest()
+
+    def test_runs_async_task(self, pool: ProcessPoolTaskExecutor) -> None:
+        data = DigestTaskData(correlation_id="c-1", blob=b"async")
+
+        digest = asyncio.run(pool.submit_async(AsyncDigestTask, data.to_payload()))
+
+        assert digest == hashlib.sha256(b"async").hexdigest()
+
+    def test_propagates_task_errors(self, pool: ProcessPoolTaskExecutor) -> None:
+        future = pool.submit(DigestTask, {"correlation_id": "c-1"})
+
+        with pytest.raises(TaskDeserializationError):
+            future.result(timeout=30)
+
+    def test_rejects_local_task_classes(self, pool: ProcessPoolTaskExecutor) -> None:
+        # =========================================================
+        # CLASS LOCAL TASK
+        # =========================================================
+        class LocalTask(Task[DigestTaskData]):
+            task_data_cls = DigestTaskData
+
+            def exec(self) -> None:
+                return None
+
+        with pytest.raises(TypeError):
+            pool.submit(LocalTask, {"correlation_id": "c-1"})
+
+    def test_releases_shared_memory_when_submit_fails(self) -> None:
+        pool = ProcessPoolTaskExecutor(max_workers=1, shared_memory_threshold=1)
+        pool.shutdown()
+
+        with pytest.raises(RuntimeError):
+            pool.submit(DigestTask, {"correlation_id": "c-1", "blob": b"data"})
+
+
+# =========================================================
+# CLASS TEST PROCESS POOL WORKER
+# =========================================================
+class TestProcessPoolWorker:
+    def test_run_task_in_process_with_filtered_dependencies(self) -> None:
+        process_pool._initialize_worker(build_dependencies)
+        ref = process_pool._task_reference(DigestTask)
+
+        digest, _ = process_pool._run_task(ref, {"correlation_id": "c-1", "blob": b"x"}, ())
+
+        assert digest == hashlib.sha256(b"x").hexdigest()
+
+    def test_run_async_task_in_process_with_var_keyword(self) -> None:
+        process_pool._initialize_worker(build_dependencies)
+        ref = process_pool._task_reference(AsyncDigestTask)
+
+        digest = process_pool._run_task(ref, {"correlation_id": "c-1", "blob": b"x"}, ())
+
+        assert digest == hashlib.sha256(b"x").hexdigest()
+
+    def test_run_task_reads_shared_fields(self) -> None:
+        process_pool._initialize_worker(build_dependencies)
+        ref = process_pool._task_reference(DigestTask)
+        block = SharedMemory(create=True, size=4)
+        block.buf[:4] = b"blob"
+
+        try:
+            digest, _ = process_pool._run_task(
+                ref, {"correlation_id": "c-1"}, (("blob", block.name, 4),)
+            )
+        finally:
+            process_pool._release([("blob", block, 4)])
+
+        assert digest == hashlib.sha256(b"blob").hexdigest()
+
+    def test_initializer_without_factory(self) -> None:
+        process_pool._initialize_worker(None)
+
+        assert process_pool._worker_dependencies == {}
+
+    def test_share_failure_releases_blocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pool = ProcessPoolTaskExecutor(max_workers=1, shared_memory_threshold=1)
+        released: list[int] = []
+        release = process_pool._release
+
+        def tracking_release(blocks: list) -> None:
+            released.append(len(blocks))
+            release(blocks)
+
+        monkeypatch.setattr(process_pool, "_release", tracking_release)
+
+        with pytest.raises(TypeError):
+            pool._share_large_fields({"first": b"data", "second": _BadBuffer()})
+        pool.shutdown()
+
+        assert released == [1]
+
+
+# =========================================================
+# CLASS BAD BUFFER
+# =========================================================
+class _BadBuffer(bytes):
+    def __len__(self) -> int:
+        raise TypeError("no length")
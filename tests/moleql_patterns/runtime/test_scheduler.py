@@ -0,0 +1,298 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+from collections import Counter
+
+import pytest
+
+from moleql_patterns.commands import Task, TaskData
+from moleql_patterns.runtime import ScheduledTask, TaskScheduler
+
+
+# =========================================================
+# CLASS REPORT DATA
+# =========================================================
+class ReportData(TaskData):
+    pass
+
+
+# =========================================================
+# CLASS REPORT TASK
+# =========================================================
+class ReportTask(Task[ReportData]):
+    task_data_cls = ReportData
+
+    def exec(self) -> str:
+        return "report"
+
+
+# =========================================================
+# CLASS CHARGE TASK
+# =========================================================
+class ChargeTask(Task[ReportData]):
+    task_data_cls = ReportData
+
+    def exec(self) -> str:
+        return "charge"
+
+
+# =========================================================
+# CLASS EXPORT TASK
+# =========================================================
+class ExportTask(Task[ReportData]):
+    task_data_cls = ReportData
+
+    def exec(self) -> str:
+        return "export"
+
+
+# =========================================================
+# CLASS FAKE CLOCK
+# =========================================================
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def drain(scheduler: TaskScheduler, count: int) -> list[ScheduledTask]:
+    dispatched = []
+    for _ in range(count):
+        scheduled = scheduler.next(timeout=0)
+        assert scheduled is not None
+        scheduler.complete(scheduled)
+        dispatched.append(scheduled)
+    return dispatched
+
+
+# =========================================================
+# CLASS TEST TASK SCHEDULER CONFIGURE
+# =========================================================
+class TestTaskSchedulerConfigure:
+    def test_rejects_non_positive_weight(self) -> None:
+        with pytest.raises(ValueError):
+            TaskScheduler().configure(ReportTask, weight=0)
+
+    def test_rejects_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            TaskScheduler().configure(ReportTask, max_concurrency=0)
+
+    def test_reconfigure_moves_class_between_tiers(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.configure(ReportTask, priority=0)
+
+        scheduler.configure(ReportTask, priority=5, weight=2.0)
+
+        stats = scheduler.stats()[ReportTask]
+        assert (stats.priority, stats.weight) == (5, 2.0)
+
+    def test_reconfiguring_credited_head_keeps_rotation_order(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.configure(ChargeTask, weight=2.0)
+        scheduler.configure(ReportTask)
+        scheduler.configure(ExportTask)
+        for task_cls in (ChargeTask, ChargeTask, ChargeTask, ReportTask, ExportTask):
+            scheduler.submit(task_cls, {"correlation_id": "x"})
+        assert scheduler.next(timeout=0).task_cls is ChargeTask
+
+        scheduler.configure(ChargeTask, priority=-1, weight=2.0)
+
+        assert [item.task_cls for item in drain(scheduler, 2)] == [ReportTask, ExportTask]
+
+    def test_late_task_data_cls_settings_replace_default_queue(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.submit(ReportTask, {"correlation_id": "a"})
+        scheduler.submit(ReportTask, {"correlation_id": "b"})
+        first = scheduler.next(timeout=0)
+
+        scheduler.configure(ReportData, max_concurrency=1)
+
+        assert ReportTask not in scheduler.stats()
+        assert scheduler.stats()[ReportData].in_flight == 1
+        assert scheduler.next(timeout=0) is None
+        scheduler.complete(first)
+        second = scheduler.next(timeout=0)
+        assert second is not None and second.schedule_key is ReportData
+        scheduler.submit(ReportTask, {"correlation_id": "c"})
+        assert scheduler.stats()[ReportData].queue_depth == 1
+
+
+# =========================================================
+# CLASS TEST TASK SCHEDULER DISPATCH
+# =========================================================
+class TestTaskSchedulerDispatch:
+    def test_empty_scheduler_returns_none(self) -> None:
+        assert TaskScheduler().next(timeout=0) is None
+
+    def test_next_times_out(self) -> None:
+        assert TaskScheduler().next(timeout=0.01) is None
+
+    def test_dispatches_fifo_within_class(self) -> None:
+        scheduler = TaskScheduler()
+        for index in range(3):
+            scheduler.submit(ReportTask, {"correlation_id": str(index)})
+
+        dispatched = drain(scheduler, 3)
+
+        assert [item.payload["correlation_id"] for item in dispatched] == ["0", "1", "2"]
+        assert all(item.task_cls is ReportTask for item in dispatched)
+
+    def test_higher_priority_is_served_first(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.configure(ChargeTask, priority=10)
+        for index in range(5):
+            scheduler.submit(ReportTask, {"correlation_id": str(index)})
+        scheduler.submit(ChargeTask, {"correlation_id": "urgent"})
+
+        scheduled = scheduler.next(timeout=0)
+
+        assert scheduled is not None
+        assert scheduled.task_cls is ChargeTask
+
+    def test_weights_share_capacity(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.configure(ChargeTask, weight=3.0)
+        scheduler.configure(ReportTask, weight=1.0)
+        for index in range(40):
+            scheduler.submit(ChargeTask, {"correlation_id": str(index)})
+            scheduler.submit(ReportTask, {"correlation_id": str(index)})
+
+        dispatched = Counter(item.task_cls for item in drain(scheduler, 40))
+
+        assert dispatched[ChargeTask] == 30
+        assert dispatched[ReportTask] == 10
+
+    def test_fractional_weights_accumulate(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.configure(ChargeTask, weight=1.0)
+        scheduler.configure(ReportTask, weight=0.5)
+        for index in range(30):
+            scheduler.submit(ChargeTask, {"correlation_id": str(index)})
+            scheduler.submit(ReportTask, {"correlation_id": str(index)})
+
+        dispatched = Counter(item.task_cls for item in drain(scheduler, 30))
+
+        assert dispatched[ChargeTask] == 20
+        assert dispatched[ReportTask] == 10
+
+    def test_drained_class_is_skipped(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.submit(ReportTask, {"correlation_id": "a"})
+        for index in range(3):
+            scheduler.submit(ChargeTask, {"correlation_id": str(index)})
+
+        dispatched = [item.task_cls for item in drain(scheduler, 4)]
+
+        assert dispatched == [ReportTask, ChargeTask, ChargeTask, ChargeTask]
+
+    def test_concurrency_limit_holds_back_class(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.configure(ReportTask, max_concurrency=1)
+        scheduler.submit(ReportTask, {"correlation_id": "a"})
+        scheduler.submit(ReportTask, {"correlation_id": "b"})
+        scheduler.submit(ChargeTask, {"correlation_id": "c"})
+
+        first = scheduler.next(timeout=0)
+        second = scheduler.next(timeout=0)
+        third = scheduler.next(timeout=0)
+
+        assert first is not None and first.task_cls is ReportTask
+        assert second is not None and second.task_cls is ChargeTask
+        assert third is None
+        scheduler.complete(first)
+        fourth = scheduler.next(timeout=0)
+        assert fourth is not None and fourth.payload["correlation_id"] == "b"
+
+    def test_double_complete_releases_one_slot(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.configure(ReportTask, max_concurrency=1)
+        scheduler.submit(ReportTask, {"correlation_id": "a"})
+        first = scheduler.next(timeout=0)
+
+        scheduler.complete(first)
+        scheduler.complete(first)
+
+        assert scheduler.stats()[ReportTask].in_flight == 0
+
+    def test_task_inherits_task_data_cls_settings(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.configure(ReportData, max_concurrency=1)
+        scheduler.submit(ReportTask, {"correlation_id": "a"})
+        scheduler.submit(ChargeTask, {"correlation_id": "b"})
+
+        first = scheduler.next(timeout=0)
+
+        assert first is not None and first.schedule_key is ReportData
+        assert scheduler.next(timeout=0) is None
+
+    def test_blocked_next_wakes_on_submit(self) -> None:
+        scheduler = TaskScheduler()
+        results: list[ScheduledTask | None] = []
+        waiter = threading.Thread(target=lambda: results.append(scheduler.next(timeout=5.0)))
+        waiter.start()
+
+        scheduler.submit(ReportTask, {"correlation_id": "a"})
+        waiter.join()
+
+        assert results[0] is not None
+
+    def test_blocked_next_without_timeout(self) -> None:
+        scheduler = TaskScheduler()
+        results: list[ScheduledTask | None] = []
+        waiter = threading.Thread(target=lambda: results.append(scheduler.next()))
+        waiter.start()
+
+        scheduler.submit(ReportTask, {"correlation_id": "a"})
+        waiter.join(5.0)
+
+        assert results[0] is not None
+
+
+# =========================================================
+# CLASS TEST TASK SCHEDULER STATS
+# =========================================================
+class TestTaskSchedulerStats:
+    def test_reports_depth_and_wait_times(self) -> None:
+        clock = FakeClock()
+        scheduler = TaskScheduler(clock=clock)
+        scheduler.submit(ReportTask, {"correlation_id": "a"})
+        scheduler.submit(ReportTask, {"correlation_id": "b"})
+        clock.now = 4.0
+
+        scheduled = scheduler.next(timeout=0)
+        stats = scheduler.stats()[ReportTask]
+
+        assert scheduled is not None and scheduled.wait_time == 4.0
+        assert stats.queue_depth == 1
+        assert stats.in_flight == 1
+        assert stats.dispatched == 1
+        assert stats.max_wait_time == 4.0
+        assert stats.average_wait_time == 4.0
+
+    def test_average_wait_without_dispatches(self) -> None:
+        scheduler = TaskScheduler()
+        scheduler.submit(ReportTask, {"correlation_id": "a"})
+
+        assert scheduler.stats()[ReportTask].average_wait_time == 0.0
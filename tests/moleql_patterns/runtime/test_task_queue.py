@@ -0,0 +1,232 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from moleql_patterns.commands import TaskData, TaskDeserializationError, TaskSerializationError
+from moleql_patterns.runtime import QueuedTask, SQLiteTaskQueue, TaskQueue
+
+
+# =========================================================
+# CLASS EMAIL TASK DATA
+# =========================================================
+class EmailTaskData(TaskData):
+    recipient: str
+
+
+# =========================================================
+# CLASS ATTACHMENT TASK DATA
+# =========================================================
+class AttachmentTaskData(TaskData):
+    content: bytes
+    parts: list[bytes] = []
+
+
+# =========================================================
+# CLASS FAKE CLOCK
+# =========================================================
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(tmp_path: Path, clock: FakeClock) -> Iterator[SQLiteTaskQueue]:
+    with SQLiteTaskQueue(tmp_path / "queue.db", clock=clock) as queue:
+        yield queue
+
+
+# =========================================================
+# CLASS TEST TASK QUEUE CONTRACT
+# =========================================================
+class TestTaskQueueContract:
+    def test_base_class_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            TaskQueue()
+
+    @pytest.mark.parametrize("method", ["enqueue_many", "dequeue", "ack", "nack", "size"])
+    def test_base_methods_raise(self, method: str) -> None:
+        args = {"enqueue_many": ("name", []), "ack": (None,), "nack": (None,)}.get(method, ())
+
+        with pytest.raises(NotImplementedError):
+            getattr(TaskQueue, method)(object(), *args)
+
+
+# =========================================================
+# CLASS TEST SQLITE TASK QUEUE ENQUEUE
+# =========================================================
+class TestSQLiteTaskQueueEnqueue:
+    def test_enqueue_stores_payload(self, queue: SQLiteTaskQueue) -> None:
+        data = EmailTaskData(correlation_id="c-1", recipient="ada@example.com")
+
+        queue.enqueue("send_email", data.to_payload())
+
+        assert queue.size() == 1
+
+    def test_enqueue_many_returns_count(self, queue: SQLiteTaskQueue) -> None:
+        payloads = ({"correlation_id": f"c-{index}"} for index in range(10_000))
+
+        count = queue.enqueue_many("send_email", payloads)
+
+        assert count == 10_000
+        assert queue.size() == 10_000
+
+    def test_enqueue_many_empty_batch(self, queue: SQLiteTaskQueue) -> None:
+        assert queue.enqueue_many("send_email", []) == 0
+
+    def test_unserializable_payload_raises(self, queue: SQLiteTaskQueue) -> None:
+        with pytest.raises(TaskSerializationError):
+            queue.enqueue("send_email", {"correlation_id": object()})
+
+
+# =========================================================
+# CLASS TEST SQLITE TASK QUEUE DEQUEUE
+# =========================================================
+class TestSQLiteTaskQueueDequeue:
+    def test_dequeue_round_trips_payload(self, queue: SQLiteTaskQueue) -> None:
+        data = EmailTaskData(correlation_id="c-1", recipient="ada@example.com")
+        queue.enqueue("send_email", data.to_payload())
+
+        (message,) = queue.dequeue()
+
+        assert isinstance(message, QueuedTask)
+        assert message.task_name == "send_email"
+        assert message.attempts == 1
+        assert EmailTaskData.from_payload(message.payload) == data
+
+    @pytest.mark.parametrize("content", [b"\xff\x00\xfe", "héllo".encode()])
+    def test_dequeue_round_trips_bytes(self, queue: SQLiteTaskQueue, content: bytes) -> None:
+        data = AttachmentTaskData(correlation_id="c-1", content=content, parts=[content, b""])
+        queue.enqueue("attach", data.to_payload())
+
+        (message,) = queue.dequeue()
+
+        assert message.payload["content"] == content
+        assert AttachmentTaskData.from_payload(message.payload) == data
+
+    def test_dequeue_is_fifo(self, queue: SQLiteTaskQueue) -> None:
+        queue.enqueue_many("task", [{"correlation_id": str(index)} for index in range(5)])
+
+        messages = queue.dequeue(max_messages=3)
+
+        assert [message.payload["correlation_id"] for message in messages] == ["0", "1", "2"]
+
+    def test_leased_messages_are_hidden(self, queue: SQLiteTaskQueue) -> None:
+        queue.enqueue("task", {"correlation_id": "c-1"})
+        queue.dequeue(visibility_timeout=30.0)
+
+        assert queue.dequeue() == []
+
+    def test_expired_lease_is_redelivered(self, queue: SQLiteTaskQueue, clock: FakeClock) -> None:
+        queue.enqueue("task", {"correlation_id": "c-1"})
+        (first,) = queue.dequeue(visibility_timeout=30.0)
+        clock.now += 31.0
+
+        (second,) = queue.dequeue()
+
+        assert second.message_id == first.message_id
+        assert second.attempts == 2
+        assert second.receipt != first.receipt
+
+    def test_rejects_non_positive_batch(self, queue: SQLiteTaskQueue) -> None:
+        with pytest.raises(ValueError):
+            queue.dequeue(max_messages=0)
+
+    def test_corrupt_payload_raises(self, queue: SQLiteTaskQueue) -> None:
+        with pytest.raises(TaskDeserializationError):
+            queue._decode(b"not json")
+
+
+# =========================================================
+# CLASS TEST SQLITE TASK QUEUE ACK
+# =========================================================
+class TestSQLiteTaskQueueAck:
+    def test_ack_removes_message(self, queue: SQLiteTaskQueue) -> None:
+        queue.enqueue("task", {"correlation_id": "c-1"})
+        (message,) = queue.dequeue()
+
+        acked = queue.ack(message)
+
+        assert acked is True
+        assert queue.size() == 0
+
+    def test_ack_with_stale_receipt_is_rejected(
+        self, queue: SQLiteTaskQueue, clock: FakeClock
+    ) -> None:
+        queue.enqueue("task", {"correlation_id": "c-1"})
+        (stale,) = queue.dequeue(visibility_timeout=1.0)
+        clock.now += 2.0
+        queue.dequeue()
+
+        acked = queue.ack(stale)
+
+        assert acked is False
+        assert queue.size() == 1
+
+
+# =========================================================
+# CLASS TEST SQLITE TASK QUEUE NACK
+# =========================================================
+class TestSQLiteTaskQueueNack:
+    def test_nack_makes_message_visible(self, queue: SQLiteTaskQueue) -> None:
+        queue.enqueue("task", {"correlation_id": "c-1"})
+        (message,) = queue.dequeue()
+
+        released = queue.nack(message)
+
+        assert released is True
+        assert len(queue.dequeue()) == 1
+
+    def test_nack_with_delay(self, queue: SQLiteTaskQueue, clock: FakeClock) -> None:
+        queue.enqueue("task", {"correlation_id": "c-1"})
+        (message,) = queue.dequeue()
+        queue.nack(message, delay=10.0)
+
+        assert queue.dequeue() == []
+        clock.now += 10.0
+        assert len(queue.dequeue()) == 1
+
+
+# =========================================================
+# CLASS TEST SQLITE TASK QUEUE DURABILITY
+# =========================================================
+class TestSQLiteTaskQueueDurability:
+    def test_messages_survive_reopen(self, tmp_path: Path) -> None:
+        path = tmp_path / "queue.db"
+        with SQLiteTaskQueue(path) as queue:
+            queue.enqueue_many("task", [{"correlation_id": "c-1"}, {"correlation_id": "c-2"}])
+
+        with SQLiteTaskQueue(path) as reopened:
+            messages = reopened.dequeue(max_messages=5)
+
+        assert [message.payload["correlation_id"] for message in messages] == ["c-1", "c-2"]
@@ -0,0 +1,384 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from moleql_patterns.commands import AsyncTask, Task, TaskData
+from moleql_patterns.runtime import (
+    InMemoryWorkflowStore,
+    SQLiteWorkflowStore,
+    Workflow,
+    WorkflowRunner,
+    WorkflowStepError,
+    WorkflowStore,
+)
+
+
+# =========================================================
+# CLASS ORDER TASK DATA
+# =========================================================
+class OrderTaskData(TaskData):
+    order_id: int
+
+
+# =========================================================
+# CLASS LOG
+# =========================================================
+class Log:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.events: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    def add(self, event: str) -> None:
+        with self.lock:
+            self.events.append(event)
+
+
+# =========================================================
+# CLASS RECORD TASK
+# =========================================================
+class RecordTask(Task[OrderTaskData]):
+    task_data_cls = OrderTaskData
+
+    def __init__(self, payload: dict[str, Any], log: Log, name: str) -> None:
+        self._log = log
+        self._name = name
+        super().__init__(payload)
+
+    def exec(self) -> dict[str, Any]:
+        self._log.add(self._name)
+        return {"step": self._name, "order_id": self.task_data.order_id}
+
+
+# =========================================================
+# CLASS SLEEP TASK
+# =========================================================
+class SleepTask(AsyncTask[OrderTaskData]):
+    task_data_cls = OrderTaskData
+
+    def __init__(self, payload: dict[str, Any], log: Log, name: str) -> None:
+        self._log = log
+        self._name = name
+        super().__init__(payload)
+
+    async def exec(self) -> str:
+        self._log.active += 1
+        self._log.max_active = max(self._log.max_active, self._log.active)
+        await asyncio.sleep(0.01)
+        self._log.active -= 1
+        self._log.add(self._name)
+        return self._name
+
+
+# =========================================================
+# CLASS FAILING TASK
+# =========================================================
+class FailingTask(AsyncTask[OrderTaskData]):
+    task_data_cls = OrderTaskData
+
+    async def exec(self) -> None:
+        raise ValueError("declined")
+
+
+# =========================================================
+# CLASS OPAQUE TASK
+# =========================================================
+class OpaqueTask(Task[OrderTaskData]):
+    task_data_cls = OrderTaskData
+
+    def exec(self) -> object:
+        return object()
+
+
+PAYLOAD = {"correlation_id": "order-1", "order_id": 7}
+
+
+def record(log: Log, name: str) -> Any:
+    return lambda payload: RecordTask(payload, log, name)
+
+
+def undo(log: Log, name: str) -> Any:
+    return lambda payload, _: RecordTask(payload, log, f"undo-{name}")
+
+
+@pytest.fixture
+def log() -> Log:
+    return Log()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[WorkflowStore]:
+    if request.param == "memory":
+        yield InMemoryWorkflowStore()
+    else:
+        with SQLiteWorkflowStore(tmp_path / "workflows.db") as store:
+            yield store
+
+
+# =========================================================
+# CLASS TEST WORKFLOW
+# =========================================================
+class TestWorkflow:
+    def test_steps_keep_insertion_order(self, log: Log) -> None:
+        workflow = Workflow("checkout").step("a", record(log, "a")).step("b", record(log, "b"))
+
+        assert [step.name for step in workflow.steps] == ["a", "b"]
+
+    def test_duplicate_step_is_rejected(self, log: Log) -> None:
+        workflow = Workflow("checkout").step("a", record(log, "a"))
+
+        with pytest.raises(ValueError, match="already has a step"):
+            workflow.step("a", record(log, "a"))
+
+    def test_unknown_dependency_is_rejected(self, log: Log) -> None:
+        with pytest.raises(ValueError, match="must be added"):
+            Workflow("checkout").step("b", record(log, "b"), after=("a",))
+
+
+# =========================================================
+# CLASS TEST WORKFLOW STORE CONTRACT
+# =========================================================
+class TestWorkflowStoreContract:
+    def test_base_class_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            WorkflowStore()
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("load", ("wf",)),
+            ("save", ("wf", "step", None)),
+            ("discard", ("wf", "step")),
+            ("clear", ("wf",)),
+        ],
+    )
+    def test_base_methods_raise(self, method: str, args: tuple[object, ...]) -> None:
+        with pytest.raises(NotImplementedError):
+            getattr(WorkflowStore, method)(object(), *args)
+
+    def test_save_load_discard_clear(self, store: WorkflowStore) -> None:
+        store.save("wf", "a", {"id": 1})
+        store.save("wf", "b", 2)
+        store.save("other", "a", 3)
+
+        assert store.load("wf") == {"a": {"id": 1}, "b": 2}
+
+        store.discard("wf", "a")
+        assert store.load("wf") == {"b": 2}
+
+        store.clear("wf")
+        assert store.load("wf") == {}
+        assert store.load("other") == {"a": 3}
+
+
+# =========================================================
+# CLASS TEST WORKFLOW RUNNER
+# =========================================================
+class TestWorkflowRunner:
+    def test_runs_steps_in_dependency_order(self, store: WorkflowStore, log: Log) -> None:
+        workflow = (
+            Workflow("checkout")
+            .step("reserve", record(log, "reserve"))
+            .step("charge", record(log, "charge"), after=("reserve",))
+            .step("ship", record(log, "ship"), after=("charge",))
+        )
+
+        outputs = asyncio.run(WorkflowRunner(store).run(workflow, "wf", PAYLOAD))
+
+        assert log.events == ["reserve", "charge", "ship"]
+        assert outputs["ship"] == {"step": "ship", "order_id": 7}
+        assert store.load("wf") == outputs
+
+    def test_independent_branches_run_concurrently_up_to_cap(
+        self, store: WorkflowStore, log: Log
+    ) -> None:
+        workflow = Workflow("fan-out")
+        for name in "abcde":
+            workflow.step(name, lambda payload, name=name: SleepTask(payload, log, name))
+
+        asyncio.run(WorkflowRunner(store, max_concurrency=2).run(workflow, "wf", PAYLOAD))
+
+        assert sorted(log.events) == list("abcde")
+        assert log.max_active == 2
+
+    def test_inputs_receive_dependency_outputs(self, store: WorkflowStore, log: Log) -> None:
+        workflow = (
+            Workflow("checkout")
+            .step("reserve", record(log, "reserve"))
+            .step(
+                "charge",
+                record(log, "charge"),
+                after=("reserve",),
+                inputs=lambda payload, outputs: {
+                    "correlation_id": payload["correlation_id"],
+                    "order_id": outputs["reserve"]["order_id"] + 1,
+                },
+            )
+        )
+
+        outputs = asyncio.run(WorkflowRunner(store).run(workflow, "wf", PAYLOAD))
+
+        assert outputs["charge"]["order_id"] == 8
+
+    def test_resume_skips_completed_steps(self, store: WorkflowStore, log: Log) -> None:
+        store.save("wf", "reserve", {"step": "reserve", "order_id": 7})
+        workflow = (
+            Workflow("checkout")
+            .step("reserve", record(log, "reserve"))
+            .step("charge", record(log, "charge"), after=("reserve",))
+        )
+
+        outputs = asyncio.run(WorkflowRunner(store).run(workflow, "wf", PAYLOAD))
+
+        assert log.events == ["charge"]
+        assert set(outputs) == {"reserve", "charge"}
+
+    def test_failure_compensates_completed_steps_in_reverse(
+        self, store: WorkflowStore, log: Log
+    ) -> None:
+        workflow = (
+            Workflow("checkout")
+            .step("reserve", record(log, "reserve"), compensate=undo(log, "reserve"))
+            .step(
+                "charge", record(log, "charge"), after=("reserve",), compensate=undo(log, "charge")
+            )
+            .step("notify", record(log, "notify"), after=("charge",))
+            .step("ship", lambda payload: FailingTask(payload), after=("notify",))
+            .step("invoice", record(log, "invoice"), after=("ship",))
+        )
+
+        with pytest.raises(WorkflowStepError) as caught:
+            asyncio.run(WorkflowRunner(store).run(workflow, "wf", PAYLOAD))
+
+        assert caught.value.step == "ship"
+        assert isinstance(caught.value.__cause__, ValueError)
+        assert caught.value.compensated == ["charge", "reserve"]
+        assert log.events == ["reserve", "charge", "notify", "undo-charge", "undo-reserve"]
+        assert set(store.load("wf")) == {"notify"}
+
+    def test_running_siblings_finish_before_compensation(
+        self, store: WorkflowStore, log: Log
+    ) -> None:
+        workflow = (
+            Workflow("checkout")
+            .step(
+                "slow",
+                lambda payload: SleepTask(payload, log, "slow"),
+                compensate=undo(log, "slow"),
+            )
+            .step("fail", lambda payload: FailingTask(payload))
+            .step("later", record(log, "later"), after=("slow",))
+        )
+
+        with pytest.raises(WorkflowStepError):
+            asyncio.run(WorkflowRunner(store).run(workflow, "wf", PAYLOAD))
+
+        assert log.events == ["slow", "undo-slow"]
+        assert store.load("wf") == {}
+
+    def test_store_error_fails_step_and_compensates(self, tmp_path: Path, log: Log) -> None:
+        workflow = (
+            Workflow("checkout")
+            .step(
+                "slow",
+                lambda payload: SleepTask(payload, log, "slow"),
+                compensate=undo(log, "slow"),
+            )
+            .step(
+                "opaque",
+                lambda payload: OpaqueTask(payload),
+                compensate=undo(log, "opaque"),
+            )
+        )
+
+        with SQLiteWorkflowStore(tmp_path / "workflows.db") as store:
+            with pytest.raises(WorkflowStepError) as caught:
+                asyncio.run(WorkflowRunner(store).run(workflow, "wf", PAYLOAD))
+
+            assert caught.value.step == "opaque"
+            assert caught.value.compensated == ["slow", "opaque"]
+            assert log.events == ["slow", "undo-slow", "undo-opaque"]
+            assert store.load("wf") == {}
+
+    def test_inputs_error_fails_step(self, store: WorkflowStore, log: Log) -> None:
+        def broken_inputs(payload: dict[str, Any], outputs: Any) -> dict[str, Any]:
+            raise KeyError("missing")
+
+        workflow = (
+            Workflow("checkout")
+            .step("reserve", record(log, "reserve"), compensate=undo(log, "reserve"))
+            .step("charge", record(log, "charge"), after=("reserve",), inputs=broken_inputs)
+        )
+
+        with pytest.raises(WorkflowStepError) as caught:
+            asyncio.run(WorkflowRunner(store).run(workflow, "wf", PAYLOAD))
+
+        assert caught.value.step == "charge"
+        assert isinstance(caught.value.__cause__, KeyError)
+        assert log.events == ["reserve", "undo-reserve"]
+
+    def test_compensation_errors_are_reported(self, store: WorkflowStore, log: Log) -> None:
+        workflow = (
+            Workflow("checkout")
+            .step(
+                "reserve",
+                record(log, "reserve"),
+                compensate=lambda payload, _: FailingTask(payload),
+            )
+            .step("ship", lambda payload: FailingTask(payload), after=("reserve",))
+        )
+
+        with pytest.raises(WorkflowStepError) as caught:
+            asyncio.run(WorkflowRunner(store).run(workflow, "wf", PAYLOAD))
+
+        assert caught.value.compensated == []
+        assert isinstance(caught.value.compensation_errors["reserve"], ValueError)
+        assert set(store.load("wf")) == {"reserve"}
+
+    def test_invalid_concurrency_is_rejected(self, store: WorkflowStore) -> None:
+        with pytest.raises(ValueError):
+            WorkflowRunner(store, max_concurrency=0)
+
+    def test_cancellation_cancels_running_steps(self, store: WorkflowStore, log: Log) -> None:
+        workflow = Workflow("checkout").step(
+            "slow", lambda payload: SleepTask(payload, log, "slow")
+        )
+
+        async def scenario() -> None:
+            run = asyncio.ensure_future(WorkflowRunner(store).run(workflow, "wf", PAYLOAD))
+            while not log.active:
+                await asyncio.sleep(0)
+            run.cancel()
+            await run
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(scenario())
+        assert log.events == []
+        assert store.load("wf") == {}
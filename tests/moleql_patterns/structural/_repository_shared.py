@@ -0,0 +1,50 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from datetime import UTC, datetime
+
+from moleql_patterns.structural import Entity, VersionedEntity
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+# =========================================================
+# CLASS NOTE
+# =========================================================
+class Note(Entity[int]):
+    title: str
+    tags: list[str] = []
+
+
+# =========================================================
+# CLASS ACCOUNT
+# =========================================================
+class Account(VersionedEntity[str]):
+    balance: int
+
+
+def make_note(note_id: int, title: str = "note") -> Note:
+    return Note(id=note_id, title=title, created_at=NOW, updated_at=NOW)
+
+
+def make_account(account_id: str, balance: int = 0) -> Account:
+    return Account(id=account_id, balance=balance, created_at=NOW, updated_at=NOW)
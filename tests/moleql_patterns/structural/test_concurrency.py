@@ -0,0 +1,126 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from moleql_patterns.commands import APIOperation
+from moleql_patterns.structural import (
+    ConcurrencyConflictError,
+    InMemoryEntityRepository,
+    retry_on_conflict,
+)
+
+from ._repository_shared import Account, make_account
+
+
+# =========================================================
+# CLASS BALANCE
+# =========================================================
+class Balance(BaseModel):
+    balance: int
+
+
+# =========================================================
+# CLASS DEPOSIT
+# =========================================================
+class Deposit(APIOperation[Balance]):
+    def __init__(self, accounts: InMemoryEntityRepository[str, Account], amount: int) -> None:
+        self._accounts = accounts
+        self._amount = amount
+        self.attempts = 0
+
+    def verify_access(self) -> None:
+        pass
+
+    @retry_on_conflict(max_attempts=3, base_delay=0.0)
+    def _execute(self) -> Balance:
+        self.attempts += 1
+        account = self._accounts.get("a")
+        if self.attempts == 1:
+            self._accounts.update(self._accounts.get("a"))
+        account.balance += self._amount
+        self._accounts.update(account)
+        return Balance(balance=account.balance)
+
+
+# =========================================================
+# CLASS TEST RETRY ON CONFLICT
+# =========================================================
+class TestRetryOnConflict:
+    def test_reapplies_operation_on_fresh_data(self) -> None:
+        accounts = InMemoryEntityRepository[str, Account]()
+        accounts.add(make_account("a", balance=10))
+        operation = Deposit(accounts, 5)
+
+        result = operation.execute()
+
+        assert result == Balance(balance=15)
+        assert operation.attempts == 2
+        assert accounts.get("a").version == 2
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        calls = []
+
+        @retry_on_conflict(max_attempts=2, base_delay=0.0)
+        def always_conflicts() -> None:
+            calls.append(1)
+            raise ConcurrencyConflictError("conflict", ["a"])
+
+        with pytest.raises(ConcurrencyConflictError):
+            always_conflicts()
+        assert len(calls) == 2
+
+    def test_other_errors_are_not_retried(self) -> None:
+        calls = []
+
+        @retry_on_conflict(base_delay=0.0)
+        def fails() -> None:
+            calls.append(1)
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            fails()
+        assert len(calls) == 1
+
+    def test_async_function(self) -> None:
+        calls = []
+
+        @retry_on_conflict(base_delay=0.0)
+        async def flaky(value: int) -> int:
+            calls.append(value)
+            if len(calls) < 2:
+                raise ConcurrencyConflictError("conflict")
+            return value
+
+        assert asyncio.run(flaky(3)) == 3
+        assert calls == [3, 3]
+
+    def test_preserves_function_metadata(self) -> None:
+        @retry_on_conflict()
+        def documented() -> None:
+            """Docstring."""
+
+        assert documented.__name__ == "documented"
+        assert documented.__doc__ == "Docstring."
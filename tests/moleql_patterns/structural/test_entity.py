@@ -24,8 +24,9 @@ from datetime import UTC, datetime
 from typing import Any
 
 import pytest
+from pydantic import BaseModel, PrivateAttr
 
-from moleql_patterns.structural import Entity
+from moleql_patterns.structural import Entity, VersionedEntity
 
 
 # =========================================================
@@ -49,6 +50,71 @@ class DerivedEntity(BaseEntity):
     pass
 
 
+# =========================================================
+# CLASS AUDITED ENTITY
+# =========================================================
+class AuditedEntity[IdT](Entity[IdT]):
+    audited_by: str = "system"
+
+
+# =========================================================
+# CLASS INVOICE ENTITY
+# =========================================================
+class InvoiceEntity(AuditedEntity[int]):
+    pass
+
+
+# =========================================================
+# CLASS ACCOUNT ENTITY
+# =========================================================
+class AccountEntity(VersionedEntity[str]):
+    pass
+
+
+# =========================================================
+# CLASS NOTE ENTITY
+# =========================================================
+class NoteEntity(Entity[int]):
+    title: str
+    tags: list[str] = []
+
+
+# =========================================================
+# CLASS UNTRACKED NOTE ENTITY
+# =========================================================
+class UntrackedNoteEntity(NoteEntity):
+    track_changes = False
+
+
+# =========================================================
+# CLASS RETRACKED NOTE ENTITY
+# =========================================================
+class RetrackedNoteEntity(UntrackedNoteEntity):
+    track_changes = True
+
+
+# =========================================================
+# CLASS CACHING NOTE ENTITY
+# =========================================================
+class CachingNoteEntity(NoteEntity):
+    _rendered: str | None = PrivateAttr(default=None)
+
+
+# =========================================================
+# CLASS CUSTOM SETATTR ENTITY
+# =========================================================
+class CustomSetattrEntity(NoteEntity):
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value.upper() if name == "title" else value)
+
+
+def make_note(cls: type[NoteEntity] = NoteEntity) -> NoteEntity:
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    note = cls(id=1, title="draft", created_at=now, updated_at=now)
+    note.mark_clean()
+    return note
+
+
 # =========================================================
 # CLASS TEST ENTITY INIT SUBCLASS
 # =========================================================
@@ -75,3 +141,153 @@ class TestEntityInitSubclass:
 
     def test_inherits_id_type_from_base(self) -> None:
         assert DerivedEntity.__entity_id_type__ is str
+
+    def test_allows_generic_intermediate_base(self) -> None:
+        assert InvoiceEntity.__entity_id_type__ is int
+
+    def test_generic_intermediate_still_requires_concrete_subclass_id(self) -> None:
+        with pytest.raises(TypeError):
+            type("BadAudited", (AuditedEntity,), {})
+
+
+# =========================================================
+# CLASS TEST VERSIONED ENTITY
+# =========================================================
+class TestVersionedEntity:
+    def test_version_defaults_to_zero(self) -> None:
+        now = datetime.now(UTC)
+
+        account = AccountEntity(id="a-1", created_at=now, updated_at=now)
+
+        assert account.version == 0
+        assert AccountEntity.__entity_id_type__ is str
+
+    def test_version_must_not_be_negative(self) -> None:
+        now = datetime.now(UTC)
+
+        with pytest.raises(ValueError):
+            AccountEntity(id="a-1", created_at=now, updated_at=now, version=-1)
+
+
+# =========================================================
+# CLASS TEST ENTITY CHANGE TRACKING
+# =========================================================
+class TestEntityChangeTracking:
+    def test_fresh_entity_reports_all_fields(self) -> None:
+        now = datetime.now(UTC)
+
+        note = NoteEntity(id=1, title="draft", created_at=now, updated_at=now)
+
+        assert note.changed_fields() == {"id", "title", "tags", "created_at", "updated_at"}
+
+    def test_clean_entity_reports_nothing(self) -> None:
+        assert make_note().changed_fields() == set()
+
+    def test_assignment_is_tracked(self) -> None:
+        note = make_note()
+
+        note.title = "final"
+
+        assert note.changed_fields() == {"title"}
+
+    def test_assigning_equal_value_is_not_a_change(self) -> None:
+        note = make_note()
+
+        note.title = "draft"
+
+        assert note.changed_fields() == set()
+
+    def test_fresh_entity_assignment_keeps_all_fields(self) -> None:
+        now = datetime.now(UTC)
+        note = NoteEntity(id=1, title="draft", created_at=now, updated_at=now)
+
+        note.title = "final"
+
+        assert "id" in note.changed_fields()
+
+    def test_mark_clean_resets(self) -> None:
+        note = make_note()
+        note.title = "final"
+
+        note.mark_clean()
+
+        assert note.changed_fields() == set()
+
+    def test_tracking_does_not_affect_equality(self) -> None:
+        note = make_note()
+        note.title = "final"
+        other = make_note()
+        other.title = "final"
+        other.mark_clean()
+
+        assert note == other
+
+    def test_non_field_attributes_pass_through(self) -> None:
+        note = make_note()
+
+        with pytest.raises(ValueError):
+            note.unknown = 1
+
+    def test_private_attributes_are_not_tracked(self) -> None:
+        note = make_note(CachingNoteEntity)
+
+        note._rendered = "<p>draft</p>"
+
+        assert note._rendered == "<p>draft</p>"
+        assert note.changed_fields() == set()
+
+    def test_untracked_class_uses_plain_setattr(self) -> None:
+        note = make_note(UntrackedNoteEntity)
+        note.title = "final"
+
+        assert UntrackedNoteEntity.__setattr__ is BaseModel.__setattr__
+        assert note.changed_fields() == set(NoteEntity.model_fields)
+
+    def test_tracking_can_be_enabled_again(self) -> None:
+        note = make_note(RetrackedNoteEntity)
+
+        note.title = "final"
+
+        assert note.changed_fields() == {"title"}
+
+    def test_custom_setattr_is_kept(self) -> None:
+        note = make_note(CustomSetattrEntity)
+
+        note.title = "final"
+
+        assert note.title == "FINAL"
+        assert note.changed_fields() == {"title"}
+
+
+# =========================================================
+# CLASS TEST ENTITY TOUCH
+# =========================================================
+class TestEntityTouch:
+    def test_touch_without_changes_keeps_updated_at(self) -> None:
+        note = make_note()
+
+        assert not note.touch()
+        assert note.updated_at == datetime(2026, 1, 1, tzinfo=UTC)
+
+    def test_touch_after_change_sets_updated_at(self) -> None:
+        note = make_note()
+        note.title = "final"
+        later = datetime(2026, 2, 1, tzinfo=UTC)
+
+        assert note.touch(later)
+        assert note.updated_at == later
+        assert note.changed_fields() == {"title", "updated_at"}
+
+    def test_touch_defaults_to_now(self) -> None:
+        note = make_note()
+        note.title = "final"
+
+        note.touch()
+
+        assert note.updated_at > datetime(2026, 1, 1, tzinfo=UTC)
+
+    def test_updated_at_alone_is_not_a_change(self) -> None:
+        note = make_note()
+        note.updated_at = datetime(2026, 3, 1, tzinfo=UTC)
+
+        assert not note.touch()
@@ -0,0 +1,209 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from moleql_patterns.structural import ConcurrencyConflictError, InMemoryEntityRepository
+
+from ._repository_shared import NOW, Account, Note, make_account, make_note
+
+
+@pytest.fixture
+def notes() -> InMemoryEntityRepository[int, Note]:
+    return InMemoryEntityRepository[int, Note]()
+
+
+@pytest.fixture
+def accounts() -> InMemoryEntityRepository[str, Account]:
+    repo = InMemoryEntityRepository[str, Account]()
+    repo.add_many([make_account("a"), make_account("b")])
+    return repo
+
+
+# =========================================================
+# CLASS TEST IN MEMORY REPOSITORY
+# =========================================================
+class TestInMemoryRepository:
+    def test_add_and_get(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        note = make_note(1)
+
+        notes.add(note)
+
+        assert notes.get(1) == note
+        assert len(notes) == 1
+
+    def test_entities_are_copied(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        note = make_note(1)
+        notes.add(note)
+
+        note.tags.append("changed")
+        loaded = notes.get(1)
+        loaded.title = "changed"
+
+        assert notes.get(1) == make_note(1)
+
+    def test_get_missing(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        assert notes.get(1) is None
+
+    def test_add_duplicate_fails(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        notes.add(make_note(1))
+
+        with pytest.raises(ValueError):
+            notes.add(make_note(1))
+
+    def test_add_many_is_atomic(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        notes.add(make_note(2))
+
+        with pytest.raises(ValueError):
+            notes.add_many([make_note(1), make_note(2)])
+
+        assert notes.get(1) is None
+
+    def test_add_many_rejects_repeated_ids(
+        self, notes: InMemoryEntityRepository[int, Note]
+    ) -> None:
+        with pytest.raises(ValueError):
+            notes.add_many([make_note(1), make_note(1)])
+
+    def test_get_many(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        notes.add_many([make_note(1), make_note(2)])
+
+        assert notes.get_many([1, 3]) == {1: make_note(1)}
+
+    def test_list_with_query(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        notes.add_many([make_note(1, "a"), make_note(2, "b")])
+
+        assert notes.list() == [make_note(1, "a"), make_note(2, "b")]
+        assert notes.list(lambda note: note.title == "b") == [make_note(2, "b")]
+
+    def test_update(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        notes.add(make_note(1))
+
+        notes.update(make_note(1, "new"))
+
+        assert notes.get(1).title == "new"
+
+    def test_update_missing_fails(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        with pytest.raises(LookupError):
+            notes.update(make_note(1))
+
+    def test_remove(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        notes.add(make_note(1))
+
+        notes.remove(make_note(1))
+
+        assert notes.get(1) is None
+
+
+# =========================================================
+# CLASS TEST IN MEMORY REPOSITORY OPTIMISTIC CONCURRENCY
+# =========================================================
+class TestInMemoryRepositoryOptimisticConcurrency:
+    def test_update_increments_version(
+        self, accounts: InMemoryEntityRepository[str, Account]
+    ) -> None:
+        account = accounts.get("a")
+        account.balance = 10
+
+        accounts.update(account)
+
+        assert account.version == 1
+        assert accounts.get("a").version == 1
+
+    def test_stale_update_conflicts(self, accounts: InMemoryEntityRepository[str, Account]) -> None:
+        first = accounts.get("a")
+        second = accounts.get("a")
+        accounts.update(first)
+
+        with pytest.raises(ConcurrencyConflictError) as info:
+            accounts.update(second)
+
+        assert info.value.entity_ids == ("a",)
+        assert second.version == 0
+
+    def test_update_many_checks_all_versions_first(
+        self, accounts: InMemoryEntityRepository[str, Account]
+    ) -> None:
+        fresh = accounts.get("a")
+        stale = accounts.get("b")
+        accounts.update(accounts.get("b"))
+        fresh.balance = 99
+
+        with pytest.raises(ConcurrencyConflictError) as info:
+            accounts.update_many([fresh, stale])
+
+        assert info.value.entity_ids == ("b",)
+        assert accounts.get("a").balance == 0
+        assert fresh.version == 0
+
+    def test_update_many_applies_batch(
+        self, accounts: InMemoryEntityRepository[str, Account]
+    ) -> None:
+        batch = list(accounts.get_many(["a", "b"]).values())
+        for account in batch:
+            account.balance = 5
+
+        accounts.update_many(batch)
+
+        assert [account.version for account in accounts.list()] == [1, 1]
+
+    def test_stale_remove_conflicts(self, accounts: InMemoryEntityRepository[str, Account]) -> None:
+        stale = accounts.get("a")
+        accounts.update(accounts.get("a"))
+
+        with pytest.raises(ConcurrencyConflictError):
+            accounts.remove(stale)
+
+
+# =========================================================
+# CLASS TEST IN MEMORY REPOSITORY CHANGE TRACKING
+# =========================================================
+class TestInMemoryRepositoryChangeTracking:
+    def test_loaded_entities_are_clean(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        notes.add(make_note(1))
+
+        assert notes.get(1).changed_fields() == set()
+        assert notes.list()[0].changed_fields() == set()
+        assert notes.get_many([1])[1].changed_fields() == set()
+
+    def test_added_entity_is_marked_clean(self, notes: InMemoryEntityRepository[int, Note]) -> None:
+        note = make_note(1)
+
+        notes.add(note)
+
+        assert note.changed_fields() == set()
+
+    def test_update_bumps_updated_at_only_on_change(
+        self, notes: InMemoryEntityRepository[int, Note]
+    ) -> None:
+        notes.add(make_note(1))
+        unchanged = notes.get(1)
+        changed = notes.get(1)
+        changed.title = "new"
+
+        notes.update(unchanged)
+        notes.update(changed)
+
+        assert unchanged.updated_at == NOW
+        assert changed.updated_at > NOW
+        assert notes.get(1).updated_at == changed.updated_at
+        assert changed.changed_fields() == set()
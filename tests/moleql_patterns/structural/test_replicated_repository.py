@@ -0,0 +1,318 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+from collections.abc import Sequence
+
+import pytest
+
+from moleql_patterns.structural import (
+    InMemoryEntityRepository,
+    Replica,
+    ReplicatedEntityRepository,
+    read_your_writes,
+)
+from moleql_patterns.structural.in_memory_repository import EntityPredicate
+
+from ._repository_shared import Note, make_note
+
+type NoteReplicas = ReplicatedEntityRepository[int, Note, EntityPredicate[Note] | None]
+
+
+# =========================================================
+# CLASS COUNTING NOTES
+# =========================================================
+class CountingNotes(InMemoryEntityRepository[int, Note]):
+    """In-memory repository that counts reads."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def get(self, entity_id: int) -> Note | None:
+        self.reads += 1
+        return super().get(entity_id)
+
+    def get_many(self, entity_ids: object) -> dict[int, Note]:
+        self.reads += 1
+        return super().get_many(entity_ids)  # type: ignore[arg-type]
+
+    def list(self, query: EntityPredicate[Note] | None = None) -> Sequence[Note]:
+        self.reads += 1
+        return super().list(query)
+
+
+# =========================================================
+# CLASS LAG
+# =========================================================
+class Lag:
+    """Settable replication lag for tests."""
+
+    def __init__(self, seconds: float = 0.0) -> None:
+        self.seconds = seconds
+        self.checks = 0
+
+    def __call__(self) -> float:
+        self.checks += 1
+        if self.seconds < 0:
+            raise ConnectionError("replica unreachable")
+        return self.seconds
+
+
+@pytest.fixture
+def primary() -> CountingNotes:
+    return CountingNotes()
+
+
+@pytest.fixture
+def replicas() -> list[CountingNotes]:
+    return [CountingNotes(), CountingNotes()]
+
+
+@pytest.fixture
+def notes(primary: CountingNotes, replicas: list[CountingNotes]) -> NoteReplicas:
+    return ReplicatedEntityRepository(primary, replicas)
+
+
+def replicate(primary: CountingNotes, replicas: list[CountingNotes]) -> None:
+    for replica in replicas:
+        replica.add_many(note for note in primary.list() if replica.get(note.id) is None)
+        replica.reads = 0
+    primary.reads = 0
+
+
+# =========================================================
+# CLASS TEST REPLICATED REPOSITORY
+# =========================================================
+class TestReplicatedRepository:
+    def test_writes_go_to_primary(
+        self, notes: NoteReplicas, primary: CountingNotes, replicas: list[CountingNotes]
+    ) -> None:
+        notes.add(make_note(1))
+        notes.add_many([make_note(2), make_note(3)])
+        note = primary.get(1)
+        note.title = "changed"
+        notes.update(note)
+        notes.update_many([primary.get(2)])
+        notes.remove(make_note(3))
+
+        assert notes.primary is primary
+        assert [entry.title for entry in primary.list()] == ["changed", "note"]
+        assert all(len(replica) == 0 for replica in replicas)
+
+    def test_reads_go_to_replicas(
+        self, notes: NoteReplicas, primary: CountingNotes, replicas: list[CountingNotes]
+    ) -> None:
+        notes.add(make_note(1))
+        replicate(primary, replicas)
+
+        assert notes.get(1) == make_note(1)
+        assert notes.get_many([1, 2]) == {1: make_note(1)}
+        assert len(notes.list()) == 1
+        assert primary.reads == 0
+        assert sum(replica.reads for replica in replicas) == 3
+
+    def test_reads_spread_across_idle_replicas(
+        self, notes: NoteReplicas, replicas: list[CountingNotes]
+    ) -> None:
+        for _ in range(10):
+            notes.get(1)
+
+        assert [replica.reads for replica in replicas] == [5, 5]
+        assert notes.outstanding() == (0, 0)
+
+    def test_without_replicas_reads_primary(self, primary: CountingNotes) -> None:
+        notes = ReplicatedEntityRepository(primary, [])
+        notes.add(make_note(1))
+
+        assert notes.get(1) == make_note(1)
+
+    @pytest.mark.parametrize("kwargs", [{"max_staleness": -1}, {"lag_ttl": -1}])
+    def test_negative_settings_fail(self, primary: CountingNotes, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            ReplicatedEntityRepository(primary, [], **kwargs)
+
+
+# =========================================================
+# CLASS TEST READ YOUR WRITES
+# =========================================================
+class TestReadYourWrites:
+    def test_written_ids_read_from_primary(
+        self, notes: NoteReplicas, primary: CountingNotes
+    ) -> None:
+        with read_your_writes():
+            notes.add(make_note(1))
+
+            assert notes.get(1) == make_note(1)
+            assert notes.get_many([1, 2]) == {1: make_note(1)}
+            assert [note.id for note in notes.list()] == [1]
+
+        assert notes.get(1) is None
+
+    def test_scope_is_per_repository(self, primary: CountingNotes) -> None:
+        replica = CountingNotes()
+        first = ReplicatedEntityRepository(primary, [replica])
+        second = ReplicatedEntityRepository(primary, [replica])
+
+        with read_your_writes():
+            first.add(make_note(1))
+
+            assert second.get(1) is None
+            assert second.list() == []
+
+    def test_scopes_are_isolated_between_threads(self, notes: NoteReplicas) -> None:
+        seen: list[Note | None] = []
+
+        def other_request() -> None:
+            with read_your_writes():
+                seen.append(notes.get(1))
+
+        with read_your_writes():
+            notes.add(make_note(1))
+            thread = threading.Thread(target=other_request)
+            thread.start()
+            thread.join()
+
+        assert seen == [None]
+
+
+# =========================================================
+# CLASS TEST REPLICA SELECTION
+# =========================================================
+class TestReplicaSelection:
+    def test_stale_replicas_are_skipped(
+        self, primary: CountingNotes, replicas: list[CountingNotes]
+    ) -> None:
+        lags = [Lag(5.0), Lag(0.5)]
+        notes = ReplicatedEntityRepository(
+            primary,
+            [Replica(replica, lag) for replica, lag in zip(replicas, lags, strict=True)],
+            max_staleness=1.0,
+        )
+
+        for _ in range(4):
+            notes.get(1)
+
+        assert [replica.reads for replica in replicas] == [0, 4]
+
+    def test_falls_back_to_primary(
+        self, primary: CountingNotes, replicas: list[CountingNotes]
+    ) -> None:
+        notes = ReplicatedEntityRepository(
+            primary,
+            [Replica(replicas[0], Lag(5.0)), Replica(replicas[1], Lag(-1))],
+            max_staleness=1.0,
+        )
+
+        notes.get(1)
+
+        assert primary.reads == 1
+        assert [replica.reads for replica in replicas] == [0, 0]
+
+    def test_least_outstanding_replica_is_picked(
+        self, primary: CountingNotes, replicas: list[CountingNotes]
+    ) -> None:
+        busy = threading.Event()
+        release = threading.Event()
+
+        # =========================================================
+        # CLASS SLOW NOTES
+        # =========================================================
+        class SlowNotes(CountingNotes):
+            def get(self, entity_id: int) -> Note | None:
+                busy.set()
+                release.wait(5)
+                return super().get(entity_id)
+
+        slow = SlowNotes()
+        notes = ReplicatedEntityRepository(primary, [slow, replicas[0]])
+        thread = threading.Thread(target=notes.get, args=(1,))
+        thread.start()
+        busy.wait(5)
+
+        for _ in range(3):
+            notes.get(1)
+        outstanding = notes.outstanding()
+        release.set()
+        thread.join()
+
+        assert outstanding == (1, 0)
+        assert slow.reads == 1
+        assert replicas[0].reads == 3
+
+    def test_lag_is_cached_per_replica(
+        self, primary: CountingNotes, replicas: list[CountingNotes]
+    ) -> None:
+        now = [0.0]
+        lags = [Lag(0.5), Lag(-1)]
+        notes = ReplicatedEntityRepository(
+            primary,
+            [Replica(replica, lag) for replica, lag in zip(replicas, lags, strict=True)],
+            max_staleness=1.0,
+            lag_ttl=2.0,
+            clock=lambda: now[0],
+        )
+
+        for _ in range(3):
+            notes.get(1)
+        lags[0].seconds = 5.0
+        notes.get(1)
+        now[0] = 2.0
+        notes.get(1)
+
+        assert [lag.checks for lag in lags] == [2, 2]
+        assert [replica.reads for replica in replicas] == [4, 0]
+        assert primary.reads == 1
+
+    def test_zero_ttl_checks_lag_on_every_read(
+        self, primary: CountingNotes, replicas: list[CountingNotes]
+    ) -> None:
+        lag = Lag(0.5)
+        notes = ReplicatedEntityRepository(
+            primary, [Replica(replicas[0], lag)], max_staleness=1.0, lag_ttl=0.0
+        )
+
+        for _ in range(3):
+            notes.get(1)
+
+        assert lag.checks == 3
+
+    def test_cached_lag_ages_with_the_clock(
+        self, primary: CountingNotes, replicas: list[CountingNotes]
+    ) -> None:
+        now = [0.0]
+        lag = Lag(1.9)
+        notes = ReplicatedEntityRepository(
+            primary,
+            [Replica(replicas[0], lag)],
+            max_staleness=2.0,
+            lag_ttl=1.0,
+            clock=lambda: now[0],
+        )
+
+        notes.get(1)
+        now[0] = 0.5
+        notes.get(1)
+
+        assert lag.checks == 1
+        assert replicas[0].reads == 1
+        assert primary.reads == 1
@@ -166,3 +166,37 @@ class TestEntityRepositoryRemove:
         repo.remove(entity)
 
         assert repo.get(1) is None
+
+
+# =========================================================
+# CLASS TEST ENTITY REPOSITORY BULK DEFAULTS
+# =========================================================
+class TestEntityRepositoryBulkDefaults:
+    def test_add_many_adds_each_entity(self) -> None:
+        repo = NoteRepository()
+        now = datetime.now(UTC)
+        notes = [NoteEntity(id=i, title="note", created_at=now, updated_at=now) for i in (1, 2)]
+
+        repo.add_many(notes)
+
+        assert repo.list() == notes
+
+    def test_get_many_skips_missing_ids(self) -> None:
+        repo = NoteRepository()
+        now = datetime.now(UTC)
+        entity = NoteEntity(id=1, title="note", created_at=now, updated_at=now)
+        repo.add(entity)
+
+        found = repo.get_many([1, 2])
+
+        assert found == {1: entity}
+
+    def test_update_many_updates_each_entity(self) -> None:
+        repo = NoteRepository()
+        now = datetime.now(UTC)
+        repo.add_many(NoteEntity(id=i, title="old", created_at=now, updated_at=now) for i in (1, 2))
+        updated = [NoteEntity(id=i, title="new", created_at=now, updated_at=now) for i in (1, 2)]
+
+        repo.update_many(updated)
+
+        assert [note.title for note in repo.list()] == ["new", "new"]
@@ -0,0 +1,341 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+from collections.abc import Sequence
+from operator import attrgetter
+
+import pytest
+
+from moleql_patterns.structural import (
+    ConsistentHashPartitioner,
+    InMemoryEntityRepository,
+    Partitioner,
+    RangePartitioner,
+    ShardedEntityRepository,
+)
+from moleql_patterns.structural.in_memory_repository import EntityPredicate
+
+from ._repository_shared import Note, make_note
+
+type NoteShards = ShardedEntityRepository[int, Note, EntityPredicate[Note] | None]
+
+
+# =========================================================
+# CLASS SORTED NOTES
+# =========================================================
+class SortedNotes(InMemoryEntityRepository[int, Note]):
+    """In-memory shard that returns ``list`` results sorted by id."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.list_threads: set[str] = set()
+
+    def list(self, query: EntityPredicate[Note] | None = None) -> Sequence[Note]:
+        self.list_threads.add(threading.current_thread().name)
+        return sorted(super().list(query), key=attrgetter("id"))
+
+
+def make_shards(*names: str) -> dict[str, SortedNotes]:
+    return {name: SortedNotes() for name in names}
+
+
+@pytest.fixture
+def shards() -> dict[str, SortedNotes]:
+    return make_shards("a", "b", "c")
+
+
+@pytest.fixture
+def notes(shards: dict[str, SortedNotes]) -> NoteShards:
+    partitioner = ConsistentHashPartitioner[int](shards)
+    with ShardedEntityRepository(shards, partitioner, sort_key=attrgetter("id")) as repo:
+        yield repo
+
+
+# =========================================================
+# CLASS TEST PARTITIONERS
+# =========================================================
+class TestPartitioners:
+    def test_base_class_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            Partitioner()
+
+    @pytest.mark.parametrize(("method", "args"), [("shard_for", (1,))])
+    def test_base_methods_raise(self, method: str, args: tuple[object, ...]) -> None:
+        with pytest.raises(NotImplementedError):
+            getattr(Partitioner, method)(object(), *args)
+
+    def test_base_shard_names_raises(self) -> None:
+        with pytest.raises(NotImplementedError):
+            Partitioner.shard_names.fget(object())
+
+    def test_consistent_hash_is_stable_and_spread(self) -> None:
+        partitioner = ConsistentHashPartitioner[int](["a", "b", "c"])
+
+        owners = [partitioner.shard_for(i) for i in range(3000)]
+
+        assert owners == [
+            ConsistentHashPartitioner[int](["a", "b", "c"]).shard_for(i) for i in range(3000)
+        ]
+        assert {name: owners.count(name) > 600 for name in "abc"} == dict.fromkeys("abc", True)
+
+    def test_adding_a_shard_moves_few_ids(self) -> None:
+        before = ConsistentHashPartitioner[int](["a", "b", "c"])
+        after = before.with_shard("d")
+
+        moved = [i for i in range(4000) if before.shard_for(i) != after.shard_for(i)]
+
+        assert after.shard_names == ("a", "b", "c", "d")
+        assert {after.shard_for(i) for i in moved} == {"d"}
+        assert len(moved) < 1500
+
+    def test_without_shard(self) -> None:
+        partitioner = ConsistentHashPartitioner[int](["a", "b"]).without_shard("a")
+
+        assert {partitioner.shard_for(i) for i in range(100)} == {"b"}
+        with pytest.raises(KeyError):
+            partitioner.without_shard("a")
+
+    @pytest.mark.parametrize("kwargs", [{"shards": []}, {"shards": ["a"], "virtual_nodes": 0}])
+    def test_invalid_hash_ring(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            ConsistentHashPartitioner[int](**kwargs)
+
+    def test_range_partitioner(self) -> None:
+        partitioner = RangePartitioner[int]([100, 200], ["low", "mid", "high"])
+
+        assert [partitioner.shard_for(i) for i in (0, 99, 100, 199, 200, 10**6)] == [
+            "low",
+            "low",
+            "mid",
+            "mid",
+            "high",
+            "high",
+        ]
+        assert partitioner.shard_names == ("low", "mid", "high")
+
+    @pytest.mark.parametrize(
+        ("bounds", "shard_names"), [([100], ["a"]), ([200, 100], ["a", "b", "c"])]
+    )
+    def test_invalid_ranges(self, bounds: list[int], shard_names: list[str]) -> None:
+        with pytest.raises(ValueError):
+            RangePartitioner[int](bounds, shard_names)
+
+
+# =========================================================
+# CLASS TEST SHARDED REPOSITORY
+# =========================================================
+class TestShardedRepository:
+    def test_routes_by_id(self, notes: NoteShards, shards: dict[str, SortedNotes]) -> None:
+        notes.add_many(make_note(i) for i in range(30))
+        notes.add(make_note(30))
+
+        assert sum(len(shard) for shard in shards.values()) == 31
+        assert all(len(shard) > 0 for shard in shards.values())
+        assert notes.shard_for(7).get(7) == make_note(7)
+        assert notes.get(30) == make_note(30)
+        assert notes.get(99) is None
+
+    def test_get_many_groups_per_shard(self, notes: NoteShards) -> None:
+        notes.add_many(make_note(i) for i in range(30))
+
+        found = notes.get_many([1, 2, 3, 29, 99])
+
+        assert sorted(found) == [1, 2, 3, 29]
+        assert notes.get_many([]) == {}
+
+    def test_list_merges_sorted_shards_in_parallel(
+        self, notes: NoteShards, shards: dict[str, SortedNotes]
+    ) -> None:
+        notes.add_many(make_note(i) for i in range(50))
+
+        everything = notes.list()
+        even = notes.list(lambda note: note.id % 2 == 0)
+
+        assert [note.id for note in everything] == list(range(50))
+        assert [note.id for note in even] == list(range(0, 50, 2))
+        threads = set().union(*(shard.list_threads for shard in shards.values()))
+        assert all(name.startswith("shard") for name in threads)
+
+    def test_list_without_sort_key_concatenates(self, shards: dict[str, SortedNotes]) -> None:
+        partitioner = RangePartitioner[int]([10, 20], ["a", "b", "c"])
+        with ShardedEntityRepository(shards, partitioner) as repo:
+            repo.add_many(make_note(i) for i in (25, 5, 15))
+
+            assert [note.id for note in repo.list()] == [5, 15, 25]
+
+    def test_update_and_remove(self, notes: NoteShards) -> None:
+        notes.add_many(make_note(i) for i in range(5))
+        first, second = notes.get(1), notes.get(2)
+        first.title, second.title = "one", "two"
+
+        notes.update_many([first, second])
+        third = notes.get(3)
+        third.title = "three"
+        notes.update(third)
+        notes.remove(make_note(4))
+
+        assert [note.title for note in notes.list()] == ["note", "one", "two", "three"]
+
+    def test_unknown_shard_fails(self) -> None:
+        with pytest.raises(ValueError):
+            ShardedEntityRepository(make_shards("a"), ConsistentHashPartitioner[int](["a", "b"]))
+
+    def test_close_keeps_injected_executor(self, shards: dict[str, SortedNotes]) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(2) as executor:
+            partitioner = ConsistentHashPartitioner[int](shards)
+            repo = ShardedEntityRepository(shards, partitioner, executor=executor)
+            repo.add_many(make_note(i) for i in range(10))
+            repo.close()
+
+            assert len(repo.list()) == 10
+            assert executor.submit(int).result() == 0
+
+
+# =========================================================
+# CLASS TEST REBALANCE
+# =========================================================
+class TestRebalance:
+    def test_adding_a_shard_moves_only_its_ids(
+        self, notes: NoteShards, shards: dict[str, SortedNotes]
+    ) -> None:
+        notes.add_many(make_note(i) for i in range(300))
+        new_shards = {**shards, "d": SortedNotes()}
+
+        moved = notes.rebalance(notes.partitioner.with_shard("d"), new_shards)
+
+        assert moved == len(new_shards["d"])
+        assert 0 < moved < 150
+        assert sum(len(shard) for shard in new_shards.values()) == 300
+        assert [note.id for note in notes.list()] == list(range(300))
+        assert set(notes.shards) == {"a", "b", "c", "d"}
+
+    def test_draining_a_shard(self, notes: NoteShards, shards: dict[str, SortedNotes]) -> None:
+        notes.add_many(make_note(i) for i in range(100))
+        remaining = {name: shard for name, shard in shards.items() if name != "c"}
+
+        notes.rebalance(notes.partitioner.without_shard("c"), remaining)
+
+        assert len(shards["c"]) == 0
+        assert len(notes.get_many(range(100))) == 100
+
+    def test_switching_partitioner_kind(self, notes: NoteShards) -> None:
+        notes.add_many(make_note(i) for i in range(30))
+
+        notes.rebalance(RangePartitioner[int]([10, 20], ["a", "b", "c"]))
+
+        assert [note.id for note in notes.shards["a"].list()] == list(range(10))
+
+    def test_reads_fall_back_during_rebalance(self, shards: dict[str, SortedNotes]) -> None:
+        partitioner = RangePartitioner[int]([], ["a"])
+        seen: list[object] = []
+
+        # =========================================================
+        # CLASS OBSERVING SHARD
+        # =========================================================
+        class ObservingShard(SortedNotes):
+            def add_many(self, entities: object) -> None:
+                seen.append(repo.get(2))
+                seen.append(repo.get_many([1, 2, 99]))
+                seen.append(repo.get(99))
+                super().add_many(entities)  # type: ignore[arg-type]
+
+        target = ObservingShard()
+        repo = ShardedEntityRepository({"a": shards["a"], "b": target}, partitioner)
+        repo.add_many([make_note(1), make_note(2)])
+
+        repo.rebalance(RangePartitioner[int]([2], ["a", "b"]))
+
+        assert seen == [make_note(2), {1: make_note(1), 2: make_note(2)}, None]
+        assert [note.id for note in target.list()] == [2]
+
+    def test_list_during_rebalance_sees_each_entity_once(
+        self, shards: dict[str, SortedNotes]
+    ) -> None:
+        paused, release = threading.Event(), threading.Event()
+
+        # =========================================================
+        # CLASS PAUSING SHARD
+        # =========================================================
+        class PausingShard(SortedNotes):
+            def remove(self, entity: Note) -> None:
+                paused.set()
+                release.wait(5)
+                super().remove(entity)
+
+        source = PausingShard()
+        repo = ShardedEntityRepository(
+            {"a": source, "b": shards["b"]}, RangePartitioner[int]([], ["a"])
+        )
+        repo.add_many(make_note(i) for i in range(4))
+        mover = threading.Thread(target=repo.rebalance, args=(RangePartitioner([2], ["a", "b"]),))
+        listed: list[list[int]] = []
+        reader = threading.Thread(target=lambda: listed.append([n.id for n in repo.list()]))
+
+        mover.start()
+        assert paused.wait(5)
+        reader.start()
+        reader.join(0.05)
+        assert reader.is_alive()
+        release.set()
+        mover.join()
+        reader.join()
+
+        assert sorted(listed[0]) == [0, 1, 2, 3]
+
+    def test_list_during_rebalance_includes_dropped_shards(
+        self, shards: dict[str, SortedNotes]
+    ) -> None:
+        seen: list[Sequence[Note]] = []
+
+        # =========================================================
+        # CLASS DRAINING SHARD
+        # =========================================================
+        class DrainingShard(SortedNotes):
+            def list(self, query: EntityPredicate[Note] | None = None) -> Sequence[Note]:
+                if repo.partitioner is not partitioner and not seen:
+                    seen.append(())
+                    seen.append(repo.list())
+                return super().list(query)
+
+        partitioner = RangePartitioner[int]([10], ["a", "c"])
+        repo = ShardedEntityRepository({"a": shards["a"], "c": DrainingShard()}, partitioner)
+        repo.add_many(make_note(i) for i in range(20))
+
+        repo.rebalance(RangePartitioner[int]([], ["a"]), {"a": shards["a"]})
+
+        assert [note.id for note in seen[1]] == list(range(20))
+        assert len(repo.list()) == 20
+
+    def test_owned_executor_follows_the_shard_set(
+        self, notes: NoteShards, shards: dict[str, SortedNotes]
+    ) -> None:
+        notes.add_many(make_note(i) for i in range(30))
+        notes.list()
+        new_shards = {**shards, "d": SortedNotes(), "e": SortedNotes()}
+
+        notes.rebalance(ConsistentHashPartitioner[int](new_shards), new_shards)
+
+        assert [note.id for note in notes.list()] == list(range(30))
+        assert notes._executor._max_workers == 5
@@ -0,0 +1,425 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sqlite3
+import threading
+import uuid
+from datetime import timedelta
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from moleql_patterns.structural import (
+    ConcurrencyConflictError,
+    Entity,
+    SQLiteEntityRepository,
+    SQLiteQuery,
+    VersionedEntity,
+)
+
+from ._repository_shared import NOW, Account, Note, make_account, make_note
+
+
+# =========================================================
+# CLASS CONTACT
+# =========================================================
+class Contact(Entity[int]):
+    index_hints: ClassVar = ("email", ("city", "name"))
+
+    name: str
+    email: str | None = None
+    city: str = ""
+    score: float = 0.0
+    active: bool = True
+    metadata: dict[str, int] = {}
+    ref: int | str | None = None
+
+
+# =========================================================
+# CLASS DEVICE
+# =========================================================
+class Device(VersionedEntity[uuid.UUID]):
+    label: str
+
+
+# =========================================================
+# CLASS TOKEN
+# =========================================================
+class Token(Entity[uuid.UUID]):
+    scope: str
+
+
+def make_device(label: str) -> Device:
+    return Device(id=uuid.uuid4(), label=label, created_at=NOW, updated_at=NOW)
+
+
+def make_contact(contact_id: int, name: str, **kwargs: object) -> Contact:
+    return Contact(id=contact_id, name=name, created_at=NOW, updated_at=NOW, **kwargs)
+
+
+@pytest.fixture
+def notes(tmp_path: Path) -> SQLiteEntityRepository[int, Note]:
+    with SQLiteEntityRepository[int, Note](Note, tmp_path / "notes.db") as repo:
+        yield repo
+
+
+@pytest.fixture
+def accounts(tmp_path: Path) -> SQLiteEntityRepository[str, Account]:
+    with SQLiteEntityRepository[str, Account](Account, tmp_path / "accounts.db") as repo:
+        repo.add_many([make_account("a"), make_account("b")])
+        yield repo
+
+
+@pytest.fixture
+def devices(tmp_path: Path) -> SQLiteEntityRepository[uuid.UUID, Device]:
+    with SQLiteEntityRepository[uuid.UUID, Device](Device, tmp_path / "devices.db") as repo:
+        yield repo
+
+
+@pytest.fixture
+def contacts(tmp_path: Path) -> SQLiteEntityRepository[int, Contact]:
+    with SQLiteEntityRepository[int, Contact](Contact, tmp_path / "contacts.db") as repo:
+        repo.add_many(
+            [
+                make_contact(1, "ada", email="ada@example.com", city="london", score=3.5),
+                make_contact(2, "bob", city="paris", score=1.0, active=False),
+                make_contact(3, "cy", city="london", score=2.0, metadata={"a": 1}, ref="x"),
+            ]
+        )
+        yield repo
+
+
+# =========================================================
+# CLASS TEST SQLITE REPOSITORY
+# =========================================================
+class TestSQLiteRepository:
+    def test_add_and_get(self, notes: SQLiteEntityRepository[int, Note]) -> None:
+        note = make_note(1)
+        note.tags.append("x")
+
+        notes.add(note)
+
+        assert notes.get(1) == note
+        assert notes.get(1).changed_fields() == frozenset()
+        assert note.changed_fields() == frozenset()
+
+    def test_get_missing(self, notes: SQLiteEntityRepository[int, Note]) -> None:
+        assert notes.get(1) is None
+
+    def test_add_many_is_atomic(self, notes: SQLiteEntityRepository[int, Note]) -> None:
+        notes.add(make_note(2))
+
+        with pytest.raises(ValueError):
+            notes.add_many([make_note(1), make_note(2)])
+
+        assert notes.get(1) is None
+
+    def test_get_many(self, notes: SQLiteEntityRepository[int, Note]) -> None:
+        notes.add_many(make_note(i) for i in range(1200))
+
+        found = notes.get_many([5, 1100, 5, 9999])
+
+        assert sorted(found) == [5, 1100]
+        assert found[5] == make_note(5)
+        assert len(notes.get_many(range(1200))) == 1200
+
+    def test_update_writes_changed_fields(self, notes: SQLiteEntityRepository[int, Note]) -> None:
+        notes.add(make_note(1))
+        loaded = notes.get(1)
+        other = notes.get(1)
+
+        loaded.title = "changed"
+        notes.update(loaded)
+        other.tags = ["kept"]
+        notes.update(other)
+
+        stored = notes.get(1)
+        assert stored.title == "changed"
+        assert stored.tags == ["kept"]
+        assert stored.updated_at > NOW
+
+    def test_update_without_changes_is_skipped(
+        self, notes: SQLiteEntityRepository[int, Note]
+    ) -> None:
+        notes.add(make_note(1))
+        loaded = notes.get(1)
+
+        notes.update(loaded)
+
+        assert notes.get(1).updated_at == NOW
+
+    def test_update_keeps_an_explicit_updated_at(
+        self, notes: SQLiteEntityRepository[int, Note]
+    ) -> None:
+        notes.add(make_note(1))
+        loaded = notes.get(1)
+        later = NOW + timedelta(days=1)
+        loaded.updated_at = later
+
+        notes.update(loaded)
+
+        assert notes.get(1).updated_at == later
+        assert loaded.updated_at == later
+
+    def test_update_missing(self, notes: SQLiteEntityRepository[int, Note]) -> None:
+        with pytest.raises(LookupError):
+            notes.update(make_note(1))
+
+    def test_failed_update_leaves_entities_untouched(
+        self, notes: SQLiteEntityRepository[int, Note]
+    ) -> None:
+        notes.add_many([make_note(1), make_note(2)])
+        loaded, removed = notes.get(1), notes.get(2)
+        notes.remove(removed)
+        loaded.title = "changed"
+        removed.title = "gone"
+
+        with pytest.raises(LookupError, match=r"\[2\]"):
+            notes.update_many([loaded, removed])
+
+        assert loaded.updated_at == NOW
+        assert loaded.changed_fields() == {"title"}
+        assert notes.get(1).title == "note"
+
+    def test_skipped_update_reports_the_batch(
+        self, notes: SQLiteEntityRepository[int, Note], tmp_path: Path
+    ) -> None:
+        notes.add(make_note(1))
+        connection = sqlite3.connect(tmp_path / "notes.db")
+        connection.execute(
+            "CREATE TRIGGER skip BEFORE UPDATE ON note BEGIN SELECT RAISE(IGNORE); END"
+        )
+        connection.commit()
+        connection.close()
+        loaded = notes.get(1)
+        loaded.title = "changed"
+
+        with pytest.raises(ConcurrencyConflictError) as info:
+            notes.update(loaded)
+
+        assert info.value.entity_ids == (1,)
+        assert loaded.updated_at == NOW
+
+    def test_remove(self, notes: SQLiteEntityRepository[int, Note]) -> None:
+        notes.add(make_note(1))
+
+        notes.remove(make_note(1))
+
+        assert notes.get(1) is None
+        with pytest.raises(LookupError):
+            notes.remove(make_note(1))
+
+    def test_in_memory_database(self) -> None:
+        with SQLiteEntityRepository[int, Note](Note, ":memory:", pool_size=8) as repo:
+            repo.add(make_note(1))
+
+            assert repo.get(1) == make_note(1)
+
+
+# =========================================================
+# CLASS TEST SQLITE QUERIES
+# =========================================================
+class TestSQLiteQueries:
+    def test_list_all(self, contacts: SQLiteEntityRepository[int, Contact]) -> None:
+        assert sorted(contact.id for contact in contacts.list()) == [1, 2, 3]
+
+    def test_filters_and_order(self, contacts: SQLiteEntityRepository[int, Contact]) -> None:
+        query = SQLiteQuery(filters={"city": "london", "active": True}, order_by=("-score",))
+
+        found = contacts.list(query)
+
+        assert [contact.id for contact in found] == [1, 3]
+
+    def test_json_and_null_filters(self, contacts: SQLiteEntityRepository[int, Contact]) -> None:
+        by_metadata = contacts.list(SQLiteQuery(filters={"metadata": {"a": 1}}))
+        without_email = contacts.list(SQLiteQuery(filters={"email": None}, order_by=("id",)))
+
+        assert [contact.id for contact in by_metadata] == [3]
+        assert [contact.id for contact in contacts.list(SQLiteQuery(filters={"ref": "x"}))] == [3]
+        assert [contact.id for contact in without_email] == [2, 3]
+
+    def test_limit(self, contacts: SQLiteEntityRepository[int, Contact]) -> None:
+        found = contacts.list(SQLiteQuery(order_by=("name",), limit=2))
+
+        assert [contact.name for contact in found] == ["ada", "bob"]
+
+    def test_datetime_filter(self, contacts: SQLiteEntityRepository[int, Contact]) -> None:
+        assert len(contacts.list(SQLiteQuery(filters={"created_at": NOW}))) == 3
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            SQLiteQuery(filters={"missing": 1}),
+            SQLiteQuery(order_by=("-missing",)),
+            SQLiteQuery(filters={"bad name": 1}),
+        ],
+    )
+    def test_unknown_fields_fail(
+        self, contacts: SQLiteEntityRepository[int, Contact], query: SQLiteQuery
+    ) -> None:
+        with pytest.raises(ValueError):
+            contacts.list(query)
+
+    def test_index_hints_create_indexes(
+        self, contacts: SQLiteEntityRepository[int, Contact], tmp_path: Path
+    ) -> None:
+        connection = sqlite3.connect(tmp_path / "contacts.db")
+        names = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+        connection.close()
+
+        assert {"ix_contact_email", "ix_contact_city_name"} <= names
+
+    def test_unknown_index_hint_fails(self, tmp_path: Path) -> None:
+        # =========================================================
+        # CLASS BROKEN
+        # =========================================================
+        class Broken(Entity[int]):
+            index_hints: ClassVar = ("nope",)
+
+        with pytest.raises(ValueError):
+            SQLiteEntityRepository[int, Broken](Broken, tmp_path / "broken.db")
+
+
+# =========================================================
+# CLASS TEST SQLITE CONCURRENCY
+# =========================================================
+class TestSQLiteConcurrency:
+    def test_update_bumps_version(self, accounts: SQLiteEntityRepository[str, Account]) -> None:
+        account = accounts.get("a")
+        account.balance = 10
+
+        accounts.update(account)
+
+        assert account.version == 1
+        assert accounts.get("a").version == 1
+        assert accounts.get("a").balance == 10
+
+    def test_stale_update_conflicts(self, accounts: SQLiteEntityRepository[str, Account]) -> None:
+        first = accounts.get("a")
+        second = accounts.get("a")
+        first.balance = 1
+        accounts.update(first)
+        second.balance = 2
+
+        with pytest.raises(ConcurrencyConflictError) as info:
+            accounts.update(second)
+
+        assert info.value.entity_ids == ("a",)
+        assert accounts.get("a").balance == 1
+
+    def test_update_many_rolls_back_on_conflict(
+        self, accounts: SQLiteEntityRepository[str, Account]
+    ) -> None:
+        a = accounts.get("a")
+        b = accounts.get("b")
+        stale_b = accounts.get("b")
+        stale_b.balance = 5
+        accounts.update(stale_b)
+        a.balance = 1
+        b.balance = 2
+
+        with pytest.raises(ConcurrencyConflictError) as info:
+            accounts.update_many([a, b])
+
+        assert info.value.entity_ids == ("b",)
+        assert accounts.get("a").balance == 0
+        assert a.version == 0
+
+    def test_stale_remove_conflicts(self, accounts: SQLiteEntityRepository[str, Account]) -> None:
+        stale = accounts.get("a")
+        fresh = accounts.get("a")
+        fresh.balance = 1
+        accounts.update(fresh)
+
+        with pytest.raises(ConcurrencyConflictError):
+            accounts.remove(stale)
+
+        accounts.remove(fresh)
+        assert accounts.get("a") is None
+
+    def test_threads_share_the_pool(self, notes: SQLiteEntityRepository[int, Note]) -> None:
+        def worker(offset: int) -> None:
+            notes.add_many(make_note(offset * 100 + i) for i in range(50))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(notes.list()) == 400
+
+
+# =========================================================
+# CLASS TEST SQLITE UUID IDS
+# =========================================================
+class TestSQLiteUUIDIds:
+    def test_get_and_get_many(self, devices: SQLiteEntityRepository[uuid.UUID, Device]) -> None:
+        first, second = make_device("a"), make_device("b")
+        devices.add_many([first, second])
+
+        assert devices.get(first.id) == first
+        assert devices.get(uuid.uuid4()) is None
+        assert devices.get_many([first.id, second.id, uuid.uuid4()]) == {
+            first.id: first,
+            second.id: second,
+        }
+
+    def test_update_and_remove(self, devices: SQLiteEntityRepository[uuid.UUID, Device]) -> None:
+        device = make_device("a")
+        devices.add(device)
+        device.label = "b"
+
+        devices.update(device)
+
+        assert devices.get(device.id).label == "b"
+        assert devices.get(device.id).version == 1
+        devices.remove(device)
+        assert devices.get(device.id) is None
+
+    def test_stale_update_reports_uuid(
+        self, devices: SQLiteEntityRepository[uuid.UUID, Device]
+    ) -> None:
+        device = make_device("a")
+        devices.add(device)
+        stale = devices.get(device.id)
+        device.label = "b"
+        devices.update(device)
+        stale.label = "c"
+
+        with pytest.raises(ConcurrencyConflictError) as info:
+            devices.update(stale)
+
+        assert info.value.entity_ids == (device.id,)
+
+    def test_unversioned_entity(self, tmp_path: Path) -> None:
+        with SQLiteEntityRepository[uuid.UUID, Token](Token, tmp_path / "tokens.db") as tokens:
+            token = Token(id=uuid.uuid4(), scope="read", created_at=NOW, updated_at=NOW)
+            tokens.add(token)
+            token.scope = "write"
+            tokens.update(token)
+
+            assert tokens.get(token.id).scope == "write"
+            tokens.remove(token)
+            with pytest.raises(LookupError):
+                tokens.remove(token)
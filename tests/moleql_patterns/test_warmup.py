@@ -0,0 +1,133 @@
+# MIT License
+#
+# Copyright (c) 2026 Pedro Guzmán
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import importlib
+
+import pytest
+from pydantic import BaseModel
+
+import moleql_patterns
+from moleql_patterns import Entity, FrozenTaskData, TaskData, warmup
+
+from .structural._repository_shared import NOW
+
+
+def define_models() -> tuple[type[TaskData], type[TaskData], type[Entity[int]]]:
+    # =========================================================
+    # CLASS SEND EMAIL
+    # =========================================================
+    class SendEmail(TaskData):
+        to: str
+
+    # =========================================================
+    # CLASS URGENT EMAIL
+    # =========================================================
+    class UrgentEmail(SendEmail):
+        priority: int = 1
+
+    # =========================================================
+    # CLASS CUSTOMER
+    # =========================================================
+    class Customer(Entity[int]):
+        name: str
+
+    return SendEmail, UrgentEmail, Customer
+
+
+# =========================================================
+# CLASS TEST DEFERRED BUILD
+# =========================================================
+class TestDeferredBuild:
+    def test_subclasses_are_not_built_at_definition(self) -> None:
+        send_email, urgent_email, customer = define_models()
+
+        assert not send_email.__pydantic_complete__
+        assert not urgent_email.__pydantic_complete__
+        assert not customer.__pydantic_complete__
+
+    def test_first_validation_builds_the_schema(self) -> None:
+        send_email, _, customer = define_models()
+
+        task = send_email(correlation_id="c", to="ada@example.com")
+        entity = customer.model_validate(
+            {"id": 1, "name": "Ada", "created_at": NOW, "updated_at": NOW}
+        )
+
+        assert send_email.__pydantic_complete__
+        assert customer.__pydantic_complete__
+        assert send_email.from_payload(task.to_payload()) == task
+        assert entity.model_dump()["name"] == "Ada"
+
+    def test_deferred_models_still_validate(self) -> None:
+        # =========================================================
+        # CLASS CACHED
+        # =========================================================
+        class Cached(FrozenTaskData):
+            key: int
+
+        with pytest.raises(ValueError):
+            Cached(correlation_id="c", key="not a number")
+
+
+# =========================================================
+# CLASS TEST WARMUP
+# =========================================================
+class TestWarmup:
+    def test_builds_selected_models(self) -> None:
+        send_email, urgent_email, customer = define_models()
+
+        built = warmup(send_email, customer)
+
+        assert built == 2
+        assert send_email.__pydantic_complete__
+        assert customer.__pydantic_complete__
+        assert not urgent_email.__pydantic_complete__
+
+    def test_skips_built_models(self) -> None:
+        send_email, _, _ = define_models()
+        warmup(send_email)
+
+        assert warmup(send_email, send_email) == 0
+
+    def test_builds_subclasses(self) -> None:
+        send_email, urgent_email, _ = define_models()
+
+        built = warmup(send_email, subclasses=True)
+
+        assert built == 2
+        assert urgent_email.__pydantic_complete__
+
+    def test_skips_unparametrized_generics(self) -> None:
+        # =========================================================
+        # CLASS PAGE
+        # =========================================================
+        class Page[ItemT](BaseModel, defer_build=True):
+            items: list[ItemT]
+
+        assert warmup(Page) == 0
+        assert warmup(Page[int]) == 1
+
+    def test_export_survives_importing_the_module(self) -> None:
+        importlib.import_module("moleql_patterns._warmup")
+
+        assert callable(moleql_patterns.warmup)
+        assert moleql_patterns.warmup is warmup